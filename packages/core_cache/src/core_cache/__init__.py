@@ -1,4 +1,7 @@
+from .generation import current_generation, run_generation_reaper
 from .keys import evidence, bundle
-from .redis_cache import RedisCache
+from .l1 import LocalCache, get_local_cache
+from .redis_cache import CachePipeline, RedisCache
+from .singleflight import SingleFlight
 
-__all__ = ["evidence", "bundle", "RedisCache"]
\ No newline at end of file
+__all__ = ["current_generation", "run_generation_reaper", "evidence", "bundle", "LocalCache", "get_local_cache", "CachePipeline", "RedisCache", "SingleFlight"]
\ No newline at end of file
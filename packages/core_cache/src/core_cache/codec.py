@@ -0,0 +1,121 @@
+from __future__ import annotations
+import struct
+import time
+import zlib
+from typing import Any, Optional, Tuple
+
+from core_config import get_settings
+from core_metrics import counter as metric_counter, histogram as metric_histogram, histogram_ms as metric_histogram_ms
+
+try:  # optional, faster codec
+    import zstandard as _zstd  # type: ignore
+except ImportError:  # pragma: no cover - zlib fallback
+    _zstd = None  # type: ignore
+
+# ------------------------------
+# Value framing for RedisCache
+# ------------------------------
+# Values at or above CACHE_COMPRESS_MIN_BYTES are stored as
+#   MAGIC (3 bytes) | flags+codec id (1 byte) | [meta (12 bytes)] | payload
+# Smaller values without meta are stored verbatim, exactly as before, so
+# redis-cli and older readers still see plain JSON. JSON never starts with
+# NUL, so a framed value cannot be mistaken for a plain one.
+# Meta (flag 0x80) carries what early refresh needs: the recompute cost and
+# the absolute expiry, both in ms (``RedisCache.get_or_compute``).
+
+MAGIC = b"\x00bv"
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+_FLAG_META = 0x80
+_META = struct.Struct(">IQ")  # (compute_ms, expires_at_ms)
+_HEADER_LEN = len(MAGIC) + 1
+
+class CodecError(ValueError):
+    """A framed value could not be decoded (unknown codec or corrupt payload)."""
+
+def _codec_for(name: str) -> Optional[int]:
+    name = (name or "auto").lower()
+    if name in ("none", "off", "0", "false"):
+        return None
+    if name == "zstd" or (name == "auto" and _zstd is not None):
+        return CODEC_ZSTD if _zstd is not None else CODEC_ZLIB
+    return CODEC_ZLIB
+
+def _compress(codec: int, raw: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return _zstd.ZstdCompressor(level=1).compress(raw)
+    return zlib.compress(raw, 1)
+
+def _decompress(codec: int, payload: bytes) -> bytes:
+    if codec == CODEC_NONE:
+        return payload
+    try:
+        if codec == CODEC_ZSTD:
+            if _zstd is None:
+                raise CodecError("zstd value but zstandard is not installed")
+            return _zstd.ZstdDecompressor().decompress(payload)
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(payload)
+    except (zlib.error, _zstd.ZstdError if _zstd is not None else zlib.error) as exc:
+        raise CodecError(str(exc)) from exc
+    raise CodecError(f"unknown codec {codec}")
+
+def is_framed(blob: Any) -> bool:
+    return isinstance(blob, (bytes, bytearray)) and bytes(blob[:len(MAGIC)]) == MAGIC
+
+def _frame(codec: int, payload: bytes, meta: Optional[Tuple[int, int]]) -> bytes:
+    if meta is None:
+        return MAGIC + bytes((codec,)) + payload
+    return MAGIC + bytes((codec | _FLAG_META,)) + _META.pack(*meta) + payload
+
+def encode_value(raw: bytes, *, namespace: str = "", meta: Optional[Tuple[int, int]] = None) -> bytes:
+    """
+    Frame + compress *raw* when it is large enough; otherwise return it
+    unchanged (or framed uncompressed when *meta* ``(compute_ms, expires_at_ms)``
+    has to be carried).
+    """
+    s = get_settings()
+    min_bytes = int(getattr(s, "cache_compress_min_bytes", 1024))
+    codec = _codec_for(str(getattr(s, "cache_compress_codec", "auto")))
+    if meta is not None:
+        meta = (max(0, min(int(meta[0]), 0xFFFFFFFF)), max(0, int(meta[1])))
+    if codec is None or min_bytes <= 0 or len(raw) < min_bytes:
+        return raw if meta is None else _frame(CODEC_NONE, raw, meta)
+    t0 = time.perf_counter()
+    packed = _compress(codec, raw)
+    metric_histogram_ms("cache_compress_cpu_ms", (time.perf_counter() - t0) * 1000.0,
+                        op="compress", namespace=namespace)
+    if len(packed) + _HEADER_LEN >= len(raw):
+        # Incompressible: the plain value is smaller.
+        metric_counter("cache_compress_skipped_total", 1, namespace=namespace)
+        return raw if meta is None else _frame(CODEC_NONE, raw, meta)
+    metric_histogram("cache_compress_ratio", len(raw) / max(1, len(packed) + _HEADER_LEN), namespace=namespace)
+    metric_counter("cache_compress_raw_bytes_total", len(raw), namespace=namespace)
+    metric_counter("cache_compress_stored_bytes_total", len(packed) + _HEADER_LEN, namespace=namespace)
+    return _frame(codec, packed, meta)
+
+def decode_value_meta(blob: Any, *, namespace: str = "") -> Tuple[Any, Optional[Tuple[int, int]]]:
+    """Return ``(value, meta)``; plain (legacy or small) values pass through with no meta."""
+    if not is_framed(blob):
+        return blob, None
+    flags = blob[len(MAGIC)]
+    body = bytes(blob[_HEADER_LEN:])
+    meta: Optional[Tuple[int, int]] = None
+    if flags & _FLAG_META:
+        if len(body) < _META.size:
+            raise CodecError("truncated meta")
+        meta = _META.unpack_from(body)
+        body = body[_META.size:]
+    codec = flags & ~_FLAG_META
+    if codec == CODEC_NONE:
+        return body, meta
+    t0 = time.perf_counter()
+    raw = _decompress(codec, body)
+    metric_histogram_ms("cache_compress_cpu_ms", (time.perf_counter() - t0) * 1000.0,
+                        op="decompress", namespace=namespace)
+    return raw, meta
+
+def decode_value(blob: Any, *, namespace: str = "") -> Any:
+    """Inverse of ``encode_value``; plain (legacy or small) values pass through."""
+    return decode_value_meta(blob, namespace=namespace)[0]
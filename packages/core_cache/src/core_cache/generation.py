@@ -0,0 +1,202 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+from core_config import get_settings
+from core_logging import get_logger, log_stage
+from core_metrics import counter as metric_counter, gauge as metric_gauge, histogram_ms as metric_histogram_ms
+
+from .singleflight import release_lease, try_acquire_lease
+
+_logger = get_logger("core_cache.generation")
+
+# ------------------------------
+# Snapshot generations
+# ------------------------------
+# Every snapshot-scoped key built in ``keys.py`` carries the cache generation
+# right after its namespace (``bv:gw:v1:bundle:g7:...``). Ingest runs
+# BUMP_GENERATION_LUA when it publishes a snapshot etag
+# (``core_storage.snapshot_cache.publish_snapshot_etag``): GENERATION_KEY is
+# INCRed only when the etag differs from the last published one, so
+# re-publishing the same snapshot (one ingest run publishes more than once)
+# never retires a valid working set. Readers pick the new value up from the
+# push, or from a poll every CACHE_REAPER_INTERVAL_SEC.
+# Keys still embed the snapshot etag, so a process that has not seen the bump
+# yet only writes under the previous generation; it never serves stale data.
+#
+# ``run_generation_reaper`` then deletes generations older than
+# ``current - CACHE_GENERATION_KEEP`` with SCAN + UNLINK in bounded batches,
+# so Redis drops back to the working set soon after a flip instead of holding
+# two snapshots' worth of entries until the longest TTL runs out. One process
+# per cluster reaps (Redis lease); the others skip.
+
+GENERATION_KEY = "bv:cache:v1:gen"
+GENERATION_ETAG_KEY = "bv:cache:v1:gen:etag"
+_REAPED_KEY = "bv:cache:v1:reaped"
+_REAPER_LEASE_KEY = "bv:cache:v1:reaper:lease"
+# Namespaces whose keys carry a generation segment.
+GENERATION_NAMESPACES = ("bv:gw:v1", "bv:mem:v1")
+
+# KEYS: GENERATION_KEY, GENERATION_ETAG_KEY   ARGV: etag, channel
+# Compare-and-set of the last published etag + INCR on change, then PUBLISH,
+# atomically. Returns {generation, changed}.
+BUMP_GENERATION_LUA = (
+    "local changed = 0 "
+    "if redis.call('get', KEYS[2]) ~= ARGV[1] then "
+    "redis.call('set', KEYS[2], ARGV[1]) "
+    "redis.call('incr', KEYS[1]) "
+    "changed = 1 end "
+    "redis.call('publish', ARGV[2], ARGV[1]) "
+    "return {tonumber(redis.call('get', KEYS[1]) or '0'), changed}"
+)
+
+_generation = 0
+_gen_lock = threading.Lock()
+
+def current_generation() -> int:
+    """Last cache generation this process has seen (0 until the first read)."""
+    return _generation
+
+def note_generation(gen: Any, *, source: str = "poll") -> bool:
+    """Adopt *gen* when it is newer than the current one; returns True on change."""
+    global _generation
+    try:
+        gen = int(gen)
+    except (TypeError, ValueError):
+        return False
+    with _gen_lock:
+        if gen <= _generation:
+            return False
+        previous, _generation = _generation, gen
+    metric_gauge("cache_generation", gen)
+    metric_counter("cache_generation_update_total", 1, source=source)
+    log_stage(_logger, "cache", "cache_generation_changed",
+              generation=gen, previous=previous, source=source, request_id="snapshot")
+    return True
+
+def generation_of(key: Any) -> Optional[int]:
+    """Generation embedded in *key*, or None for an unversioned (pre-generation) key."""
+    if isinstance(key, (bytes, bytearray)):
+        key = bytes(key).decode("utf-8", "replace")
+    parts = str(key).split(":", 5)
+    if len(parts) < 5:
+        return None
+    seg = parts[4]
+    if len(seg) > 1 and seg[0] == "g" and seg[1:].isdigit():
+        return int(seg[1:])
+    return None
+
+async def reap_superseded(
+    client: Any,
+    cutoff: int,
+    *,
+    batch: int = 500,
+    pause_ms: int = 10,
+) -> int:
+    """
+    UNLINK every generation-namespaced key older than *cutoff* (unversioned
+    keys count as generation 0). SCAN visits at most *batch* keys per call and
+    sleeps *pause_ms* between calls so the sweep never monopolises Redis.
+    Returns the number of keys deleted.
+    """
+    if cutoff <= 0:
+        return 0
+    t0 = time.perf_counter()
+    scanned = deleted = 0
+    for ns in GENERATION_NAMESPACES:
+        cursor: Any = 0
+        while True:
+            cursor, found = await client.scan(cursor=cursor, match=f"{ns}:*", count=max(1, int(batch)))
+            scanned += len(found)
+            stale = [k for k in found if (generation_of(k) or 0) < cutoff]
+            if stale:
+                deleted += int(await client.unlink(*stale) or 0)
+            if not int(cursor):
+                break
+            await asyncio.sleep(max(0, int(pause_ms)) / 1000.0)
+    metric_counter("cache_reaper_scanned_total", scanned)
+    metric_counter("cache_reaper_deleted_total", deleted)
+    metric_histogram_ms("cache_reaper_run_ms", (time.perf_counter() - t0) * 1000.0)
+    log_stage(_logger, "cache", "cache_generation_reaped",
+              cutoff=cutoff, scanned=scanned, deleted=deleted, request_id="reaper")
+    return deleted
+
+async def refresh_generation(client: Any, *, source: str = "poll") -> int:
+    """Read GENERATION_KEY from Redis and adopt it; returns the current generation."""
+    raw = await client.get(GENERATION_KEY)
+    if raw is not None:
+        note_generation(raw.decode() if isinstance(raw, (bytes, bytearray)) else raw, source=source)
+    return current_generation()
+
+async def _reap_once(client: Any) -> None:
+    s = get_settings()
+    cutoff = current_generation() - max(0, int(getattr(s, "cache_generation_keep", 1)))
+    if cutoff <= 0:
+        return
+    done = await client.get(_REAPED_KEY)
+    if done is not None and int(done) >= cutoff:
+        return
+    interval_s = int(getattr(s, "cache_reaper_interval_sec", 60))
+    token = await try_acquire_lease(client, _REAPER_LEASE_KEY, max(60_000, interval_s * 2000))
+    if token is None:
+        return  # a peer is sweeping
+    try:
+        await reap_superseded(
+            client, cutoff,
+            batch=int(getattr(s, "cache_reaper_batch", 500)),
+            pause_ms=int(getattr(s, "cache_reaper_pause_ms", 10)),
+        )
+        await client.set(_REAPED_KEY, cutoff)
+    finally:
+        await release_lease(client, _REAPER_LEASE_KEY, token)
+
+async def run_generation_reaper() -> None:
+    """
+    Track the cache generation (snapshot pushes + polling) and reap superseded
+    generations after every bump. Reconnects with capped backoff until cancelled.
+    """
+    from .redis_client import get_redis_pool
+
+    s = get_settings()
+    channel = str(getattr(s, "snapshot_etag_channel", "bv:snapshot:v1:etag"))
+    interval_s = max(1, int(getattr(s, "cache_reaper_interval_sec", 60)))
+    reap_enabled = bool(getattr(s, "cache_reaper_enable", True))
+    attempt = 0
+    while True:
+        pubsub = None
+        try:
+            client = get_redis_pool(binary=True)
+            if client is None:
+                raise RuntimeError("redis_unavailable")
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(channel)
+            attempt = 0
+            log_stage(_logger, "cache", "cache_generation_subscribed",
+                      channel=channel, request_id="startup")
+            source, last_sync = "startup", 0.0
+            while True:
+                if source or (time.monotonic() - last_sync) >= interval_s:
+                    await refresh_generation(client, source=source or "poll")
+                    last_sync, source = time.monotonic(), ""
+                    if reap_enabled:
+                        await _reap_once(client)
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if msg and msg.get("type") == "message":
+                    # The etag push follows any INCR in the same script.
+                    source = "push"
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # the reaper must outlive Redis outages
+            attempt += 1
+            if attempt == 1:
+                log_stage(_logger, "cache", "cache_generation_reaper_degraded",
+                          error=type(exc).__name__, channel=channel, request_id="reaper")
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+        await asyncio.sleep(min(1.0 * attempt, 30.0))
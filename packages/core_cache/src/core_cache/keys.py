@@ -1,6 +1,8 @@
 from __future__ import annotations
 from hashlib import blake2s
 
+from .generation import current_generation
+
 def _s(x: object | None) -> str:
     return "" if x is None else str(x)
 
@@ -15,6 +17,14 @@ def _fp(*parts: object) -> str:
         h.update(b"|")
     return h.hexdigest()
 
+def _g() -> str:
+    """
+    Generation segment that follows the namespace (see ``generation``). It lets
+    the reaper drop a superseded snapshot's entries by prefix; correctness still
+    rests on the etag embedded below.
+    """
+    return f"g{current_generation()}"
+
 # ------------------------------
 # Gateway keys (hard namespaced)
 # ------------------------------
@@ -24,7 +34,7 @@ def gw_evidence(snapshot_etag: str | None,
                 allowed_ids_fp: str | None,
                 policy_fp: str | None) -> str:
     """Gateway evidence cache key (namespaced)."""
-    return f"{_NS_GW}:evidence:{_s(snapshot_etag)}|{_s(allowed_ids_fp)}|{_s(policy_fp)}"
+    return f"{_NS_GW}:evidence:{_g()}:{_s(snapshot_etag)}|{_s(allowed_ids_fp)}|{_s(policy_fp)}"
 
 def evidence(snapshot_etag: str | None,
              allowed_ids_fp: str | None,
@@ -35,9 +45,19 @@ def evidence(snapshot_etag: str | None,
     """
     return gw_evidence(snapshot_etag, allowed_ids_fp, policy_fp)
 
+def gw_evidence_index(anchor_id: str | None,
+                      snapshot_etag: str | None,
+                      request_policy_fp: str | None) -> str:
+    """
+    Anchor-level pointer to an evidence key. Lets the gateway find cached
+    evidence from (anchor, snapshot, request policy headers) before Memory has
+    told it the allowed_ids_fp/policy_fp that the evidence key embeds.
+    """
+    return f"{_NS_GW}:evidence_idx:{_g()}:{_fp(anchor_id, snapshot_etag, request_policy_fp)}"
+
 def gw_bundle(bundle_fp: str | None) -> str:
     """Gateway bundle cache key (namespaced)."""
-    return f"{_NS_GW}:bundle:{_s(bundle_fp)}"
+    return f"{_NS_GW}:bundle:{_g()}:{_s(bundle_fp)}"
 
 def bundle(bundle_fp: str | None) -> str:
     """
@@ -58,7 +78,7 @@ def mem_resolve(snapshot_etag: str | None,
     Memory resolve cache key (for /api/resolve/text).
     Namespaced to prevent any collision with Gateway caches.
     """
-    return f"{_NS_MEM}:resolve:{_fp(snapshot_etag, policy_fp, query_str)}"
+    return f"{_NS_MEM}:resolve:{_g()}:{_fp(snapshot_etag, policy_fp, query_str)}"
 
 def mem_expand_candidates(snapshot_etag: str | None,
                           policy_fp: str | None,
@@ -66,7 +86,23 @@ def mem_expand_candidates(snapshot_etag: str | None,
     """
     Memory expand cache key (for /api/graph/expand_candidates) — only if/when enabled.
     """
-    return f"{_NS_MEM}:expand:{_fp(snapshot_etag, policy_fp, anchor_id)}"
+    return f"{_NS_MEM}:expand:{_g()}:{_fp(snapshot_etag, policy_fp, anchor_id)}"
+
+def mem_enrich(snapshot_etag: str | None,
+               policy_fp: str | None,
+               anchor_id: str | None) -> str:
+    """
+    Memory enrich key (for /api/enrich) — used to coalesce concurrent misses.
+    """
+    return f"{_NS_MEM}:enrich:{_g()}:{_fp(snapshot_etag, policy_fp, anchor_id)}"
+
+def mem_evidence(snapshot_etag: str | None,
+                 policy_fp: str | None,
+                 anchor_id: str | None) -> str:
+    """
+    Memory fused evidence key (for /api/evidence: enriched anchor + graph view).
+    """
+    return f"{_NS_MEM}:evidence:{_g()}:{_fp(snapshot_etag, policy_fp, anchor_id)}"
 
 def mem_masked(snapshot_etag: str | None,
                policy_fp: str | None,
@@ -76,4 +112,4 @@ def mem_masked(snapshot_etag: str | None,
     """
     Memory masked-view cache key (if used).
     """
-    return f"{_NS_MEM}:masked:{_fp(snapshot_etag, policy_fp, anchor_id, alias_on, alias_hops)}"
\ No newline at end of file
+    return f"{_NS_MEM}:masked:{_g()}:{_fp(snapshot_etag, policy_fp, anchor_id, alias_on, alias_hops)}"
\ No newline at end of file
@@ -0,0 +1,152 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core_config import get_settings
+from core_logging import get_logger, log_stage
+
+_logger = get_logger("core_cache.l1")
+
+# ------------------------------
+# In-process L1 tier
+# ------------------------------
+
+def namespace_of(key: str) -> str:
+    """
+    Cache namespace of a key built in ``keys.py``: the first four segments
+    (``bv:gw:v1:evidence:...`` → ``bv:gw:v1:evidence``).
+    """
+    parts = str(key).split(":", 4)
+    return ":".join(parts[:4]) if len(parts) >= 4 else str(key)
+
+def parse_ttl_caps(spec: str | None) -> Dict[str, int]:
+    """``"bv:gw:v1=60,bv:gw:v1:evidence_idx=5"`` → ``{prefix: seconds}`` (bad items skipped)."""
+    caps: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        prefix, sep, ttl = item.strip().partition("=")
+        if not sep or not prefix.strip():
+            continue
+        try:
+            caps[prefix.strip()] = max(0, int(ttl.strip()))
+        except ValueError:
+            continue
+    return caps
+
+def _size_of(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return len(str(value))
+
+class LocalCache:
+    """
+    Process-local LRU in front of Redis.
+
+    Bounded by entry count and by total value size; the least recently used
+    entries are evicted first. Every entry expires after
+    ``min(ttl, cap(namespace))`` where caps are matched by longest key prefix.
+    Keys from ``keys.py`` embed the snapshot etag and policy fingerprint, so a
+    stale L1 entry can only ever be an older copy of identical content; no
+    cross-process invalidation is needed.
+    """
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        max_entries: int,
+        default_ttl_cap_s: int = 30,
+        ttl_caps: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self._max_bytes = max(1, int(max_bytes))
+        self._max_entries = max(1, int(max_entries))
+        self._default_cap = max(0, int(default_ttl_cap_s))
+        # Longest prefix first so the most specific cap wins.
+        self._caps = sorted((ttl_caps or {}).items(), key=lambda kv: -len(kv[0]))
+        self._data: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def ttl_cap(self, key: str) -> int:
+        for prefix, cap in self._caps:
+            if key.startswith(prefix):
+                return cap
+        return self._default_cap
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires_at, size, value = hit
+            if expires_at <= now:
+                del self._data[key]
+                self._bytes -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """Store *value*; returns False when it is not cacheable (TTL 0 or too large)."""
+        ttl = min(float(ttl_seconds), float(self.ttl_cap(key)))
+        size = _size_of(value)
+        if ttl <= 0 or size > self._max_bytes:
+            self.delete(key)
+            return False
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (expires_at, size, value)
+            self._bytes += size
+            while self._bytes > self._max_bytes or len(self._data) > self._max_entries:
+                _, (_, ev_size, _) = self._data.popitem(last=False)
+                self._bytes -= ev_size
+                self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+_l1: Optional[LocalCache] = None
+_l1_init = False
+_l1_lock = threading.Lock()
+
+def get_local_cache() -> Optional[LocalCache]:
+    """Shared process-wide L1, or None unless ``CACHE_L1_ENABLE`` is set."""
+    global _l1, _l1_init
+    if _l1_init:
+        return _l1
+    with _l1_lock:
+        if not _l1_init:
+            s = get_settings()
+            if bool(getattr(s, "cache_l1_enable", False)):
+                _l1 = LocalCache(
+                    max_bytes=int(getattr(s, "cache_l1_max_bytes", 64 * 1024 * 1024)),
+                    max_entries=int(getattr(s, "cache_l1_max_entries", 4096)),
+                    default_ttl_cap_s=int(getattr(s, "cache_l1_ttl_cap_sec", 30)),
+                    ttl_caps=parse_ttl_caps(getattr(s, "cache_l1_ttl_caps", "")),
+                )
+                log_stage(_logger, "cache", "l1_enabled",
+                          max_bytes=_l1._max_bytes, max_entries=_l1._max_entries,
+                          request_id="startup")
+            _l1_init = True
+    return _l1
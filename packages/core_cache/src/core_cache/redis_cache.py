@@ -1,22 +1,351 @@
 from __future__ import annotations
-from typing import Any, Optional
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core_config import get_settings
+from core_metrics import counter as metric_counter, gauge as metric_gauge
+from redis.exceptions import RedisError
+
+from .codec import CodecError, decode_value, decode_value_meta, encode_value
+from .l1 import LocalCache, get_local_cache, namespace_of
+from .roundtrips import note_round_trip
+from .singleflight import RELEASE_LEASE_LUA, SingleFlight, lease_key, try_acquire_lease, wait_for_value
+
+_DEFAULT_L1: Any = object()
+
+# Per-tier lookup tallies for this process (hit ratio gauges + tier_stats()).
+_TIER_STATS: Dict[str, Dict[str, int]] = {
+    "l1": {"hit": 0, "miss": 0},
+    "redis": {"hit": 0, "miss": 0},
+}
+
+def _record(tier: str, hit: bool, namespace: str) -> None:
+    st = _TIER_STATS[tier]
+    st["hit" if hit else "miss"] += 1
+    metric_counter("cache_hit_total" if hit else "cache_miss_total", 1,
+                   service="core_cache", tier=tier, namespace=namespace)
+    total = st["hit"] + st["miss"]
+    metric_gauge(f"cache_{tier}_hit_ratio", st["hit"] / total)
+
+def _as_bytes(value: Any) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    raise TypeError("RedisCache.setex expects bytes or str")
+
+_GET_OR_COMPUTE_FLIGHT = SingleFlight()
+
+# What a best-effort Redis call may raise: redis-py's own ConnectionError and
+# TimeoutError derive from RedisError, not from the builtins.
+_REDIS_ERRORS = (RedisError, OSError, RuntimeError, ValueError, TypeError)
+
+def _decode(key: str, blob: Any) -> Optional[Any]:
+    return _decode_meta(key, blob)[0]
+
+def _decode_meta(key: str, blob: Any) -> Tuple[Optional[Any], Optional[Tuple[int, int]]]:
+    try:
+        return decode_value_meta(blob, namespace=namespace_of(key))
+    except CodecError:
+        metric_counter("cache_decode_error_total", 1, namespace=namespace_of(key))
+        return None, None
+
+def _refresh_early(meta: Optional[Tuple[int, int]], beta: float) -> bool:
+    """
+    Probabilistic early expiration (XFetch): refresh when
+    ``now - compute_ms * beta * ln(U) >= expires_at``. The closer to expiry and
+    the costlier the recompute, the likelier one reader volunteers early.
+    """
+    if meta is None or beta <= 0:
+        return False
+    compute_ms, expires_at_ms = meta
+    u = 1.0 - random.random()  # (0, 1]
+    return time.time() * 1000.0 - compute_ms * beta * math.log(u) >= expires_at_ms
+
+def tier_stats() -> Dict[str, Dict[str, float]]:
+    """Process-local hits/misses/hit_ratio per tier (``l1`` and ``redis``)."""
+    out: Dict[str, Dict[str, float]] = {}
+    for tier, st in _TIER_STATS.items():
+        total = st["hit"] + st["miss"]
+        out[tier] = {**st, "hit_ratio": (st["hit"] / total) if total else 0.0}
+    return out
 
 class RedisCache:
     """
     Thin async wrapper over a provided redis.asyncio client.
     No retries here; callers own policies and timeouts.
+
+    Reads and writes go through the process-local L1 tier first when it is
+    enabled (``CACHE_L1_ENABLE``); pass ``l1=None`` to bypass it.
+
+    Values of CACHE_COMPRESS_MIN_BYTES or more are stored compressed behind a
+    small header (see ``codec``), so the client must not decode responses:
+    use ``get_redis_pool(binary=True)``. Plain entries written before
+    compression existed are still read as is. L1 holds decompressed values.
     """
-    def __init__(self, client: Any):
+    def __init__(self, client: Any, *, l1: Optional[LocalCache] = _DEFAULT_L1):
         if client is None:
             raise ValueError("RedisCache requires a valid redis client")
         self._r = client
+        self._l1 = get_local_cache() if l1 is _DEFAULT_L1 else l1
+
+    async def lookup(self, key: str) -> Tuple[Optional[Any], str]:
+        """Return ``(value, tier)`` where tier is ``"l1"``, ``"redis"`` or ``"miss"``."""
+        ns = namespace_of(key)
+        if self._l1 is not None:
+            val = self._l1.get(key)
+            _record("l1", val is not None, ns)
+            if val is not None:
+                return val, "l1"
+        val = await self._r.get(key)
+        note_round_trip(1, op="get")
+        val = _decode(key, val) if val else None
+        _record("redis", bool(val), ns)
+        if not val:
+            return None, "miss"
+        if self._l1 is not None:
+            # Remaining Redis TTL is unknown here; the namespace cap bounds staleness.
+            self._l1.set(key, val, self._l1.ttl_cap(key))
+            self._l1_gauges()
+        return val, "redis"
+
+    async def lookup_many(self, keys: Sequence[str]) -> List[Tuple[Optional[Any], str]]:
+        """``lookup`` for several keys: L1 first, then one MGET for the rest."""
+        out: List[Tuple[Optional[Any], str]] = [(None, "miss")] * len(keys)
+        pending: List[int] = []
+        for i, key in enumerate(keys):
+            val = self._l1.get(key) if self._l1 is not None else None
+            if self._l1 is not None:
+                _record("l1", val is not None, namespace_of(key))
+            if val is not None:
+                out[i] = (val, "l1")
+            else:
+                pending.append(i)
+        if not pending:
+            return out
+        vals = await self._r.mget([keys[i] for i in pending])
+        note_round_trip(len(pending), op="mget")
+        for i, val in zip(pending, vals or []):
+            val = _decode(keys[i], val) if val else None
+            _record("redis", bool(val), namespace_of(keys[i]))
+            if val:
+                out[i] = (val, "redis")
+                if self._l1 is not None:
+                    self._l1.set(keys[i], val, self._l1.ttl_cap(keys[i]))
+        if self._l1 is not None:
+            self._l1_gauges()
+        return out
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        return [val for val, _ in await self.lookup_many(keys)]
 
     async def get(self, key: str) -> Optional[bytes]:
-        return await self._r.get(key)
+        val, _ = await self.lookup(key)
+        return val
 
     async def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
-        if isinstance(value, str):
-            value = value.encode("utf-8")
-        elif not isinstance(value, (bytes, bytearray)):
-            raise TypeError("RedisCache.setex expects bytes or str")
-        await self._r.setex(key, ttl_seconds, value)
\ No newline at end of file
+        value = _as_bytes(value)
+        await self._r.setex(key, ttl_seconds, encode_value(value, namespace=namespace_of(key)))
+        note_round_trip(1, op="setex")
+        if self._l1 is not None:
+            self._l1.set(key, value, ttl_seconds)
+            self._l1_gauges()
+
+    async def setex_many(self, items: Iterable[Tuple[str, int, bytes]]) -> None:
+        """SETEX each ``(key, ttl_seconds, value)`` in one pipelined round trip."""
+        async with self.pipeline() as pipe:
+            for key, ttl_seconds, value in items:
+                pipe.setex(key, ttl_seconds, value)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl_seconds: int,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        lease_ms: int = 0,
+        wait_ms: int = 0,
+        beta: Optional[float] = None,
+        store: bool = True,
+        side_entries: Optional[List[Tuple[str, int, Any]]] = None,
+    ) -> Tuple[Any, str]:
+        """
+        Cached value for *key*, computing it at most once across callers.
+
+          • in-process: concurrent callers share one computation (single-flight);
+          • cross-process: with ``lease_ms`` > 0 a miss first takes a Redis lease;
+            losers wait up to ``wait_ms`` for the winner's value, then compute;
+          • early refresh: values written here carry their compute cost and
+            expiry, and a reader may recompute before expiry (XFetch, ``beta``
+            defaults to CACHE_XFETCH_BETA; 0 disables). Only the reader that wins
+            the lease refreshes; everybody else keeps serving the current value.
+
+        Returns ``(value, source)`` with source one of ``l1``, ``redis``,
+        ``computed``, ``refreshed``, ``peer`` or ``coalesced``. With
+        ``store=False`` nothing is written. Entries *compute* appends to
+        ``side_entries`` are written in the same round trip as the value.
+        Redis errors never reach the caller: a failed read computes locally
+        without writing back, a failed lease or write is skipped.
+        """
+        ns = namespace_of(key)
+        if beta is None:
+            beta = float(getattr(get_settings(), "cache_xfetch_beta", 1.0))
+
+        async def _compute(token: Optional[str], reason: str) -> Any:
+            metric_counter("cache_recompute_total", 1, namespace=ns, reason=reason)
+            t0 = time.perf_counter()
+            try:
+                value = await compute()
+            except BaseException:
+                if token:
+                    await _release(token)
+                raise
+            compute_ms = int((time.perf_counter() - t0) * 1000)
+            if not store or value is None:
+                if token:
+                    await _release(token)
+                return value
+            raw = _as_bytes(value)
+            blob = encode_value(raw, namespace=ns,
+                                meta=(compute_ms, int(time.time() * 1000) + int(ttl_seconds) * 1000))
+            try:
+                async with self.pipeline() as pipe:
+                    pipe._queue_encoded(key, int(ttl_seconds), blob, raw)
+                    for k, ttl, v in (side_entries or []):
+                        pipe.setex(k, int(ttl), v)
+                    if token:
+                        pipe.eval(RELEASE_LEASE_LUA, 1, lease_key(key), token)
+            except _REDIS_ERRORS:
+                # Best-effort write; the computed value is still returned.
+                metric_counter("cache_store_error_total", 1, namespace=ns)
+            return raw
+
+        async def _release(token: str) -> None:
+            try:
+                await self._r.eval(RELEASE_LEASE_LUA, 1, lease_key(key), token)
+                note_round_trip(1, op="lease")
+            except _REDIS_ERRORS:
+                pass
+
+        async def _lease(ttl_ms: int) -> Optional[str]:
+            try:
+                return await try_acquire_lease(self._r, lease_key(key), ttl_ms)
+            except _REDIS_ERRORS:
+                metric_counter("cache_redis_error_total", 1, namespace=ns, op="lease")
+                return None
+
+        async def _run() -> Tuple[Any, str]:
+            if self._l1 is not None:
+                val = self._l1.get(key)
+                _record("l1", val is not None, ns)
+                if val is not None:
+                    return val, "l1"
+            try:
+                blob = await self._r.get(key)
+            except _REDIS_ERRORS:
+                # Redis is unavailable: compute locally, skip lease and write-back.
+                metric_counter("cache_redis_error_total", 1, namespace=ns, op="get")
+                metric_counter("cache_recompute_total", 1, namespace=ns, reason="redis_error")
+                value = await compute()
+                return (_as_bytes(value) if value is not None else None), "computed"
+            note_round_trip(1, op="get")
+            val, meta = _decode_meta(key, blob) if blob else (None, None)
+            _record("redis", bool(val), ns)
+            if val:
+                if self._l1 is not None:
+                    self._l1.set(key, val, self._l1.ttl_cap(key))
+                if not _refresh_early(meta, beta):
+                    return val, "redis"
+                token = await _lease(lease_ms or max(1000, 4 * int(meta[0] if meta else 0)))
+                if token is None:
+                    return val, "redis"
+                return await _compute(token, "early"), "refreshed"
+            token = None
+            if lease_ms > 0:
+                try:
+                    token = await try_acquire_lease(self._r, lease_key(key), lease_ms)
+                except _REDIS_ERRORS:
+                    # No lease available; compute without coordination.
+                    metric_counter("cache_redis_error_total", 1, namespace=ns, op="lease")
+                    return await _compute(None, "miss"), "computed"
+                if token is None:
+                    peer = await wait_for_value(self._r, key, wait_ms=wait_ms,
+                                                decode=lambda b: decode_value(b, namespace=ns))
+                    if peer:
+                        metric_counter("cache_recompute_avoided_total", 1, namespace=ns, reason="peer")
+                        return peer, "peer"
+                    metric_counter("cache_lease_wait_timeout_total", 1, namespace=ns)
+            return await _compute(token, "miss"), "computed"
+
+        result, shared = await _GET_OR_COMPUTE_FLIGHT.do(key, _run)
+        if shared:
+            metric_counter("cache_recompute_avoided_total", 1, namespace=ns, reason="coalesced")
+            return result[0], "coalesced"
+        return result
+
+    def pipeline(self) -> "CachePipeline":
+        """
+        ``async with cache.pipeline() as pipe: ...`` — queue commands, sent as one
+        round trip on exit (non-transactional); replies land in ``pipe.results``.
+        ``setex`` compresses and fills L1 like ``RedisCache.setex``; other commands
+        are passed through to Redis as is (raw replies in ``results``).
+        """
+        return CachePipeline(self)
+
+    def _l1_gauges(self) -> None:
+        assert self._l1 is not None
+        metric_gauge("cache_l1_bytes", self._l1.bytes)
+        metric_gauge("cache_l1_entries", len(self._l1))
+
+class CachePipeline:
+    """Batch of Redis commands for one round trip (see ``RedisCache.pipeline``)."""
+    def __init__(self, cache: RedisCache) -> None:
+        self._cache = cache
+        self._pipe: Any = None
+        self._l1_writes: List[Tuple[str, int, bytes]] = []
+        self._keys = 0
+        self.results: List[Any] = []
+
+    async def __aenter__(self) -> "CachePipeline":
+        self._pipe = self._cache._r.pipeline(transaction=False)
+        return self
+
+    def setex(self, key: str, ttl_seconds: int, value: bytes) -> "CachePipeline":
+        value = _as_bytes(value)
+        return self._queue_encoded(key, ttl_seconds, encode_value(value, namespace=namespace_of(key)), value)
+
+    def _queue_encoded(self, key: str, ttl_seconds: int, blob: bytes, raw: bytes) -> "CachePipeline":
+        self._pipe.setex(key, ttl_seconds, blob)
+        self._l1_writes.append((key, ttl_seconds, raw))
+        self._keys += 1
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # Any other redis command (get, eval, delete, ...) is queued verbatim.
+        cmd = getattr(self._pipe, name)
+        def _queue(*args: Any, **kwargs: Any) -> "CachePipeline":
+            cmd(*args, **kwargs)
+            self._keys += 1
+            return self
+        return _queue
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pipe, self._pipe = self._pipe, None
+        try:
+            if exc_type is not None or not self._keys:
+                return
+            self.results = list(await pipe.execute())
+            note_round_trip(self._keys, op="pipeline")
+            l1 = self._cache._l1
+            if l1 is not None and self._l1_writes:
+                for key, ttl_seconds, value in self._l1_writes:
+                    l1.set(key, value, ttl_seconds)
+                self._cache._l1_gauges()
+        finally:
+            reset = getattr(pipe, "reset", None)
+            if reset is not None:
+                res = reset()
+                if hasattr(res, "__await__"):
+                    await res
@@ -28,24 +28,35 @@ except ImportError:  # pragma: no cover - optional dev/test fallback
 
 _logger = get_logger("core_cache.redis")
 _pool: Optional[Any] = None
+_bytes_pool: Optional[Any] = None
 
-def get_redis_pool() -> Any:
+def get_redis_pool(*, binary: bool = False) -> Any:
     """Return a shared asyncio Redis client/pool.
 
     Consumers should treat the returned object as an async client. In dev/tests
     where Redis isn't available, a no-op fake may be returned.
+
+    ``binary=True`` returns a second shared client with ``decode_responses``
+    off; ``RedisCache`` needs it because compressed values are not UTF-8.
     """
-    global _pool
-    if _pool is None:
+    global _pool, _bytes_pool
+    if (_bytes_pool if binary else _pool) is None:
         s = get_settings()
         if aioredis is None:
             raise RuntimeError("redis asyncio client not available")
-        _pool = aioredis.from_url(  # type: ignore[attr-defined]
-            getattr(s, "redis_url"),
-            encoding="utf-8",
-            decode_responses=True,
-            max_connections=getattr(s, "redis_max_connections", 100),
-        )
-        log_stage(_logger, "redis", "pool_init",
+        if binary:
+            _bytes_pool = aioredis.from_url(  # type: ignore[attr-defined]
+                getattr(s, "redis_url"),
+                decode_responses=False,
+                max_connections=getattr(s, "redis_max_connections", 100),
+            )
+        else:
+            _pool = aioredis.from_url(  # type: ignore[attr-defined]
+                getattr(s, "redis_url"),
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=getattr(s, "redis_max_connections", 100),
+            )
+        log_stage(_logger, "redis", "pool_init", binary=binary,
                   url=getattr(s, "redis_url", ""), request_id="startup")
-    return _pool
\ No newline at end of file
+    return _bytes_pool if binary else _pool
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from core_logging import note_request_count
+from core_metrics import counter as metric_counter
+
+def note_round_trip(keys: int = 1, *, op: str = "get") -> None:
+    """Count one Redis round trip (touching *keys* keys) for this request and process."""
+    note_request_count("redis_round_trips", 1)
+    note_request_count("redis_keys", keys)
+    metric_counter("cache_redis_round_trips_total", 1, op=op)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .roundtrips import note_round_trip
+
+# ------------------------------
+# In-process single-flight
+# ------------------------------
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical work inside one event loop.
+
+    The first caller for a key (the leader) runs ``fn``; callers arriving while
+    it is in flight await the same result instead of repeating the work.
+    Followers receive ``copy(result)`` when a copier is given, so callers that
+    mutate their result never see each other's changes.  If the leader is
+    cancelled, one follower takes over; leader exceptions propagate to all.
+    """
+    def __init__(self) -> None:
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        copy: Optional[Callable[[Any], Any]] = None,
+    ) -> Tuple[Any, bool]:
+        """Return ``(result, shared)``; ``shared`` is True for followers."""
+        while True:
+            fut = self._inflight.get(key)
+            if fut is None:
+                break
+            try:
+                res = await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                if fut.cancelled():
+                    continue  # leader went away; retry (possibly as the new leader)
+                raise
+            return (copy(res) if copy else res), True
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            res = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved when nobody is waiting
+            raise
+        else:
+            fut.set_result(res)
+            return res, False
+        finally:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+# ------------------------------
+# Cross-process lease (Redis)
+# ------------------------------
+
+RELEASE_LEASE_LUA = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) else return 0 end"
+)
+
+def lease_key(cache_key: str) -> str:
+    """Lease key guarding the computation of *cache_key*."""
+    return f"{cache_key}:lease"
+
+async def try_acquire_lease(client: Any, key: str, ttl_ms: int) -> Optional[str]:
+    """
+    ``SET key token NX PX ttl``. Returns the token when acquired, None when
+    another process holds the lease. Redis errors propagate to the caller.
+    """
+    token = uuid.uuid4().hex
+    ok = await client.set(key, token, nx=True, px=max(1, int(ttl_ms)))
+    note_round_trip(1, op="lease")
+    return token if ok else None
+
+async def release_lease(client: Any, key: str, token: str) -> bool:
+    """Compare-and-delete so an expired lease re-acquired by a peer is left alone."""
+    try:
+        released = bool(await client.eval(RELEASE_LEASE_LUA, 1, key, token))
+        note_round_trip(1, op="lease")
+        return released
+    except Exception:
+        return False
+
+async def wait_for_value(
+    client: Any, key: str, *, wait_ms: int, step_ms: int = 25,
+    decode: Optional[Callable[[Any], Any]] = None,
+) -> Optional[Any]:
+    """
+    Poll *key* until it is filled or *wait_ms* elapses (bounded follower wait).
+    Pass ``decode`` (e.g. ``codec.decode_value``) for keys written by RedisCache.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0, int(wait_ms)) / 1000.0
+    while True:
+        try:
+            raw = await client.get(key)
+        except Exception:
+            return None
+        note_round_trip(1, op="wait")
+        if raw:
+            if decode is None:
+                return raw
+            try:
+                return decode(raw)
+            except ValueError:
+                return None
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(step_ms / 1000.0, remaining))
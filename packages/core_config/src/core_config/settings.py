@@ -42,6 +42,9 @@ class Settings(BaseSettings):
     embedding_dim: int = Field(default=768, alias="EMBEDDING_DIM")
     vector_metric: str = Field(default="cosine", alias="VECTOR_METRIC")
     faiss_nlists: int = Field(default=100, alias="FAISS_NLISTS")
+    # Vector retrieval: max matches per query and ANN candidates re-scored exactly
+    vector_ann_top_k: int = Field(default=50, alias="VECTOR_ANN_TOP_K")
+    vector_ann_candidates: int = Field(default=200, alias="VECTOR_ANN_CANDIDATES")
 
     # Sensitivity ordering (most restrictive wins). Accepts comma string via env.
     sensitivity_order_raw: str = Field(default="low,medium,high", alias="SENSITIVITY_ORDER")
@@ -64,6 +67,42 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = Field(default="redis://redis:6379/0", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=100, alias="REDIS_MAX_CONNECTIONS")
+    # Sync pool owned by ArangoStore (storage-layer cache + snapshot publish)
+    storage_redis_max_connections: int = Field(default=32, alias="STORAGE_REDIS_MAX_CONNECTIONS")
+    storage_redis_pool_wait_ms: int = Field(default=50, alias="STORAGE_REDIS_POOL_WAIT_MS")
+    redis_socket_timeout_ms: int = Field(default=250, alias="REDIS_SOCKET_TIMEOUT_MS")
+    redis_connect_timeout_ms: int = Field(default=200, alias="REDIS_CONNECT_TIMEOUT_MS")
+    redis_health_check_interval_s: int = Field(default=30, alias="REDIS_HEALTH_CHECK_INTERVAL_S")
+    # Optional in-process L1 in front of RedisCache (bounded LRU; TTL capped per namespace).
+    cache_l1_enable: bool = Field(default=False, alias="CACHE_L1_ENABLE")
+    cache_l1_max_bytes: int = Field(default=64 * 1024 * 1024, alias="CACHE_L1_MAX_BYTES")
+    cache_l1_max_entries: int = Field(default=4096, alias="CACHE_L1_MAX_ENTRIES")
+    cache_l1_ttl_cap_sec: int = Field(default=30, alias="CACHE_L1_TTL_CAP_SEC")
+    # Comma-separated "<key prefix>=<seconds>" caps; longest matching prefix wins.
+    cache_l1_ttl_caps: str = Field(
+        default="bv:gw:v1:bundle=60,bv:gw:v1:evidence=60,bv:gw:v1:evidence_idx=10,bv:mem:v1=30",
+        alias="CACHE_L1_TTL_CAPS",
+    )
+    # RedisCache value compression: values of at least this size are stored
+    # compressed (0 = off). Codec: auto (zstd if installed, else zlib) | zstd | zlib | none.
+    cache_compress_min_bytes: int = Field(default=1024, alias="CACHE_COMPRESS_MIN_BYTES")
+    cache_compress_codec: str = Field(default="auto", alias="CACHE_COMPRESS_CODEC")
+    # RedisCache.get_or_compute early refresh (XFetch) aggressiveness; 0 = refresh only on expiry.
+    cache_xfetch_beta: float = Field(default=1.0, alias="CACHE_XFETCH_BETA")
+    # Snapshot-generation reaper: keep this many superseded generations, sweep older ones.
+    cache_reaper_enable: bool = Field(default=True, alias="CACHE_REAPER_ENABLE")
+    cache_generation_keep: int = Field(default=1, alias="CACHE_GENERATION_KEEP")
+    cache_reaper_batch: int = Field(default=500, alias="CACHE_REAPER_BATCH")
+    cache_reaper_pause_ms: int = Field(default=10, alias="CACHE_REAPER_PAUSE_MS")
+    cache_reaper_interval_sec: int = Field(default=60, alias="CACHE_REAPER_INTERVAL_SEC")
+
+    # Snapshot ETag holder (push via Redis pub/sub; bounded polling fallback)
+    snapshot_etag_channel: str = Field(default="bv:snapshot:v1:etag", alias="SNAPSHOT_ETAG_CHANNEL")
+    snapshot_etag_poll_ms: int = Field(default=1000, alias="SNAPSHOT_ETAG_POLL_MS")
+    snapshot_etag_max_age_ms: int = Field(default=30000, alias="SNAPSHOT_ETAG_MAX_AGE_MS")
+    # In-process 1-hop adjacency cache, keyed by (snapshot etag, node id)
+    adjacency_cache_max_entries: int = Field(default=4096, alias="ADJACENCY_CACHE_MAX_ENTRIES")
 
     # MinIO
     minio_endpoint: str = Field(default="minio:9000", alias="MINIO_ENDPOINT")
@@ -76,6 +115,19 @@ class Settings(BaseSettings):
     minio_public_endpoint: str | None = Field(default=None, alias="MINIO_PUBLIC_ENDPOINT")
     # non-blocking MinIO uploads (§Tech-Spec A, “performance budgets”)
     minio_async_timeout: int = Field(default=3, alias="MINIO_ASYNC_TIMEOUT")
+    # Pooled MinIO transport + bounded parallel object transfers
+    minio_max_connections: int = Field(default=32, alias="MINIO_MAX_CONNECTIONS")
+    minio_transfer_concurrency: int = Field(default=8, alias="MINIO_TRANSFER_CONCURRENCY")
+    minio_connect_timeout_ms: int = Field(default=1000, alias="MINIO_CONNECT_TIMEOUT_MS")
+    minio_object_timeout_ms: int = Field(default=5000, alias="MINIO_OBJECT_TIMEOUT_MS")
+    # Write-behind artifact uploads: local spool + bounded queue + background workers
+    artifact_spool_dir: str = Field(default="/var/lib/batvault/artifact-spool", alias="ARTIFACT_SPOOL_DIR")
+    artifact_queue_max: int = Field(default=256, alias="ARTIFACT_QUEUE_MAX")
+    artifact_upload_workers: int = Field(default=2, alias="ARTIFACT_UPLOAD_WORKERS")
+    artifact_upload_max_attempts: int = Field(default=5, alias="ARTIFACT_UPLOAD_MAX_ATTEMPTS")
+    artifact_upload_retry_base_ms: int = Field(default=200, alias="ARTIFACT_UPLOAD_RETRY_BASE_MS")
+    artifact_upload_retry_cap_ms: int = Field(default=10000, alias="ARTIFACT_UPLOAD_RETRY_CAP_MS")
+    artifact_spool_sweep_s: int = Field(default=30, alias="ARTIFACT_SPOOL_SWEEP_S")
     memory_api_url: str = Field(
         default="http://memory_api:8000", alias="MEMORY_API_URL"
     )
@@ -83,6 +135,9 @@ class Settings(BaseSettings):
     opa_url: Optional[str] = Field(default=None, alias="OPA_URL")
     opa_decision_path: str = Field(default="/v1/data/batvault/decision", alias="OPA_DECISION_PATH")
     opa_timeout_ms: int = Field(default=1000, alias="OPA_TIMEOUT_MS")
+    # Short-lived decision cache for the async adapter (0 disables caching)
+    opa_decision_cache_ttl_ms: int = Field(default=2000, alias="OPA_DECISION_CACHE_TTL_MS")
+    opa_decision_cache_max_entries: int = Field(default=4096, alias="OPA_DECISION_CACHE_MAX_ENTRIES")
     # If provided, becomes the authoritative policy_fp when using OPA bundles.
     opa_bundle_sha: Optional[str] = Field(default=None, alias="OPA_BUNDLE_SHA")
 
@@ -105,6 +160,17 @@ class Settings(BaseSettings):
     rerank_pair_max: int = Field(default=10, alias="RERANK_PAIR_MAX")
     # Hard budget for rerank scoring (milliseconds).
     rerank_timeout_ms: int = Field(default=50, alias="RERANK_TIMEOUT_MS")
+    # Progressive SSE (/v3/query?stream=true): idle heartbeat + disconnect check interval.
+    sse_heartbeat_ms: int = Field(default=10000, alias="SSE_HEARTBEAT_MS")
+    # Server-side evidence cache lookup: how long a snapshot etag learned from
+    # Memory is trusted to derive cache keys without asking Memory again (0 = off).
+    evidence_snapshot_max_age_ms: int = Field(default=5000, alias="EVIDENCE_SNAPSHOT_MAX_AGE_MS")
+    # Evidence gathering via Memory's fused /api/evidence (one call instead of enrich + expand).
+    gateway_fused_evidence: bool = Field(default=True, alias="GATEWAY_FUSED_EVIDENCE")
+    # Idempotency: compute lease held by the claiming replica, and how long a
+    # duplicate request waits for that replica's result before computing itself.
+    idem_lease_ms: int = Field(default=30000, alias="IDEM_LEASE_MS")
+    idem_wait_ms: int = Field(default=2000, alias="IDEM_WAIT_MS")
 
     # Evidence heuristics
     enable_day_summary_dedup: bool = Field(default=False, alias="ENABLE_DAY_SUMMARY_DEDUP")
@@ -124,6 +190,11 @@ class Settings(BaseSettings):
     timeout_search_ms: int = Field(default=TIMEOUT_SEARCH_MS,  alias="TIMEOUT_SEARCH_MS")
     timeout_expand_ms: int = Field(default=TIMEOUT_EXPAND_MS,  alias="TIMEOUT_EXPAND_MS")
     timeout_enrich_ms: int = Field(default=TIMEOUT_ENRICH_MS,  alias="TIMEOUT_ENRICH_MS")
+    # /api/enrich/batch pipeline: ids per bulk fetch, concurrent chunks per process,
+    # and the deadline after which unfinished items are returned as partial.
+    enrich_batch_chunk_size: int = Field(default=25, alias="ENRICH_BATCH_CHUNK_SIZE")
+    enrich_batch_concurrency: int = Field(default=4, alias="ENRICH_BATCH_CONCURRENCY")
+    enrich_batch_item_timeout_ms: int = Field(default=800, alias="ENRICH_BATCH_ITEM_TIMEOUT_MS")
     # LLM routing
     # Primary endpoint (preferred).
     llm_endpoint: str | None = Field(default=None, alias="LLM_ENDPOINT")
@@ -149,6 +220,10 @@ class Settings(BaseSettings):
 
     # Load-shed / Redis budgets
     redis_get_budget_ms: int = Field(default=100, alias="REDIS_GET_BUDGET_MS")
+    # memory_api miss coalescing: in-process single-flight, optional cross-process Redis lease
+    memory_singleflight_enabled: bool = Field(default=True, alias="MEMORY_SINGLEFLIGHT_ENABLED")
+    memory_cache_lease_ms: int = Field(default=0, alias="MEMORY_CACHE_LEASE_MS")
+    memory_cache_lease_wait_ms: int = Field(default=250, alias="MEMORY_CACHE_LEASE_WAIT_MS")
 
     # Policy registry
     policy_registry_path: str | None = Field(default=None, alias="POLICY_REGISTRY_PATH")
@@ -1,9 +1,11 @@
 from __future__ import annotations
-import hashlib, inspect
+import asyncio, hashlib, inspect, time, uuid
+from dataclasses import dataclass
 from hashlib import blake2s
 from typing import Any, Optional
 from core_utils import jsonx
 from core_logging import get_logger, log_stage, current_request_id
+from core_cache.roundtrips import note_round_trip
 
 _IDEM_LOGGER = get_logger("core_idem")
 
@@ -21,15 +23,16 @@ def idem_key_fp(raw_key: str | None) -> str:
     """Short, log-safe fingerprint of the client Idempotency-Key."""
     return _b2s(raw_key or "")
 
-def idem_redis_key(raw_key: str, service: str = "gateway", *, version: int = 2) -> str:
+def idem_redis_key(raw_key: str, service: str = "gateway", *, version: int = 3) -> str:
     """
     Stable Redis key for a client-supplied Idempotency-Key.
-    Namespaced by service + version. v2 uses blake2s to align with other caches.
+    Namespaced by service + version. v2 uses blake2s to align with other caches;
+    v3 (same digest) holds the hash-shaped records used by the atomic helpers.
     """
     if version == 1:
         d = hashlib.sha1((raw_key or "").encode("utf-8")).hexdigest()[:20]
         return f"idem:v1:{service}:{d}"
-    return f"idem:v2:{service}:{_b2s(raw_key or '')}"
+    return f"idem:v{int(version)}:{service}:{_b2s(raw_key or '')}"
 
 def compute_request_scope_fp(
     *,
@@ -76,7 +79,7 @@ def compute_request_scope_fp(
                 log_stage(_IDEM_LOGGER, "idem", "empty_query_normalized", request_id=(current_request_id() or None))
                 q = ""
             else:
-                q = jsonx.dumps(_q, sort_keys=True)
+                q = jsonx.dumps(_q)
     elif isinstance(query, str):
         s = query.lstrip("?")
         if "=" in s or "&" in s:
@@ -88,13 +91,13 @@ def compute_request_scope_fp(
                 log_stage(_IDEM_LOGGER, "idem", "empty_query_normalized", request_id=(current_request_id() or None))
                 q = ""
             else:
-                q = jsonx.dumps(_q, sort_keys=True)
+                q = jsonx.dumps(_q)
     else:
         _q = jsonx.to_jsonable(query)
         if _q is None or (isinstance(_q, dict) and not _q):
             log_stage(_IDEM_LOGGER, "idem", "empty_query_normalized", request_id=(current_request_id() or None))
             _q = {}
-        q = jsonx.dumps(_q, sort_keys=True)
+        q = jsonx.dumps(_q)
 
     # Match ids.py rule: '{}' is treated as empty for query
     if q == "{}":
@@ -106,50 +109,210 @@ def compute_request_scope_fp(
     if _b is None or (isinstance(_b, dict) and not _b):
         log_stage(_IDEM_LOGGER, "idem", "empty_body_normalized", request_id=(current_request_id() or None))
         _b = {}
-    b = jsonx.dumps(_b, sort_keys=True)
+    b = jsonx.dumps(_b)
     return _b2s(method.upper(), path_or_template, q, b, snapshot_etag or "", policy_fp or "")
 
-async def idem_get(rc, key: str) -> Optional[dict]:
+# ── Record store ────────────────────────────────────────────────────────────
+# A record is a Redis hash: one field per top-level key, each value JSON-encoded
+# (v3 keys). Every operation below is a single round trip; claim/merge/complete
+# are Lua scripts, so concurrent replays of one key cannot interleave.
+
+_STATUS_COMPLETE = '"complete"'
+
+_CLAIM_LUA = """
+local st = redis.call('HGET', KEYS[1], 'status')
+if not st then
+  redis.call('HSET', KEYS[1], unpack(ARGV, 6))
+  redis.call('EXPIRE', KEYS[1], ARGV[1])
+  redis.call('SET', KEYS[2], ARGV[3], 'PX', ARGV[2])
+  return {'claimed', ''}
+end
+local scope = redis.call('HGET', KEYS[1], 'request_scope_fp')
+local reqfp = redis.call('HGET', KEYS[1], 'request_fingerprint')
+if (scope and scope ~= ARGV[4]) or (reqfp and reqfp ~= ARGV[5]) then
+  return {'conflict', scope or ''}
+end
+if st == '%s' then
+  return {'complete', redis.call('HGET', KEYS[1], 'response') or ''}
+end
+if redis.call('SET', KEYS[2], ARGV[3], 'NX', 'PX', ARGV[2]) then
+  return {'takeover', redis.call('HGET', KEYS[1], 'progress') or ''}
+end
+return {'in_progress', redis.call('HGET', KEYS[1], 'progress') or ''}
+""" % _STATUS_COMPLETE
+
+# KEYS[1]=record, KEYS[2]=lease (optional; deleted when ARGV[3]=='1')
+_MERGE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+if ARGV[2] ~= '' and redis.call('HGET', KEYS[1], 'request_scope_fp') ~= ARGV[2] then return -1 end
+redis.call('HSET', KEYS[1], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+if ARGV[3] == '1' and KEYS[2] then redis.call('DEL', KEYS[2]) end
+return 1
+"""
+
+_SET_LUA = """
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+@dataclass(frozen=True)
+class IdemClaim:
     """
-    Read the idempotency record. Returns dict or None. Works with sync/async Redis clients.
+    Outcome of ``idem_claim``:
+      claimed     – new record written; this request owns the lease
+      takeover    – pending record whose owner's lease expired; this request owns it now
+      in_progress – another request holds the lease (see ``idem_wait``)
+      complete    – a finished response is available in ``response``
+      conflict    – the key was used for a different request scope
     """
-    val = rc.get(key)
-    val = await val if inspect.isawaitable(val) else val
-    if not val:
+    status: str
+    response: Optional[dict] = None
+    progress: Optional[dict] = None
+
+def idem_lease_key(key: str) -> str:
+    return f"{key}:lease"
+
+def _enc(v: Any) -> str:
+    return jsonx.dumps(v)
+
+def _dec(v: Any) -> Any:
+    if v in (None, b"", ""):
         return None
     try:
-        return jsonx.loads(val)
+        return jsonx.loads(v)
     except (TypeError, ValueError):
         return None
 
+def _flat(payload: dict) -> list[str]:
+    out: list[str] = []
+    for k, v in (payload or {}).items():
+        out += [str(k), _enc(v)]
+    return out
+
+def _s(v: Any) -> str:
+    return v.decode("utf-8") if isinstance(v, (bytes, bytearray)) else str(v or "")
+
+async def _eval(rc, script: str, keys: list[str], args: list[Any]) -> Any:
+    res = rc.eval(script, len(keys), *keys, *[str(a) for a in args])
+    note_round_trip(len(keys), op="eval")
+    return await res if inspect.isawaitable(res) else res
+
+async def idem_get(rc, key: str) -> Optional[dict]:
+    """
+    Read the idempotency record (one HGETALL). Returns dict or None. Works with sync/async Redis clients.
+    """
+    raw = rc.hgetall(key)
+    note_round_trip(1, op="hgetall")
+    raw = await raw if inspect.isawaitable(raw) else raw
+    if not raw:
+        return None
+    return {_s(k): _dec(v) for k, v in raw.items()}
+
 async def idem_set(rc, key: str, payload: dict, *, ttl: int = IDEM_TTL_SEC) -> None:
     """
-    Overwrite the idempotency record with TTL. Works with sync/async Redis clients.
+    Overwrite the idempotency record with TTL (atomic). Works with sync/async Redis clients.
+    """
+    if payload:
+        await _eval(rc, _SET_LUA, [key], [int(ttl), *_flat(payload)])
+
+async def idem_claim(
+    rc,
+    key: str,
+    record: dict,
+    *,
+    scope_fp: str | None,
+    request_fp: str | None,
+    lease_ms: int,
+    ttl: int = IDEM_TTL_SEC,
+) -> IdemClaim:
+    """
+    Claim-or-replay in one round trip. Writes *record* (which should carry
+    ``status="pending"`` and the fingerprints) when the key is new, otherwise
+    reports the stored state; see ``IdemClaim``. The caller owning the lease
+    should finish with ``idem_complete``; an abandoned lease expires after
+    *lease_ms* and the next replay takes over.
+    """
+    token = uuid.uuid4().hex
+    status, blob = await _eval(
+        rc, _CLAIM_LUA, [key, idem_lease_key(key)],
+        [int(ttl), max(1, int(lease_ms)), token, _enc(scope_fp), _enc(request_fp), *_flat(record)],
+    )
+    status = _s(status)
+    if status == "complete":
+        resp = _dec(blob)
+        return IdemClaim(status, response=resp if isinstance(resp, dict) else None)
+    if status in ("takeover", "in_progress"):
+        prog = _dec(blob)
+        return IdemClaim(status, progress=prog if isinstance(prog, dict) else None)
+    if status == "conflict":
+        log_stage(
+            _IDEM_LOGGER, "idem", "idem.scope_conflict.claim",
+            key=key, stored=_dec(blob), expected=scope_fp,
+            request_id=(current_request_id() or None),
+        )
+    return IdemClaim(status)
+
+async def idem_wait(rc, key: str, *, wait_ms: int, step_ms: int = 25) -> Optional[dict]:
     """
-    put = rc.setex(key, int(ttl), jsonx.dumps(payload, sort_keys=True))
-    if inspect.isawaitable(put):
-        await put
+    Bounded wait for another request to complete *key*. Returns the stored
+    response once the record is complete, or None after *wait_ms*.
+    """
+    deadline = time.monotonic() + max(0, int(wait_ms)) / 1000.0
+    while True:
+        vals = rc.hmget(key, "status", "response")
+        note_round_trip(1, op="hmget")
+        vals = await vals if inspect.isawaitable(vals) else vals
+        status, resp = (list(vals or []) + [None, None])[:2]
+        if status is not None and _s(status) == _STATUS_COMPLETE:
+            resp = _dec(resp)
+            return resp if isinstance(resp, dict) else None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(step_ms / 1000.0, remaining))
 
-async def idem_merge(rc, key: str, patch: dict, *, expected_scope_fp: str, ttl: int = IDEM_TTL_SEC) -> bool:
+async def idem_merge(
+    rc, key: str, patch: dict, *, expected_scope_fp: str | None = None, ttl: int = IDEM_TTL_SEC,
+) -> bool:
     """
-    Merge with guard: only apply when stored request_scope_fp matches expected.
+    Atomic shallow merge with guard: only applied when the stored request_scope_fp
+    matches *expected_scope_fp* (None skips the guard).
     Returns True when merged, False on scope mismatch or missing record.
     """
-    cur = await idem_get(rc, key)
-    if not isinstance(cur, dict):
+    if not patch:
         return False
-    if cur.get("request_scope_fp") != expected_scope_fp:
+    rc_out = await _eval(
+        rc, _MERGE_LUA, [key],
+        [int(ttl), ("" if expected_scope_fp is None else _enc(expected_scope_fp)), "0", *_flat(patch)],
+    )
+    if int(rc_out or 0) == -1:
         # strategic, structured log; no PII
         log_stage(
             _IDEM_LOGGER, "idem", "idem.scope_conflict.merge",
-            key=key, stored=cur.get("request_scope_fp"), expected=expected_scope_fp,
+            key=key, expected=expected_scope_fp,
             request_id=(current_request_id() or None),
         )
-        return False
-    # shallow merge is fine because we pin scope; avoid cross-request leakage
-    cur.update(patch or {})
-    await idem_set(rc, key, cur, ttl=ttl)
-    return True
+    return int(rc_out or 0) == 1
+
+async def idem_complete(
+    rc, key: str, *, response: dict, request_id: str | None,
+    expected_scope_fp: str | None, ttl: int = IDEM_TTL_SEC,
+) -> bool:
+    """Mark *key* complete with *response* and release the lease in one round trip."""
+    patch = {
+        "status": "complete",
+        "completed_at": int(time.time()),
+        "request_id": request_id,
+        "response": response,
+    }
+    rc_out = await _eval(
+        rc, _MERGE_LUA, [key, idem_lease_key(key)],
+        [int(ttl), ("" if expected_scope_fp is None else _enc(expected_scope_fp)), "1", *_flat(patch)],
+    )
+    return int(rc_out or 0) == 1
 
 # ── Tiny breadcrumb helpers (optional, convenience) ─────────────────────────
 def idem_log_replay(logger, *, key_fp: str, request_id: str | None = None) -> None:
@@ -0,0 +1,109 @@
+"""
+Claim / wait / merge / complete round trips of ``core_idem`` against
+fakeredis, which runs the Lua scripts for real (``fakeredis[lua]``).
+"""
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from core_idem import (
+    compute_request_scope_fp,
+    idem_claim,
+    idem_complete,
+    idem_get,
+    idem_merge,
+    idem_redis_key,
+    idem_wait,
+)
+
+SCOPE = "scope-a"
+REQ_FP = "req-a"
+
+
+@pytest.fixture
+def rc():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+def _record(scope=SCOPE, req_fp=REQ_FP):
+    return {"status": "pending", "request_scope_fp": scope, "request_fingerprint": req_fp}
+
+
+async def _claim(rc, key, scope=SCOPE, req_fp=REQ_FP, lease_ms=30_000):
+    return await idem_claim(rc, key, _record(scope, req_fp),
+                            scope_fp=scope, request_fp=req_fp, lease_ms=lease_ms)
+
+
+def test_scope_fp_is_stable_and_key_order_insensitive():
+    a = compute_request_scope_fp(method="post", path_or_template="/v3/query", query="b=2&a=1",
+                                 body={"x": 1, "y": [1, 2]}, snapshot_etag="e1", policy_fp="p1")
+    b = compute_request_scope_fp(method="POST", path_or_template="/v3/query", query="a=1&b=2",
+                                 body={"y": [1, 2], "x": 1}, snapshot_etag="e1", policy_fp="p1")
+    c = compute_request_scope_fp(method="POST", path_or_template="/v3/query", query={"q": "x"},
+                                 body=None, snapshot_etag="e1", policy_fp="p1")
+    assert a == b
+    assert c != a
+
+
+@pytest.mark.asyncio
+async def test_claim_progress_complete_and_replay(rc):
+    key = idem_redis_key("k-1")
+    first = await _claim(rc, key)
+    assert first.status == "claimed"
+
+    second = await _claim(rc, key)
+    assert second.status == "in_progress"
+
+    assert await idem_merge(rc, key, {"progress": {"bundle_fp": "bf-1"}}, expected_scope_fp=SCOPE)
+    third = await _claim(rc, key)
+    assert third.status == "in_progress"
+    assert third.progress == {"bundle_fp": "bf-1"}
+
+    waiter = asyncio.ensure_future(idem_wait(rc, key, wait_ms=2000, step_ms=5))
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+    response = {"answer": {"short_answer": "ok"}, "meta": {"bundle_fp": "bf-1"}}
+    assert await idem_complete(rc, key, response=response, request_id="r-1", expected_scope_fp=SCOPE)
+    assert await waiter == response
+
+    replay = await _claim(rc, key)
+    assert replay.status == "complete"
+    assert replay.response == response
+    stored = await idem_get(rc, key)
+    assert stored["status"] == "complete" and stored["request_id"] == "r-1"
+    # The lease is released together with the completion.
+    assert await rc.exists(f"{key}:lease") == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_while_pending(rc):
+    key = idem_redis_key("k-2")
+    assert (await _claim(rc, key)).status == "claimed"
+    assert await idem_wait(rc, key, wait_ms=30, step_ms=5) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_taken_over(rc):
+    key = idem_redis_key("k-3")
+    assert (await _claim(rc, key, lease_ms=1)).status == "claimed"
+    await asyncio.sleep(0.01)
+    assert (await _claim(rc, key)).status == "takeover"
+
+
+@pytest.mark.asyncio
+async def test_conflicting_scope_is_rejected(rc):
+    key = idem_redis_key("k-4")
+    assert (await _claim(rc, key)).status == "claimed"
+    assert (await _claim(rc, key, scope="scope-b")).status == "conflict"
+    assert (await _claim(rc, key, req_fp="req-b")).status == "conflict"
+    assert not await idem_merge(rc, key, {"progress": {"x": 1}}, expected_scope_fp="scope-b")
+    assert not await idem_complete(rc, key, response={"x": 1}, request_id="r-2",
+                                   expected_scope_fp="scope-b")
+    assert (await idem_get(rc, key))["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_merge_on_missing_record_is_noop(rc):
+    assert not await idem_merge(rc, idem_redis_key("missing"), {"progress": {"x": 1}})
@@ -8,6 +8,7 @@ from .logger import (
     current_request_id,
     current_trace_ids,
     log_once,
+    note_request_count,
     emit_request_summary,
     emit_request_error_summary,
     record_error,
@@ -29,6 +30,7 @@ __all__ = [
     "current_trace_ids",
     "trace_span",
     "log_once",
+    "note_request_count",
     "emit_request_summary",
     "emit_request_error_summary",
     "record_error",
@@ -11,7 +11,7 @@ from core_utils.fingerprints import sha256_hex
 # Request-level aggregation & summary emission
 # ────────────────────────────────────────────────────────────
 class _ReqAgg:
-    __slots__ = ("events","timers","last","id_norm","errors","once")
+    __slots__ = ("events","timers","last","id_norm","errors","once","counts")
     def __init__(self) -> None:
         self.events: dict[str, dict[str,int]] = {}
         self.timers: dict[str, list[float]] = {}
@@ -19,6 +19,7 @@ class _ReqAgg:
         self.id_norm: list[tuple[str,str]] = []
         self.errors: list[dict[str,Any]] = []
         self.once: set[str] = set()
+        self.counts: dict[str, int] = {}
 
 _REQ_AGG: contextvars.ContextVar[Optional[_ReqAgg]] = contextvars.ContextVar("REQ_AGG", default=None)
 
@@ -29,6 +30,11 @@ def _get_req_agg() -> _ReqAgg:
         _REQ_AGG.set(agg)
     return agg
 
+def note_request_count(name: str, inc: int = 1) -> None:
+    """Add *inc* to a per-request counter reported under ``request_counts`` in request_summary."""
+    agg = _get_req_agg()
+    agg.counts[name] = agg.counts.get(name, 0) + int(inc)
+
 def _should_summarize() -> bool:
     # Default to compact summary mode; set LOG_EMIT_MODE=verbose to disable
     return (os.getenv("LOG_EMIT_MODE", "summary").lower() in ("summary","summarize","compact"))
@@ -136,6 +142,8 @@ def emit_request_summary(logger: logging.Logger, *, service: Optional[str]=None)
         **agg.last,
         "error_count": len(agg.errors),
     }
+    if agg.counts:
+        payload["request_counts"] = dict(agg.counts)
     # Summarize cache usage if present
     _cache = (agg.events or {}).get("cache", {})
     _hits  = int(_cache.get("cache.hit", 0))
@@ -1,2 +1,12 @@
-from .adapter import OPADecision, opa_decide_if_enabled  # re-export
-__all__ = ["OPADecision", "opa_decide_if_enabled"]
\ No newline at end of file
+from .adapter import (  # re-export
+    OPADecision,
+    clear_decision_cache,
+    opa_decide_if_enabled,
+    opa_decide_if_enabled_async,
+)
+__all__ = [
+    "OPADecision",
+    "clear_decision_cache",
+    "opa_decide_if_enabled",
+    "opa_decide_if_enabled_async",
+]
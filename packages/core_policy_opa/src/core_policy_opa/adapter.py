@@ -1,6 +1,8 @@
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
 import time
 from urllib.parse import urlsplit
 import httpx
@@ -9,6 +11,8 @@ from core_utils.jsonx import dumps as canonical_dumps
 from core_logging import get_logger, log_stage, record_error, current_request_id
 from core_observability.otel import inject_trace_context
 from core_utils.identity import build_opa_input
+from core_utils.fingerprints import canonical_json, sha256_hex
+import core_metrics
 
 logger = get_logger("core_policy_opa")
 
@@ -31,79 +35,49 @@ def _build_url() -> str:
     path = (s.opa_decision_path or "/v1/data/batvault/decision").lstrip("/")
     return f"{base}/{path}"
 
-def opa_decide_if_enabled(
-    *,
-    anchor_id: str,
-    edges: List[Dict[str, Any]],
-    headers: Dict[str, str],
-    snapshot_etag: str,
-    intents: Optional[List[str]] = None,
-) -> Optional[OPADecision]:
-    """
-    Call OPA when configured, else return None (explicit fallback).
-    Narrow error handling:
-      - HTTP/network errors: logged once per request_id then return None
-      - Unexpected payload shape: logged and return None
-    Deterministic: dedupes/lex-sorts allowed_ids.
-    """
-    if not _opa_enabled():
-        return None
+def _timeout_s() -> float:
+    s = get_settings()
+    return max(0.1, float(getattr(s, "opa_timeout_ms", 1000)) / 1000.0)
 
-    url = _build_url()
-    input_obj = build_opa_input(
-        anchor_id=anchor_id,
-        edges=edges,
-        headers=headers,
-        snapshot_etag=snapshot_etag,
-        intents=intents,
+def _request_headers(url: str) -> Tuple[Dict[str, str], Optional[str]]:
+    """Outbound headers (trace context + request id) and the request crumb."""
+    req_headers: Dict[str, str] = inject_trace_context({"content-type": "application/json"})
+    rid = current_request_id() or None
+    if rid:
+        req_headers.setdefault("x-request-id", rid)
+    # Emit an outbound request crumb with a redacted traceparent for OPA trace verification
+    _tp = req_headers.get("traceparent")
+    _tp_redacted = (_tp[:8] + "..." + _tp[-8:]) if isinstance(_tp, str) and len(_tp) > 16 else _tp
+    log_stage(
+        logger, "http.client", "http.client.request", op="opa",
+        http={"method": "POST", "target": urlsplit(url).path or "/"},
+        traceparent=_tp_redacted, request_id=rid
     )
-    # Sync client (Memory path is sync at this point); bounded timeout from settings.
-    s = get_settings()
-    timeout = max(0.1, float(getattr(s, "opa_timeout_ms", 1000)) / 1000.0)
+    return req_headers, rid
 
-    try:
-        # Include trace context + request id for end-to-end correlation
-        req_headers: Dict[str, str] = inject_trace_context({"content-type": "application/json"})
-        rid = current_request_id() or None
-        if rid:
-            req_headers.setdefault("x-request-id", rid)
-        # Emit an outbound request crumb with a redacted traceparent for OPA trace verification
-        _tp = req_headers.get("traceparent")
-        _tp_redacted = (_tp[:8] + "..." + _tp[-8:]) if isinstance(_tp, str) and len(_tp) > 16 else _tp
-        log_stage(
-            logger, "http.client", "http.client.request", op="opa",
-            http={"method": "POST", "target": urlsplit(url).path or "/"},
-            traceparent=_tp_redacted, request_id=rid
-        )
-        t0 = time.perf_counter()
-        from core_http.client import fetch_json_sync
-        body = fetch_json_sync(
-            "POST", url,
-            headers=req_headers,
-            json={"input": input_obj},
-            timeout_ms=int(timeout*1000),
-        )
-        dt_ms = (time.perf_counter() - t0) * 1000.0
-        log_stage(
-            logger, "http.client", "http.client.response", op="opa",
-            http={
-                "method": "POST",
-                "target": urlsplit(url).path or "/",
-                "status_code": 200,
-            },
-            latency_ms=int(dt_ms), request_id=rid
-        )
-    except (httpx.ConnectError, httpx.ReadTimeout, httpx.HTTPStatusError) as exc:
-        # Deterministic error: protocol/transport only (policy denies are not errors)
-        record_error(
-            "OPA.ERROR",
-            where="memory_api#opa_decide",
-            message="OPA request failed",
-            logger=logger,
-            context={"error": str(exc), "url": url, "timeout_s": timeout},
-        )
-        return None
-    
+def _log_response(url: str, t0: float, rid: Optional[str]) -> None:
+    dt_ms = (time.perf_counter() - t0) * 1000.0
+    log_stage(
+        logger, "http.client", "http.client.response", op="opa",
+        http={
+            "method": "POST",
+            "target": urlsplit(url).path or "/",
+            "status_code": 200,
+        },
+        latency_ms=int(dt_ms), request_id=rid
+    )
+
+def _record_transport_error(exc: Exception, url: str, timeout: float) -> None:
+    # Deterministic error: protocol/transport only (policy denies are not errors)
+    record_error(
+        "OPA.ERROR",
+        where="memory_api#opa_decide",
+        message="OPA request failed",
+        logger=logger,
+        context={"error": str(exc), "url": url, "timeout_s": timeout},
+    )
+
+def _decision_from_body(body: Any, snapshot_etag: str) -> OPADecision:
     result = (body.get("result", body) or {}) if isinstance(body, dict) else {}
     raw_ids = list(result.get("allowed_ids") or [])
     explain = result.get("explain") if isinstance(result, dict) else None
@@ -146,4 +120,187 @@ def opa_decide_if_enabled(
         denied_status=denied_status,
         policy_fp=policy_fp,
         explain=explain,
-    )
\ No newline at end of file
+    )
+
+def opa_decide_if_enabled(
+    *,
+    anchor_id: str,
+    edges: List[Dict[str, Any]],
+    headers: Dict[str, str],
+    snapshot_etag: str,
+    intents: Optional[List[str]] = None,
+) -> Optional[OPADecision]:
+    """
+    Call OPA when configured, else return None (explicit fallback).
+    Narrow error handling:
+      - HTTP/network errors: logged once per request_id then return None
+      - Unexpected payload shape: logged and return None
+    Deterministic: dedupes/lex-sorts allowed_ids.
+    Sync variant for thread/bootstrap callers; async handlers should use
+    ``opa_decide_if_enabled_async``.
+    """
+    if not _opa_enabled():
+        return None
+
+    url = _build_url()
+    input_obj = build_opa_input(
+        anchor_id=anchor_id,
+        edges=edges,
+        headers=headers,
+        snapshot_etag=snapshot_etag,
+        intents=intents,
+    )
+    timeout = _timeout_s()
+    try:
+        req_headers, rid = _request_headers(url)
+        t0 = time.perf_counter()
+        from core_http.client import fetch_json_sync
+        body = fetch_json_sync(
+            "POST", url,
+            headers=req_headers,
+            json={"input": input_obj},
+            timeout_ms=int(timeout*1000),
+        )
+        _log_response(url, t0, rid)
+    except (httpx.ConnectError, httpx.ReadTimeout, httpx.HTTPStatusError) as exc:
+        _record_transport_error(exc, url, timeout)
+        return None
+    return _decision_from_body(body, snapshot_etag)
+
+# ──────────────────────────────────────────────────────────────
+# Async adapter with a short-lived decision cache
+# ──────────────────────────────────────────────────────────────
+#
+# A decision is a pure function of (effective policy, snapshot, anchor,
+# candidate set, intents), so identical evaluations within the TTL reuse one
+# OPA round trip.  Concurrent identical evaluations share the in-flight call.
+# Errors are never cached.
+
+_DECISIONS: "OrderedDict[str, Tuple[float, OPADecision]]" = OrderedDict()
+_INFLIGHT: Dict[str, "asyncio.Future[Optional[OPADecision]]"] = {}
+
+def _candidate_ids_fp(edges: List[Dict[str, Any]]) -> str:
+    ids = []
+    for e in edges or []:
+        if not isinstance(e, dict):
+            continue
+        eid = e.get("id") or e.get("_key")
+        ids.append(str(eid) if eid else canonical_json(
+            {"from": e.get("from"), "to": e.get("to"), "type": e.get("type")}
+        ).decode("utf-8"))
+    return sha256_hex(canonical_json(sorted(ids)))[:16]
+
+def _decision_cache_key(policy_fp: str, input_obj: Dict[str, Any], edges: List[Dict[str, Any]]) -> str:
+    # Identity fields outside the policy fingerprint (email, org/tenant) are
+    # folded in so Rego rules that read them never see another caller's decision.
+    ident_fp = sha256_hex(canonical_json(input_obj.get("identity") or {}))[:12]
+    return ":".join((
+        "opa", policy_fp, str(input_obj.get("snapshot_etag") or ""),
+        str((input_obj.get("resource") or {}).get("anchor_id") or ""),
+        _candidate_ids_fp(edges), ",".join(sorted(input_obj.get("intents") or [])), ident_fp,
+    ))
+
+def _cache_lookup(key: str) -> Optional[OPADecision]:
+    hit = _DECISIONS.get(key)
+    if hit is None:
+        return None
+    expires_at, decision = hit
+    if time.monotonic() >= expires_at:
+        _DECISIONS.pop(key, None)
+        return None
+    _DECISIONS.move_to_end(key)
+    return decision
+
+def _cache_store(key: str, decision: OPADecision) -> None:
+    s = get_settings()
+    ttl_s = float(getattr(s, "opa_decision_cache_ttl_ms", 2000)) / 1000.0
+    if ttl_s <= 0:
+        return
+    _DECISIONS[key] = (time.monotonic() + ttl_s, decision)
+    _DECISIONS.move_to_end(key)
+    max_entries = max(1, int(getattr(s, "opa_decision_cache_max_entries", 4096)))
+    while len(_DECISIONS) > max_entries:
+        _DECISIONS.popitem(last=False)
+
+def clear_decision_cache() -> None:
+    """Drop cached decisions (e.g. after an OPA bundle reload)."""
+    _DECISIONS.clear()
+
+async def _fetch_decision_async(input_obj: Dict[str, Any], snapshot_etag: str) -> Optional[OPADecision]:
+    from core_http.client import get_http_client
+    url = _build_url()
+    timeout = _timeout_s()
+    try:
+        req_headers, rid = _request_headers(url)
+        t0 = time.perf_counter()
+        # Shared pooled AsyncClient; the OPA budget is applied per request.
+        client = get_http_client()
+        resp = await client.post(
+            url, json={"input": input_obj}, headers=req_headers,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 0.5)),
+        )
+        resp.raise_for_status()
+        body = resp.json()
+        core_metrics.histogram_ms("opa_decision_ms", (time.perf_counter() - t0) * 1000.0)
+        _log_response(url, t0, rid)
+    except (httpx.TransportError, httpx.HTTPStatusError, ValueError) as exc:
+        _record_transport_error(exc, url, timeout)
+        return None
+    return _decision_from_body(body, snapshot_etag)
+
+async def opa_decide_if_enabled_async(
+    *,
+    anchor_id: str,
+    edges: List[Dict[str, Any]],
+    headers: Dict[str, str],
+    snapshot_etag: str,
+    intents: Optional[List[str]] = None,
+    policy_fp: Optional[str] = None,
+) -> Optional[OPADecision]:
+    """
+    Non-blocking ``opa_decide_if_enabled``.
+    When *policy_fp* (the caller's effective-policy fingerprint) is given, the
+    decision is cached for ``OPA_DECISION_CACHE_TTL_MS`` under
+    (policy_fp, snapshot_etag, anchor_id, candidate-id fingerprint, intents)
+    and concurrent identical calls are coalesced onto one request.
+    """
+    if not _opa_enabled():
+        return None
+    input_obj = build_opa_input(
+        anchor_id=anchor_id,
+        edges=edges,
+        headers=headers,
+        snapshot_etag=snapshot_etag,
+        intents=intents,
+    )
+    if not policy_fp:
+        return await _fetch_decision_async(input_obj, snapshot_etag)
+
+    key = _decision_cache_key(policy_fp, input_obj, edges)
+    cached = _cache_lookup(key)
+    if cached is not None:
+        core_metrics.counter("opa_decision_cache_hit_total", 1)
+        log_stage(logger, "policy", "policy.decision_cache_hit",
+                  request_id=current_request_id(), policy_fp=cached.policy_fp,
+                  snapshot_etag=snapshot_etag)
+        return cached
+    pending = _INFLIGHT.get(key)
+    if pending is not None:
+        core_metrics.counter("opa_decision_coalesced_total", 1)
+        return await asyncio.shield(pending)
+    core_metrics.counter("opa_decision_cache_miss_total", 1)
+    fut: "asyncio.Future[Optional[OPADecision]]" = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    try:
+        decision = await _fetch_decision_async(input_obj, snapshot_etag)
+        if decision is not None:
+            _cache_store(key, decision)
+        fut.set_result(decision)
+        return decision
+    except BaseException as exc:
+        # Followers must not hang on a cancelled/failed leader.
+        if not fut.done():
+            fut.set_result(None)
+        raise exc
+    finally:
+        _INFLIGHT.pop(key, None)
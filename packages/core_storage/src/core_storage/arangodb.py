@@ -2,6 +2,7 @@ import socket
 from urllib.parse import urlparse
 import os
 import re
+import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
 import httpx  # retained for types; calls go through core_http
@@ -23,6 +24,7 @@ import core_metrics
 from core_utils import jsonx
 from core_utils.domain import make_anchor, anchor_to_storage_key
 from core_utils.fingerprints import canonical_json, sha256_hex
+from core_storage.snapshot_cache import SnapshotEtagCache, SnapshotScopedLRU, publish_snapshot_etag
 from core_models.ontology import (
     DOMAIN_RE,
     ID_RE,
@@ -70,6 +72,25 @@ class ArangoStore:
         self.db: Optional[object] = None
         self.graph: Optional[object] = None
         self._core_indexes_ok = False
+        # Process-local snapshot ETag; refreshed by push (Redis pub/sub) or bounded polling.
+        self._etag_channel = getattr(cfg, "snapshot_etag_channel", None) or "bv:snapshot:v1:etag"
+        self._etag_cache = SnapshotEtagCache(
+            self.read_snapshot_etag,
+            poll_s=float(getattr(cfg, "snapshot_etag_poll_ms", 1000)) / 1000.0,
+            max_age_s=float(getattr(cfg, "snapshot_etag_max_age_ms", 30000)) / 1000.0,
+        )
+        # 1-hop adjacency never changes within a snapshot → (etag, node id) LRU.
+        self._adjacency_cache = SnapshotScopedLRU(
+            "adjacency", max_entries=int(getattr(cfg, "adjacency_cache_max_entries", 4096))
+        )
+        # One long-lived, thread-safe Redis client per store (built lazily in _redis()).
+        self._redis_lock = threading.Lock()
+        self._redis_client: Optional[object] = None
+        self._redis_pool: Optional[object] = None
+        self._redis_retry_at = 0.0
+        self._redis_metrics_at = 0.0
+        # (vector index name | None, probed_at) — see _vector_index_name()
+        self._vector_index_probe: Optional[Tuple[Optional[str], float]] = None
         if not lazy:
             self._connect()
 
@@ -801,8 +822,19 @@ class ArangoStore:
 
     def set_snapshot_etag(self, etag: str) -> None:
         self.db.collection(self.meta_col).insert({"_key": "snapshot", "etag": etag}, overwrite=True)
+        # Read-your-writes in this process, then push to every reader process.
+        self._etag_cache.set(etag, source="write")
+        if publish_snapshot_etag(self._redis(), etag, self._etag_channel):
+            log_stage(logger, "snapshot", "snapshot_etag_published",
+                      snapshot_etag=etag, channel=self._etag_channel,
+                      request_id=(current_request_id() or "ingest"))
 
     def get_snapshot_etag(self) -> Optional[str]:
+        """Current snapshot ETag from the process-local holder (no I/O when fresh)."""
+        return self._etag_cache.get()
+
+    def read_snapshot_etag(self) -> Optional[str]:
+        """Authoritative read of the snapshot ETag from the meta collection."""
         if self.db is None:
             self._connect()
         if self.db is None or not hasattr(self.db, "collection"):
@@ -810,6 +842,10 @@ class ArangoStore:
         doc = self.db.collection(self.meta_col).get("snapshot")
         return doc.get("etag") if doc else None
 
+    def start_snapshot_etag_listener(self) -> None:
+        """Subscribe the ETag holder to snapshot pushes (idempotent; readers only)."""
+        self._etag_cache.start_listener(get_settings().redis_url, self._etag_channel)
+
     def prune_to_current_snapshot(self, anchors: List[str], edge_ids: List[str], *, request_id: str | None = None) -> Tuple[int, int, int]:
         """
         Remove any stored node/edge NOT present in the new snapshot.
@@ -894,8 +930,46 @@ class ArangoStore:
             # callers from crashing when a node is not found.
             return None
 
+    def get_nodes_bulk(self, node_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return ``{_key: raw node document}`` for every id in ``node_ids`` in a
+        single AQL round trip. Duplicates are collapsed and ids that do not
+        resolve to a document are simply absent from the mapping. Stub-mode
+        and driver errors yield an empty mapping (same semantics as get_node).
+        """
+        keys = sorted({k for k in (node_ids or []) if isinstance(k, str) and k})
+        if not keys:
+            return {}
+        if self.db is None or not hasattr(self.db, "aql"):
+            self._connect()
+            if self.db is None or not hasattr(self.db, "aql"):
+                return {}
+        t0 = time.perf_counter()
+        with trace_span("storage.arango.get_nodes_bulk", stage="storage") as sp:
+            try:
+                sp.set_attribute("requested", len(keys))
+            except Exception:
+                pass
+            try:
+                cursor = self.db.aql.execute(
+                    "FOR d IN DOCUMENT('nodes', @keys) FILTER d != null RETURN d",
+                    bind_vars={"keys": keys},
+                )
+                docs = self._cursor_to_list(cursor)
+            except (ArangoError, AttributeError, KeyError, TypeError):
+                docs = []
+        core_metrics.histogram_ms(
+            "arangodb.bulk_hydrate_ms",
+            (time.perf_counter() - t0) * 1_000,
+            component="core_storage",
+        )
+        return {d["_key"]: d for d in docs if isinstance(d, dict) and d.get("_key")}
+
     def get_enriched_decision(self, node_id: str) -> Optional[Dict[str, Any]]:
-        n = self.get_node(node_id)
+        return self._shape_enriched_decision(self.get_node(node_id))
+
+    @staticmethod
+    def _shape_enriched_decision(n: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         # Enrich only canonical decisions
         if not n or n.get("type") != "DECISION":
             return None
@@ -945,7 +1019,10 @@ class ArangoStore:
         return out
 
     def get_enriched_event(self, node_id: str) -> Optional[Dict[str, Any]]:
-        n = self.get_node(node_id)
+        return self._shape_enriched_event(self.get_node(node_id))
+
+    @staticmethod
+    def _shape_enriched_event(n: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         # Enrich only canonical events
         if not n or n.get("type") != "EVENT":
             return None
@@ -995,14 +1072,30 @@ class ArangoStore:
         """
         Generic enrich by storage key: route to specific enricher by node.type.
         """
-        n = self.get_node(storage_key)
+        return self._shape_enriched_node(self.get_node(storage_key))
+
+    def get_enriched_nodes_bulk(self, storage_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk ``get_enriched_node``: one AQL round trip for all keys, shaped per
+        node type. Keys that do not resolve are absent from the mapping.
+        """
+        docs = self.get_nodes_bulk(storage_keys)
+        out: Dict[str, Dict[str, Any]] = {}
+        for k, n in docs.items():
+            shaped = self._shape_enriched_node(n)
+            if shaped is not None:
+                out[k] = shaped
+        return out
+
+    @classmethod
+    def _shape_enriched_node(cls, n: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         if not n or "type" not in n:
             return None
         t = (n.get("type") or "").upper()
         if t == "DECISION":
-            return self.get_enriched_decision(storage_key)
+            return cls._shape_enriched_decision(n)
         if t == "EVENT":
-            return self.get_enriched_event(storage_key)
+            return cls._shape_enriched_event(n)
         # Future: return the stored node as a minimal enriched doc
         return {
             "id": n.get("_key"),
@@ -1018,12 +1111,77 @@ class ArangoStore:
     # Redis-backed caching utilities
     # ------------------------------------------------------------
 
+    _REDIS_RETRY_AFTER_S = 5.0
+    _REDIS_METRICS_EVERY_S = 1.0
+
     def _redis(self):
+        """Return the store's shared Redis client, or None when unavailable.
+
+        The client wraps a single ``BlockingConnectionPool`` sized from
+        ``STORAGE_REDIS_MAX_CONNECTIONS``; redis-py clients are thread-safe, so
+        request threads and ``asyncio.to_thread`` workers all reuse it.  Idle
+        connections are health-checked before reuse and a dropped socket is
+        retried once on a fresh connection, so a Redis restart costs one failed
+        command rather than a new client per call.  When the driver or URL is
+        unusable we back off for a few seconds instead of retrying per request.
+        """
+        client = self._redis_client
+        if client is not None:
+            self._record_redis_pool_metrics()
+            return client
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        with self._redis_lock:
+            if self._redis_client is not None:
+                return self._redis_client
+            cfg = get_settings()
+            try:
+                import redis  # type: ignore
+                from redis.backoff import NoBackoff  # type: ignore
+                from redis.retry import Retry  # type: ignore
+                pool = redis.BlockingConnectionPool.from_url(
+                    cfg.redis_url,
+                    max_connections=int(getattr(cfg, "storage_redis_max_connections", 32)),
+                    timeout=float(getattr(cfg, "storage_redis_pool_wait_ms", 50)) / 1000.0,
+                    socket_timeout=float(getattr(cfg, "redis_socket_timeout_ms", 250)) / 1000.0,
+                    socket_connect_timeout=float(getattr(cfg, "redis_connect_timeout_ms", 200)) / 1000.0,
+                    socket_keepalive=True,
+                    health_check_interval=int(getattr(cfg, "redis_health_check_interval_s", 30)),
+                    retry_on_timeout=True,
+                    retry=Retry(NoBackoff(), 1),
+                )
+                self._redis_client = redis.Redis(connection_pool=pool)
+                self._redis_pool = pool
+            except Exception as exc:
+                self._redis_retry_at = time.monotonic() + self._REDIS_RETRY_AFTER_S
+                core_metrics.counter("storage_redis_pool_init_failed_total", 1)
+                log_stage(logger, "redis", "storage_pool_unavailable",
+                          error=type(exc).__name__, request_id="storage")
+                return None
+            log_stage(logger, "redis", "storage_pool_init",
+                      max_connections=int(getattr(cfg, "storage_redis_max_connections", 32)),
+                      request_id="storage")
+            return self._redis_client
+
+    def _record_redis_pool_metrics(self) -> None:
+        """Publish pool occupancy gauges (throttled to once per second)."""
+        now = time.monotonic()
+        if now - self._redis_metrics_at < self._REDIS_METRICS_EVERY_S:
+            return
+        self._redis_metrics_at = now
+        pool = self._redis_pool
         try:
-            import redis  # type: ignore
-            return redis.Redis.from_url(get_settings().redis_url)
+            created = len(getattr(pool, "_connections", ()) or ())
+            idle = sum(1 for c in list(getattr(pool, "pool").queue) if c is not None)
+            core_metrics.gauge("storage_redis_pool_connections", created)
+            core_metrics.gauge("storage_redis_pool_in_use", max(0, created - idle))
+            core_metrics.gauge("storage_redis_pool_max", int(getattr(pool, "max_connections", 0) or 0))
         except Exception:
-            return None
+            pass
+
+    def _redis_error(self, op: str, exc: Exception) -> None:
+        """Count a failed cache command; the pool reconnects on next use."""
+        core_metrics.counter("storage_redis_errors_total", 1, op=op, error=type(exc).__name__)
 
     def _cache_get(self, key: str):
         r = self._redis()
@@ -1039,7 +1197,8 @@ class ArangoStore:
                 return jsonx.loads(v)
             # Cache miss – increment miss counter
             core_metrics.counter("cache_miss_total", 1, service="memory_api")
-        except Exception:
+        except Exception as exc:
+            self._redis_error("get", exc)
             return None
         return None
 
@@ -1052,7 +1211,8 @@ class ArangoStore:
             # This prevents fingerprint drift due to inconsistent key ordering
             # when reading cached data.
             r.setex(key, ttl, jsonx.dumps(value))
-        except Exception:
+        except Exception as exc:
+            self._redis_error("setex", exc)
             return
 
     # ------------------------------------------------------------
@@ -1189,6 +1349,54 @@ class ArangoStore:
         rows = self._cursor_to_list(cursor)
         return rows
 
+    def next_decisions_from_events(self, event_ids: List[str], limit: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bulk twin of ``next_decisions_from_event``: one AQL round trip for all
+        ``event_ids``. Returns ``{event_id: [rows]}`` with the same row shape,
+        ordering and domain scoping, plus ``node`` carrying the raw DECISION
+        document so callers can run ACL checks without re-fetching it.
+        Events that do not exist map to no entry.
+        """
+        ids = sorted({e for e in (event_ids or []) if isinstance(e, str) and e})
+        if not ids:
+            return {}
+        if self.db is None:
+            self._connect()
+        if self.db is None:
+            return {}
+        try:
+            lim = max(0, int(limit or 0))
+        except Exception:
+            lim = 3
+        graph_clause = f"GRAPH '{self._graph_name}'"
+        aql = f"""
+        FOR eid IN @event_ids
+          LET ev = DOCUMENT('nodes', eid)
+          FILTER ev != null
+          LET rows = (
+            FOR v, e IN 1..1 OUTBOUND ev {graph_clause}
+              FILTER e.type IN ['LED_TO','CAUSAL']
+              FILTER v.type == 'DECISION' && v.domain == ev.domain
+              SORT e.timestamp DESC, v.timestamp DESC, v._key ASC
+              LIMIT @limit
+              RETURN {{
+                id: v._key,
+                title: v.title,
+                domain: v.domain,
+                timestamp: v.timestamp,
+                edge: {{ type: e.type, timestamp: e.timestamp }},
+                node: v
+              }}
+          )
+          RETURN {{ event_id: eid, decisions: rows }}
+        """
+        cursor = self.db.aql.execute(aql, bind_vars={"event_ids": ids, "limit": lim})
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self._cursor_to_list(cursor):
+            if isinstance(row, dict) and row.get("event_id"):
+                out[str(row["event_id"])] = list(row.get("decisions") or [])
+        return out
+
     # ------------------------------------------------------------
     # Text & vector resolver
     # ------------------------------------------------------------
@@ -1244,73 +1452,11 @@ class ArangoStore:
                 "meta": {"snapshot_etag": ""},
             }
         results: List[Dict[str, Any]] = []
-        if use_vector and settings.enable_embeddings:
-            vector_idx_enabled = os.getenv("ARANGO_VECTOR_INDEX_ENABLED", "false").lower() == "true"
-            if vector_idx_enabled and query_vector is not None:
-                try:
-                    aql = (
-                        "FOR d IN nodes FILTER HAS(d,'embedding') "
-                        "LET score = COSINE_SIMILARITY(d.embedding, @qv) "
-                        "SORT score DESC LIMIT @limit "
-                        "RETURN {id: d._key, score: score, title: d.title, type: d.type}"
-                    )
-                    # Bind the embedding under ``@qv``.  Passing the raw query under
-                    # ``q`` previously left @qv undefined and prevented cosine similarity
-                    # from working when the vector index is disabled.
-                    with trace_span("storage.arango.aql.vector", stage="resolver") as sp:
-                        try:
-                            # Record query attributes.  Include limit, metric and embedding dimensionality
-                            sp.set_attribute("limit", limit)
-                            sp.set_attribute("metric", "cosine")
-                            if query_vector is not None:
-                                sp.set_attribute("vector_dim", len(query_vector))
-                        except Exception:
-                            pass
-                        cursor = self.db.aql.execute(aql, bind_vars={"qv": query_vector, "limit": limit})
-                        results = self._cursor_to_list(cursor)
-                        # Attach the number of results to the span for trace introspection
-                        try:
-                            sp.set_attribute("result_count", len(results))
-                        except Exception:
-                            pass
-                    if hasattr(self.db, "aql"):
-                        self.db.aql.latest_query = aql  # type: ignore[attr-defined]
-                    resp = {"query": q, "matches": results, "vector_used": True}
-                    self._cache_set(key, resp, int(TTL_EVIDENCE_CACHE_SEC))
-                    return resp
-                except Exception:
-                    pass
-            elif use_vector and not vector_idx_enabled and query_vector is not None:
-                try:
-                    aql = (
-                        "FOR d IN nodes FILTER HAS(d,'embedding') "
-                        "LET score = COSINE_SIMILARITY(d.embedding, @qv) "
-                        "SORT score DESC LIMIT @limit "
-                        "RETURN {id: d._key, score: score, title: d.title, type: d.type}"
-                    )
-                    with trace_span("storage.arango.aql.vector", stage="resolver") as sp:
-                        try:
-                            # Record query attributes.  Include limit, metric and embedding dimensionality
-                            sp.set_attribute("limit", limit)
-                            sp.set_attribute("metric", "cosine")
-                            if query_vector is not None:
-                                sp.set_attribute("vector_dim", len(query_vector))
-                        except Exception:
-                            pass
-                        cursor = self.db.aql.execute(aql, bind_vars={"qv": query_vector, "limit": limit})
-                        results = self._cursor_to_list(cursor)
-                        # Attach the number of results to the span for trace introspection
-                        try:
-                            sp.set_attribute("result_count", len(results))
-                        except Exception:
-                            pass
-                    if hasattr(self.db, "aql"):
-                        self.db.aql.latest_query = aql  # type: ignore[attr-defined]
-                    resp = {"query": q, "matches": results, "vector_used": True}
-                    self._cache_set(key, resp, int(TTL_EVIDENCE_CACHE_SEC))
-                    return resp
-                except Exception:
-                    pass
+        if use_vector and settings.enable_embeddings and query_vector is not None:
+            resp = self._vector_search(q, query_vector, limit)
+            if resp is not None:
+                self._cache_set(key, resp, int(TTL_EVIDENCE_CACHE_SEC))
+                return resp
         try:
             # The BM25 search uses the ArangoSearch view ``nodes_search`` (v3: title & description only).
             aql = (
@@ -1381,6 +1527,123 @@ class ArangoStore:
         resp = {"query": q, "matches": results, "vector_used": False}
         self._cache_set(key, resp, int(TTL_EVIDENCE_CACHE_SEC))
         return resp
+
+    # ------------------------------------------------------------
+    # Vector retrieval (ANN index with exact-scan fallback)
+    # ------------------------------------------------------------
+
+    # metric → (ANN function, exact function, sort order)
+    _VECTOR_FUNCS = {
+        "cosine": ("APPROX_NEAR_COSINE", "COSINE_SIMILARITY", "DESC"),
+        "l2": ("APPROX_NEAR_L2", "L2_DISTANCE", "ASC"),
+    }
+    _VECTOR_INDEX_PROBE_TTL_S = 60.0
+
+    def _vector_index_name(self) -> Optional[str]:
+        """Return the vector index on ``nodes.embedding`` if one exists.
+
+        The probe result is held for ``_VECTOR_INDEX_PROBE_TTL_S`` so the hot path
+        does not list indexes per query; indexes are built in the background and
+        may appear after bootstrap.
+        """
+        now = time.monotonic()
+        probe = self._vector_index_probe
+        if probe is not None and (now - probe[1]) < self._VECTOR_INDEX_PROBE_TTL_S:
+            return probe[0]
+        name: Optional[str] = None
+        try:
+            for idx in self.db.collection("nodes").indexes():  # type: ignore[union-attr]
+                if str(idx.get("type")) == "vector" and "embedding" in (idx.get("fields") or []):
+                    name = str(idx.get("name") or "vector")
+                    break
+        except Exception as exc:
+            log_stage(logger, "resolver", "vector_index_probe_failed",
+                      error=type(exc).__name__, request_id=(current_request_id() or "resolver"))
+        self._vector_index_probe = (name, now)
+        return name
+
+    def _vector_search(self, q: str, query_vector: List[float], limit: int) -> Optional[dict]:
+        """Top-k semantic matches for *query_vector*.
+
+        With a vector index present the query takes the ANN path: the index
+        yields ``VECTOR_ANN_CANDIDATES`` approximate neighbours which are then
+        re-scored exactly and cut to top-k.  The full collection scan is used
+        only when no index exists (or ``ARANGO_VECTOR_INDEX_ENABLED=false``).
+        The path taken is returned as ``vector_path`` ("ann" | "exact").
+        Returns None on query failure so the caller falls back to BM25.
+        """
+        settings = get_settings()
+        try:
+            top_k = max(1, min(int(limit), int(getattr(settings, "vector_ann_top_k", 50))))
+        except (TypeError, ValueError):
+            top_k = 10
+        metric = str(getattr(settings, "vector_metric", "cosine") or "cosine").lower()
+        approx_fn, exact_fn, order = self._VECTOR_FUNCS.get(metric, self._VECTOR_FUNCS["cosine"])
+        index_name = (
+            self._vector_index_name()
+            if getattr(settings, "arango_vector_index_enabled", True) else None
+        )
+        bind_vars: Dict[str, Any] = {"qv": query_vector, "limit": top_k}
+        if index_name:
+            path = "ann"
+            bind_vars["candidates"] = max(top_k, int(getattr(settings, "vector_ann_candidates", 200)))
+            opts = ""
+            nprobe = os.getenv("IVF_NUMPROBES")
+            if nprobe and nprobe.isdigit():
+                bind_vars["opts"] = {"nProbe": int(nprobe)}
+                opts = ", @opts"
+            aql = (
+                "FOR d IN nodes "
+                f"LET approx = {approx_fn}(d.embedding, @qv{opts}) "
+                f"SORT approx {order} LIMIT @candidates "
+                f"LET score = {exact_fn}(d.embedding, @qv) "
+                f"SORT score {order} LIMIT @limit "
+                "RETURN {id: d._key, score: score, title: d.title, type: d.type}"
+            )
+        else:
+            path = "exact"
+            aql = (
+                "FOR d IN nodes FILTER HAS(d,'embedding') "
+                f"LET score = {exact_fn}(d.embedding, @qv) "
+                f"SORT score {order} LIMIT @limit "
+                "RETURN {id: d._key, score: score, title: d.title, type: d.type}"
+            )
+        t0 = time.perf_counter()
+        try:
+            with trace_span("storage.arango.aql.vector", stage="resolver") as sp:
+                try:
+                    sp.set_attribute("limit", top_k)
+                    sp.set_attribute("metric", metric)
+                    sp.set_attribute("vector_path", path)
+                    sp.set_attribute("vector_dim", len(query_vector))
+                    if index_name:
+                        sp.set_attribute("index_name", index_name)
+                        sp.set_attribute("candidates", bind_vars["candidates"])
+                except Exception:
+                    pass
+                cursor = self.db.aql.execute(aql, bind_vars=bind_vars)  # type: ignore[union-attr]
+                results = self._cursor_to_list(cursor)
+                try:
+                    sp.set_attribute("result_count", len(results))
+                except Exception:
+                    pass
+        except Exception as exc:
+            if index_name:
+                # Index may have been dropped or is still training; re-probe next time.
+                self._vector_index_probe = None
+            log_stage(logger, "resolver", "vector_search_failed",
+                      vector_path=path, error=type(exc).__name__,
+                      request_id=(current_request_id() or "resolver"))
+            return None
+        ms = (time.perf_counter() - t0) * 1_000
+        core_metrics.histogram_ms("arangodb.vector_search_ms", ms, component="core_storage", path=path)
+        core_metrics.counter("resolver_vector_path_total", 1, path=path)
+        log_stage(logger, "resolver", "vector_search",
+                  vector_path=path, top_k=top_k, result_count=len(results), latency_ms=int(ms),
+                  request_id=(current_request_id() or "resolver"))
+        if hasattr(self.db, "aql"):
+            self.db.aql.latest_query = aql  # type: ignore[attr-defined]
+        return {"query": q, "matches": results, "vector_used": True, "vector_path": path}
     
     # ──────────────────────────────────────────────────────────────────────────
     # Internal helpers
@@ -1438,6 +1701,89 @@ class ArangoStore:
         res = self._cursor_to_list(cursor)
         return (res[0] if res else node_id)
     
+    # ------------------------------------------------------------
+    # Combined enrich read: node + 1-hop edges
+    # ------------------------------------------------------------
+    def get_enrich_context(self, storage_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Everything an enrich needs around one node, from a single AQL query:
+            {"node": raw doc, "enriched": shaped doc (as get_enriched_node),
+             "edges": [...] (as get_edges_adjacent)}
+        The edges view is primed into the adjacency cache so a follow-up
+        expand/scope for the same anchor needs no traversal.  Only edge fields
+        are projected from the traversal; neighbor documents (and their
+        embeddings) never leave the server.  Returns None when the node does
+        not exist or no database is available.
+        """
+        if self.db is None:
+            self._connect()
+        if self.db is None:
+            return None
+        graph_clause = f"GRAPH '{self._graph_name}'"
+        aql = f"""
+        LET anchor = DOCUMENT('nodes', @anchor)
+        LET out_e = (
+          anchor == null ? [] : (
+            FOR v, e IN 1..1 OUTBOUND anchor {graph_clause}
+              LET etype = e.type
+              RETURN {{
+                type: etype, from: anchor._key, to: v._key, timestamp: e.timestamp,
+                domain: (etype == 'ALIAS_OF' ? v.domain : null)
+              }}
+          )
+        )
+        LET in_e = (
+          anchor == null ? [] : (
+            FOR v, e IN 1..1 INBOUND anchor {graph_clause}
+              LET etype = e.type
+              RETURN {{
+                type: etype, from: v._key, to: anchor._key, timestamp: e.timestamp,
+                domain: (etype == 'ALIAS_OF' ? v.domain : null)
+              }}
+          )
+        )
+        RETURN {{
+          node: anchor,
+          edges: UNIQUE(APPEND(out_e, in_e))
+        }}
+        """
+        t0 = time.perf_counter()
+        with trace_span("storage.arango.enrich_context", stage="enrich") as sp:
+            try:
+                cursor = self.db.aql.execute(aql, bind_vars={"anchor": storage_key})
+                rows = self._cursor_to_list(cursor)
+            except (ArangoError, AttributeError, KeyError, TypeError):
+                rows = []
+            row = rows[0] if rows else {}
+            node = row.get("node") if isinstance(row, dict) else None
+            try:
+                sp.set_attribute("found", bool(node))
+                sp.set_attribute("edge_count", len(row.get("edges") or []) if node else 0)
+            except Exception:
+                pass
+        core_metrics.histogram_ms(
+            "arangodb.enrich_context_ms",
+            (time.perf_counter() - t0) * 1_000,
+            component="core_storage",
+        )
+        if not isinstance(node, dict):
+            return None
+        edges = [e for e in (row.get("edges") or []) if isinstance(e, dict)]
+        try:
+            etag = self.get_snapshot_etag() or ""
+        except Exception:
+            etag = ""
+        self._adjacency_cache.put(etag, storage_key, {
+            "anchor": node.get("_key") or storage_key,
+            "edges": edges,
+            "meta": {"snapshot_etag": etag},
+        })
+        return {
+            "node": node,
+            "enriched": self._shape_enriched_node(node),
+            "edges": [dict(e) for e in edges],
+        }
+
     # ------------------------------------------------------------
     # Edges-only adjacent view (k=1) — OPTIONAL new read
     # ------------------------------------------------------------
@@ -1445,6 +1791,8 @@ class ArangoStore:
         """
         Return all edges touching `anchor_id` (INBOUND + OUTBOUND), as stored:
         {type, from, to, timestamp, domain?}. No orientation or alias tails here.
+        Results are memoised per (snapshot etag, anchor) and dropped when the
+        snapshot changes; callers always receive their own copy.
         """
         if self.db is None:
             self._connect()
@@ -1452,6 +1800,27 @@ class ArangoStore:
             # Stub-mode
             return {"anchor": anchor_id, "edges": [], "meta": {"snapshot_etag": ""}}
 
+        try:
+            etag = self.get_snapshot_etag() or ""
+        except Exception:
+            etag = ""
+        cached = self._adjacency_cache.get(etag, anchor_id)
+        if cached is not None:
+            return self._copy_adjacency(cached)
+        view = self._query_edges_adjacent(anchor_id)
+        view.setdefault("meta", {})["snapshot_etag"] = etag
+        self._adjacency_cache.put(etag, anchor_id, view)
+        return self._copy_adjacency(view)
+
+    @staticmethod
+    def _copy_adjacency(view: dict) -> dict:
+        out = dict(view)
+        out["edges"] = [dict(e) if isinstance(e, dict) else e for e in (view.get("edges") or [])]
+        out["meta"] = dict(view.get("meta") or {})
+        return out
+
+    def _query_edges_adjacent(self, anchor_id: str) -> dict:
+
         graph_clause = f"GRAPH '{self._graph_name}'"
         aql = f"""
         LET anchor = DOCUMENT('nodes', @anchor)
@@ -1490,9 +1859,4 @@ class ArangoStore:
         """
         cursor = self.db.aql.execute(aql, bind_vars={"anchor": anchor_id})
         docs = self._cursor_to_list(cursor)
-        view = docs[0] if docs else {"anchor": anchor_id, "edges": []}
-        try:
-            view.setdefault("meta", {})["snapshot_etag"] = self.get_snapshot_etag() or ""
-        except Exception:
-            pass
-        return view
+        return docs[0] if docs else {"anchor": anchor_id, "edges": []}
@@ -8,6 +8,7 @@ from typing import Dict, Tuple
 from core_utils import jsonx
 from core_logging import get_logger, log_stage
 from core_utils.backoff import compute_backoff_delay_ms
+from .minio_utils import run_parallel_transfers
 try:
     # MinIO / S3 client error type
     from minio.error import S3Error  # type: ignore
@@ -44,9 +45,20 @@ def build_named_bundles(artefacts: Dict[str, bytes], bundle_map: Dict[str, list[
     meta_bytes = jsonx.dumps(meta).encode("utf-8")
     return bundles, meta_bytes
 
-def upload_named_bundles(client, bucket: str, request_id: str, bundles: Dict[str, bytes], meta_bytes: bytes) -> None:
+def upload_named_bundles(
+    client,
+    bucket: str,
+    request_id: str,
+    bundles: Dict[str, bytes],
+    meta_bytes: bytes,
+    *,
+    max_workers: int = 4,
+    timeout_s: float = 30.0,
+) -> None:
     """
     Upload multiple bundles and a shared meta sidecar to object storage.
+    Objects are independent, so they are uploaded in parallel (each with its
+    own retry loop); the first terminal failure is raised.
     """
     # Env-driven retry knobs (fall back to HTTP defaults if provided there)
     max_retries = int(os.getenv("MINIO_MAX_RETRIES", "3"))
@@ -93,27 +105,18 @@ def upload_named_bundles(client, bucket: str, request_id: str, bundles: Dict[str
         # Continue if bucket already exists or creation is racing elsewhere
         pass
 
-    # Upload bundles
-    for name, blob in bundles.items():
-        _retry(
-            "put_object",
-            client.put_object,
-            bucket,
-            f"{request_id}/{name}.tar.gz",
-            io.BytesIO(blob),
-            length=len(blob),
-            content_type="application/gzip",
-        )
-    # Per-request meta for list views
-    _retry(
-        "put_object",
-        client.put_object,
-        bucket,
-        f"{request_id}/_index.json",
-        io.BytesIO(meta_bytes),
-        length=len(meta_bytes),
-        content_type="application/json",
-    )
+    # Upload bundles + per-request meta for list views
+    objects = {f"{request_id}/{name}.tar.gz": (blob, "application/gzip") for name, blob in bundles.items()}
+    objects[f"{request_id}/_index.json"] = (meta_bytes, "application/json")
+    jobs = {
+        obj: (lambda o=obj, b=blob, c=ctype: _retry(
+            "put_object", client.put_object, bucket, o, io.BytesIO(b), length=len(b), content_type=c,
+        ))
+        for obj, (blob, ctype) in objects.items()
+    }
+    _, errors = run_parallel_transfers("put", jobs, max_workers=max_workers, timeout_s=timeout_s)
+    if errors:
+        raise next(iter(errors.values()))
     log_stage(logger, "artifacts", "named_bundles_upload_ok",
               request_id=request_id, bundle_count=len(bundles))
 
@@ -1,5 +1,11 @@
+import io
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as _wait_futures
 from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
+import core_metrics
 from core_logging import get_logger, log_stage
 try:
     from minio.error import S3Error
@@ -78,4 +84,183 @@ def ensure_bucket(client, bucket: str, retention_days: int, *, request_id: str |
         created_ts=datetime.utcnow().isoformat() if newly_created else None,
         request_id=(request_id or "startup"),
     )
-    return {"bucket": bucket, "newly_created": newly_created, "retention_days": retention_days}
\ No newline at end of file
+    return {"bucket": bucket, "newly_created": newly_created, "retention_days": retention_days}
+
+
+# ---------------------------------------------------------------------------
+# Pooled HTTP transport + bounded parallel transfers
+# ---------------------------------------------------------------------------
+
+def build_http_pool(
+    *,
+    max_connections: int = 32,
+    connect_timeout_s: float = 1.0,
+    read_timeout_s: float = 5.0,
+    secure: bool = False,
+):
+    """
+    urllib3 PoolManager for ``Minio(http_client=...)``.
+
+    The SDK default keeps 10 sockets and a 5-minute socket timeout; we size
+    the pool for the transfer fan-out and bound every request so a stuck
+    object fails fast instead of holding a worker.
+    """
+    import urllib3  # installed with minio
+
+    kwargs: Dict[str, Any] = {
+        "num_pools": 4,
+        "maxsize": max(1, int(max_connections)),
+        "block": False,
+        "timeout": urllib3.Timeout(connect=connect_timeout_s, read=read_timeout_s),
+        "retries": urllib3.Retry(
+            total=2, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504],
+        ),
+    }
+    if secure:
+        try:
+            import certifi  # type: ignore
+            kwargs.update(cert_reqs="CERT_REQUIRED", ca_certs=certifi.where())
+        except ImportError:  # pragma: no cover
+            kwargs.update(cert_reqs="CERT_REQUIRED")
+    return urllib3.PoolManager(**kwargs)
+
+
+_TRANSFER_LOCK = threading.Lock()
+_TRANSFER_POOL: Optional[ThreadPoolExecutor] = None
+_TRANSFER_POOL_SIZE = 0
+_INFLIGHT = 0
+
+
+def _transfer_pool(max_workers: int) -> ThreadPoolExecutor:
+    global _TRANSFER_POOL, _TRANSFER_POOL_SIZE
+    with _TRANSFER_LOCK:
+        if _TRANSFER_POOL is None or max_workers > _TRANSFER_POOL_SIZE:
+            # Grow only; the old pool drains its queued work and exits.
+            old = _TRANSFER_POOL
+            _TRANSFER_POOL = ThreadPoolExecutor(
+                max_workers=max(1, int(max_workers)), thread_name_prefix="minio-xfer",
+            )
+            _TRANSFER_POOL_SIZE = max(1, int(max_workers))
+            if old is not None:
+                old.shutdown(wait=False)
+        return _TRANSFER_POOL
+
+
+def _track_inflight(delta: int, op: str) -> None:
+    global _INFLIGHT
+    with _TRANSFER_LOCK:
+        _INFLIGHT += delta
+        current = _INFLIGHT
+    core_metrics.gauge("minio_inflight_transfers", current)
+    if delta > 0:
+        core_metrics.counter("minio_transfers_total", 1, op=op)
+
+
+def run_parallel_transfers(
+    op: str,
+    jobs: Mapping[str, Callable[[], Any]],
+    *,
+    max_workers: int,
+    timeout_s: float,
+) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+    """
+    Run independent transfer jobs with bounded parallelism.
+
+    Wall time tracks the slowest object rather than the sum. ``timeout_s`` is
+    the per-object budget, counted from the moment a worker picks the job up:
+    the pool is shared across callers, so time spent queued behind other
+    batches never counts against a job. Jobs still running past their budget
+    are reported as ``TimeoutError`` (their sockets are bounded by the pooled
+    transport, which also bounds how long a queued job waits for a worker).
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    if not jobs:
+        return results, errors
+
+    budget = max(0.05, float(timeout_s))
+    started: Dict[str, float] = {}
+
+    def _call(key: str, fn: Callable[[], Any]) -> Any:
+        started[key] = time.monotonic()
+        _track_inflight(1, op)
+        try:
+            return fn()
+        finally:
+            _track_inflight(-1, op)
+
+    pool = _transfer_pool(max(1, int(max_workers)))
+    futures = {pool.submit(_call, key, fn): key for key, fn in jobs.items()}
+    pending = set(futures)
+    while pending:
+        for fut in [f for f in pending if f.done()]:
+            pending.discard(fut)
+            key = futures[fut]
+            exc = fut.exception()
+            if exc is None:
+                results[key] = fut.result()
+            else:
+                errors[key] = exc
+        now = time.monotonic()
+        deadlines = {f: started[futures[f]] + budget for f in pending if futures[f] in started}
+        for fut, deadline in deadlines.items():
+            if deadline <= now:
+                pending.discard(fut)
+                errors[futures[fut]] = TimeoutError(f"{op} exceeded {timeout_s:.3f}s")
+        if not pending:
+            break
+        live = [d for f, d in deadlines.items() if f in pending]
+        wait_s = (min(live) - now) if live else budget
+        _wait_futures(pending, timeout=max(0.0, wait_s), return_when=FIRST_COMPLETED)
+    if errors:
+        core_metrics.counter("minio_transfer_errors_total", len(errors), op=op)
+    return results, errors
+
+
+def put_objects_parallel(
+    client,
+    bucket: str,
+    objects: Mapping[str, Tuple[bytes, str]],
+    *,
+    max_workers: int = 8,
+    timeout_s: float = 5.0,
+) -> Dict[str, BaseException]:
+    """
+    Upload ``{object_name: (payload, content_type)}`` concurrently.
+    Returns ``{object_name: error}`` for the objects that failed (empty on success).
+    """
+    def _put(name: str, blob: bytes, ctype: str) -> None:
+        client.put_object(bucket, name, io.BytesIO(blob), length=len(blob), content_type=ctype)
+
+    jobs = {
+        name: (lambda n=name, b=blob, c=ctype: _put(n, b, c))
+        for name, (blob, ctype) in objects.items()
+    }
+    t0 = time.perf_counter()
+    _, errors = run_parallel_transfers("put", jobs, max_workers=max_workers, timeout_s=timeout_s)
+    core_metrics.histogram_ms("minio_put_batch_ms", (time.perf_counter() - t0) * 1000.0)
+    return errors
+
+
+def get_objects_parallel(
+    client,
+    bucket: str,
+    object_names: Sequence[str],
+    *,
+    max_workers: int = 8,
+    timeout_s: float = 5.0,
+) -> Tuple[Dict[str, bytes], Dict[str, BaseException]]:
+    """Download objects concurrently; returns ``(payloads, errors)`` keyed by object name."""
+    def _get(name: str) -> bytes:
+        resp = client.get_object(bucket, name)
+        try:
+            return resp.read()
+        finally:
+            resp.close()
+            resp.release_conn()
+
+    jobs = {name: (lambda n=name: _get(n)) for name in object_names}
+    t0 = time.perf_counter()
+    payloads, errors = run_parallel_transfers("get", jobs, max_workers=max_workers, timeout_s=timeout_s)
+    core_metrics.histogram_ms("minio_get_batch_ms", (time.perf_counter() - t0) * 1000.0)
+    return payloads, errors
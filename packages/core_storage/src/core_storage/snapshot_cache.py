@@ -0,0 +1,256 @@
+"""
+Process-local snapshot ETag holder.
+
+Every read path (412 preconditions, storage cache keys, response headers)
+needs the current snapshot ETag, but the authoritative copy lives in the
+ArangoDB ``meta`` collection. ``SnapshotEtagCache`` keeps the last known value
+in memory and refreshes it from two sources:
+
+  • push   – ingest publishes the new ETag on a Redis pub/sub channel when it
+             calls ``ArangoStore.set_snapshot_etag`` (bumping the cache
+             generation when the ETag changed); a daemon thread applies it.
+  • poll   – a bounded fallback: while the channel is down, readers reload at
+             most once per ``poll_s``; while it is up, the thread reloads every
+             ``max_age_s / 2`` as a safety net against a missed message.
+
+``get()`` only touches the loader when the cached value is older than
+``max_age_s`` (``poll_s`` while no push channel is connected), so in steady
+state an ETag read costs no I/O.
+
+``SnapshotScopedLRU`` builds on that: a bounded memo for per-snapshot
+derived data (e.g. 1-hop adjacency) that flushes itself when the ETag moves.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import core_metrics
+from core_logging import get_logger, log_stage
+from core_cache.generation import BUMP_GENERATION_LUA, GENERATION_ETAG_KEY, GENERATION_KEY
+
+logger = get_logger("core_storage.snapshot_cache")
+
+SNAPSHOT_ETAG_CHANNEL = "bv:snapshot:v1:etag"
+
+_UNSET = object()
+
+
+class SnapshotEtagCache:
+    """Thread-safe holder for the current snapshot ETag (see module docstring)."""
+
+    def __init__(
+        self,
+        loader: Callable[[], Optional[str]],
+        *,
+        poll_s: float = 1.0,
+        max_age_s: float = 30.0,
+    ) -> None:
+        self._loader = loader
+        self._poll_s = max(0.05, float(poll_s))
+        self._max_age_s = max(self._poll_s, float(max_age_s))
+        self._lock = threading.Lock()
+        self._value: object = _UNSET
+        self._loaded_at = 0.0
+        self._subscribed = False
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Reads / writes
+    # ------------------------------------------------------------------
+    def get(self) -> Optional[str]:
+        """Return the cached ETag; reload synchronously only when stale."""
+        value, loaded_at = self._value, self._loaded_at
+        # Trust the cached value longer only while push updates are flowing.
+        max_age = self._max_age_s if self._subscribed else self._poll_s
+        if value is not _UNSET and (time.monotonic() - loaded_at) < max_age:
+            core_metrics.counter("snapshot_etag_cache_hit_total", 1)
+            return value  # type: ignore[return-value]
+        core_metrics.counter("snapshot_etag_cache_miss_total", 1)
+        return self.refresh()
+
+    def peek(self) -> Optional[str]:
+        """Return the cached value (None when never loaded) without any I/O."""
+        value = self._value
+        return None if value is _UNSET else value  # type: ignore[return-value]
+
+    def set(self, etag: Optional[str], *, source: str = "local") -> None:
+        """Install a known-current ETag (write path or push message)."""
+        with self._lock:
+            previous = self._value
+            self._value = etag
+            self._loaded_at = time.monotonic()
+        if previous is not _UNSET and previous != etag:
+            log_stage(logger, "snapshot", "snapshot_etag_changed",
+                      source=source, snapshot_etag=(etag or ""), request_id="snapshot")
+            core_metrics.counter("snapshot_etag_cache_update_total", 1, source=source)
+
+    def refresh(self) -> Optional[str]:
+        """Reload from the loader (single-flight across threads)."""
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock.
+            if self._value is not _UNSET and (time.monotonic() - self._loaded_at) < self._poll_s:
+                return self._value  # type: ignore[return-value]
+            value = self._loader()
+            self._value = value
+            self._loaded_at = time.monotonic()
+        core_metrics.counter("snapshot_etag_cache_reload_total", 1)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = _UNSET
+            self._loaded_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Background push listener + polling fallback
+    # ------------------------------------------------------------------
+    def start_listener(self, redis_url: Optional[str], channel: str = SNAPSHOT_ETAG_CHANNEL) -> None:
+        """Start the daemon refresher once; safe to call repeatedly."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(redis_url, channel),
+            name="snapshot-etag-listener", daemon=True,
+        )
+        self._thread.start()
+
+    def stop_listener(self) -> None:
+        self._stop.set()
+
+    def _reload_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:  # loader errors must never kill the thread
+            log_stage(logger, "snapshot", "snapshot_etag_reload_failed",
+                      error=type(exc).__name__, request_id="snapshot")
+
+    def _run(self, redis_url: Optional[str], channel: str) -> None:
+        attempt = 0
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                import redis  # type: ignore
+                if not redis_url:
+                    raise RuntimeError("redis_url_missing")
+                client = redis.Redis.from_url(redis_url, socket_keepalive=True, health_check_interval=30)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                self._subscribed = True
+                attempt = 0
+                log_stage(logger, "snapshot", "snapshot_etag_subscribed",
+                          channel=channel, request_id="startup")
+                # Pick up anything published while we were disconnected.
+                self._reload_quietly()
+                last_reload = time.monotonic()
+                while not self._stop.is_set():
+                    msg = pubsub.get_message(timeout=self._poll_s)
+                    if msg and msg.get("type") == "message":
+                        data = msg.get("data")
+                        if isinstance(data, (bytes, bytearray)):
+                            data = data.decode("utf-8", "replace")
+                        self.set(str(data or "").strip() or None, source="push")
+                        last_reload = time.monotonic()
+                    elif (time.monotonic() - last_reload) >= self._max_age_s / 2:
+                        self._reload_quietly()
+                        last_reload = time.monotonic()
+            except Exception as exc:
+                self._subscribed = False
+                attempt += 1
+                if attempt == 1:
+                    log_stage(logger, "snapshot", "snapshot_etag_listener_degraded",
+                              error=type(exc).__name__, channel=channel, request_id="snapshot")
+                # Polling fallback while the channel is unavailable.
+                self._reload_quietly()
+                self._stop.wait(min(self._poll_s * attempt, self._max_age_s / 2))
+            finally:
+                self._subscribed = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+def publish_snapshot_etag(client, etag: str, channel: str = SNAPSHOT_ETAG_CHANNEL) -> bool:
+    """Best-effort publish of a new snapshot ETag; returns True when sent.
+
+    Callers may publish the same ETag more than once (one ingest run does:
+    ``upsert_pipeline`` and then the CLI). The cache generation is bumped in
+    the same script only when the ETag differs from the last published one,
+    so a repeat publish is a plain notification and never makes the reaper
+    retire the current working set (see ``core_cache.generation``).
+    """
+    if client is None:
+        return False
+    try:
+        generation, changed = client.eval(
+            BUMP_GENERATION_LUA, 2, GENERATION_KEY, GENERATION_ETAG_KEY, etag, channel)
+        if int(changed):
+            log_stage(logger, "snapshot", "cache_generation_bumped",
+                      generation=int(generation), snapshot_etag=etag, request_id="snapshot")
+        return True
+    except Exception as exc:
+        log_stage(logger, "snapshot", "snapshot_etag_publish_failed",
+                  error=type(exc).__name__, channel=channel, request_id="snapshot")
+        return False
+
+
+class SnapshotScopedLRU:
+    """Bounded, thread-safe LRU whose entries are valid for one snapshot only.
+
+    Values are stored under ``(snapshot_etag, key)``; the first access with a
+    different ETag drops every entry, so nothing computed against an old
+    snapshot is ever served after the snapshot moves on.
+    """
+
+    def __init__(self, name: str, max_entries: int = 4096) -> None:
+        self._name = name
+        self._max = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._etag: Optional[str] = None
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _roll(self, etag: str) -> None:
+        # Caller holds the lock.
+        if etag != self._etag:
+            if self._data:
+                core_metrics.counter("snapshot_lru_flush_total", 1, cache=self._name)
+            self._data.clear()
+            self._etag = etag
+
+    def get(self, etag: Optional[str], key: Hashable) -> Any:
+        if not etag:
+            return None
+        with self._lock:
+            self._roll(etag)
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+        core_metrics.counter(
+            f"{self._name}_cache_{'hit' if value is not None else 'miss'}_total", 1
+        )
+        return value
+
+    def put(self, etag: Optional[str], key: Hashable, value: Any) -> None:
+        if not etag or value is None:
+            return
+        with self._lock:
+            self._roll(etag)
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+                core_metrics.counter(f"{self._name}_cache_evict_total", 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._etag = None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,74 @@
+"""
+``run_parallel_transfers`` budgets: each job gets ``timeout_s`` from the
+moment a worker starts it, even when the shared pool is busy with another
+caller's batch.
+"""
+import threading
+import time
+
+import pytest
+
+from core_storage import minio_utils
+from core_storage.minio_utils import run_parallel_transfers
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    monkeypatch.setattr(minio_utils, "_TRANSFER_POOL", None)
+    monkeypatch.setattr(minio_utils, "_TRANSFER_POOL_SIZE", 0)
+    yield
+    pool = minio_utils._TRANSFER_POOL
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _sleep(seconds, value=None):
+    def _job():
+        time.sleep(seconds)
+        return value
+    return _job
+
+
+def test_all_jobs_complete():
+    results, errors = run_parallel_transfers(
+        "put", {f"o{i}": _sleep(0.01, i) for i in range(5)}, max_workers=2, timeout_s=1.0,
+    )
+    assert errors == {}
+    assert results == {f"o{i}": i for i in range(5)}
+
+
+def test_queued_jobs_are_not_charged_for_another_callers_batch():
+    release = threading.Event()
+    other = threading.Thread(target=run_parallel_transfers, args=(
+        "put", {"a": release.wait, "b": release.wait},
+    ), kwargs={"max_workers": 2, "timeout_s": 5.0})
+    other.start()
+    time.sleep(0.05)  # the other batch now holds both workers
+    threading.Timer(0.3, release.set).start()
+    try:
+        results, errors = run_parallel_transfers(
+            "get", {"x": _sleep(0.01, b"x"), "y": _sleep(0.01, b"y")}, max_workers=2, timeout_s=0.2,
+        )
+    finally:
+        release.set()
+        other.join()
+    assert errors == {}
+    assert results == {"x": b"x", "y": b"y"}
+
+
+def test_job_over_its_own_budget_times_out():
+    results, errors = run_parallel_transfers(
+        "put", {"fast": _sleep(0.01, 1), "slow": _sleep(0.5, 2)}, max_workers=2, timeout_s=0.1,
+    )
+    assert results == {"fast": 1}
+    assert isinstance(errors["slow"], TimeoutError)
+
+
+def test_job_errors_are_reported():
+    def _boom():
+        raise OSError("connection reset")
+
+    results, errors = run_parallel_transfers("put", {"ok": _sleep(0, 1), "bad": _boom},
+                                             max_workers=2, timeout_s=1.0)
+    assert results == {"ok": 1}
+    assert isinstance(errors["bad"], OSError)
@@ -0,0 +1,177 @@
+"""
+``ArangoStore._vector_search`` against an in-memory stand-in for the AQL layer.
+
+The fake executes the two query shapes the store emits: the exact scan
+(``COSINE_SIMILARITY`` over every document) and the ANN path
+(``APPROX_NEAR_COSINE`` candidates, re-scored exactly). Approximate scores
+come from coarsely quantised vectors, standing in for an IVF/PQ index.
+"""
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from core_storage import arangodb
+from core_storage.arangodb import ArangoStore
+
+DIM = 32
+N_DOCS = 2000
+
+
+def _cosine(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a)) or 1.0
+    nb = math.sqrt(sum(y * y for y in b)) or 1.0
+    return dot / (na * nb)
+
+
+def _quantise(v):
+    return [round(x * 2) / 2 for x in v]
+
+
+class _FakeAQL:
+    def __init__(self, docs):
+        self._docs = docs
+        self._approx = {d["_key"]: _quantise(d["embedding"]) for d in docs}
+        self.calls = []
+        self.latest_query = None
+
+    def execute(self, aql, bind_vars=None):
+        bv = bind_vars or {}
+        self.calls.append(aql)
+        qv, limit = bv["qv"], bv["limit"]
+        if "APPROX_NEAR_COSINE" in aql:
+            qa = _quantise(qv)
+            pool = sorted(self._docs, key=lambda d: -_cosine(self._approx[d["_key"]], qa))[: bv["candidates"]]
+        elif "COSINE_SIMILARITY" in aql:
+            pool = [d for d in self._docs if "embedding" in d]
+        else:
+            raise AssertionError(f"unexpected query: {aql}")
+        scored = sorted(pool, key=lambda d: -_cosine(d["embedding"], qv))[:limit]
+        return [
+            {"id": d["_key"], "score": _cosine(d["embedding"], qv), "title": d["title"], "type": "DECISION"}
+            for d in scored
+        ]
+
+
+class _FakeCollection:
+    def __init__(self, indexes):
+        self._indexes = indexes
+
+    def indexes(self):
+        return list(self._indexes)
+
+
+class _FakeDB:
+    def __init__(self, docs, *, vector_index):
+        self.aql = _FakeAQL(docs)
+        idx = [{"type": "persistent", "fields": ["type"], "name": "idx_type"}]
+        if vector_index:
+            idx.append({"type": "vector", "fields": ["embedding"], "name": "nodes_embedding_vec"})
+        self._nodes = _FakeCollection(idx)
+
+    def collection(self, name):
+        assert name == "nodes"
+        return self._nodes
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(7)
+    docs = [
+        {"_key": f"d{i}", "title": f"doc {i}", "embedding": [rng.gauss(0, 1) for _ in range(DIM)]}
+        for i in range(N_DOCS)
+    ]
+    queries = [[rng.gauss(0, 1) for _ in range(DIM)] for _ in range(20)]
+    return docs, queries
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    seen = {"histogram": [], "counter": []}
+    monkeypatch.setattr(arangodb.core_metrics, "histogram_ms",
+                        lambda name, value, **labels: seen["histogram"].append((name, value, labels)))
+    monkeypatch.setattr(arangodb.core_metrics, "counter",
+                        lambda name, value, **labels: seen["counter"].append((name, value, labels)))
+    return seen
+
+
+def _store(monkeypatch, docs, *, vector_index, index_enabled=True):
+    monkeypatch.setattr(arangodb, "get_settings", lambda: SimpleNamespace(
+        vector_ann_top_k=50, vector_ann_candidates=200, vector_metric="cosine",
+        arango_vector_index_enabled=index_enabled,
+    ))
+    monkeypatch.delenv("IVF_NUMPROBES", raising=False)
+    st = ArangoStore("http://arangodb:8529", "root", "test", "batvault", lazy=True)
+    st.db = _FakeDB(docs, vector_index=vector_index)
+    return st
+
+
+def test_ann_path_used_when_index_exists(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    st = _store(monkeypatch, docs, vector_index=True)
+    resp = st._vector_search("q", queries[0], 10)
+    assert resp["vector_used"] is True
+    assert resp["vector_path"] == "ann"
+    assert len(resp["matches"]) == 10
+    assert "APPROX_NEAR_COSINE" in st.db.aql.calls[-1]
+    assert ("resolver_vector_path_total", 1, {"path": "ann"}) in metrics["counter"]
+    assert any(n == "arangodb.vector_search_ms" and lb.get("path") == "ann"
+               for n, _, lb in metrics["histogram"])
+
+
+def test_exact_scan_without_index(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    st = _store(monkeypatch, docs, vector_index=False)
+    resp = st._vector_search("q", queries[0], 10)
+    assert resp["vector_path"] == "exact"
+    assert "APPROX_NEAR" not in st.db.aql.calls[-1]
+    assert ("resolver_vector_path_total", 1, {"path": "exact"}) in metrics["counter"]
+
+
+def test_exact_scan_when_index_disabled(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    st = _store(monkeypatch, docs, vector_index=True, index_enabled=False)
+    assert st._vector_search("q", queries[0], 10)["vector_path"] == "exact"
+
+
+def test_index_probe_is_cached(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    st = _store(monkeypatch, docs, vector_index=True)
+    probes = []
+    real = st.db._nodes.indexes
+    st.db._nodes.indexes = lambda: probes.append(1) or real()
+    for q in queries[:3]:
+        st._vector_search("q", q, 10)
+    assert len(probes) == 1
+
+
+def test_query_failure_returns_none_and_reprobes(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    st = _store(monkeypatch, docs, vector_index=True)
+
+    def _boom(aql, bind_vars=None):
+        raise RuntimeError("index training")
+
+    st.db.aql.execute = _boom
+    assert st._vector_search("q", queries[0], 10) is None
+    assert st._vector_index_probe is None
+
+
+def test_ann_recall_and_latency_against_exact_scan(monkeypatch, corpus, metrics):
+    docs, queries = corpus
+    k = 10
+    ann_store = _store(monkeypatch, docs, vector_index=True)
+    exact_store = _store(monkeypatch, docs, vector_index=False)
+    hits = 0
+    for q in queries:
+        ann = ann_store._vector_search("q", q, k)
+        exact = exact_store._vector_search("q", q, k)
+        hits += len({m["id"] for m in ann["matches"]} & {m["id"] for m in exact["matches"]})
+    recall = hits / (k * len(queries))
+    assert recall >= 0.9, f"recall@{k}={recall:.2f}"
+    # Both paths report their latency per query, labelled by path.
+    paths = [lb["path"] for n, _, lb in metrics["histogram"] if n == "arangodb.vector_search_ms"]
+    assert paths.count("ann") == len(queries) and paths.count("exact") == len(queries)
+    assert all(ms >= 0 for n, ms, _ in metrics["histogram"] if n == "arangodb.vector_search_ms")
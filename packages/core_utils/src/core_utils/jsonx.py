@@ -121,6 +121,22 @@ def dumps(obj: Any) -> str:
         separators=(",", ":"),  # canonical/compact
     )
 
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Same canonical output as :func:`dumps`, but as UTF-8 *bytes*.
+
+    Artifact writers used to call ``dumps(obj).encode()``, which with orjson
+    decodes to ``str`` only to re-encode it; this returns orjson's buffer directly.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS, default=sanitize)
+        except Exception:
+            pass
+    return dumps(obj).encode("utf-8")
+
+__all__.append("dumps_bytes")
+
 def loads(data: str | bytes) -> Any:
     """Robust JSON load from str/bytes with BOM/encoding fallback.
 
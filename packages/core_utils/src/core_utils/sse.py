@@ -16,12 +16,22 @@ Two public generators are provided:
   then emits a final JSON payload before terminating with ``[DONE]``.  It
   accepts the same ``include_event`` flag and chunk size as ``stream_chunks``.
 
+For progressive responses, where pipeline stages are streamed as they
+complete, the building blocks are exposed separately: ``format_event`` for
+named stage events, ``short_answer_tokens`` and ``final_and_done`` for the
+token/final tail, and ``SSE_HEARTBEAT`` as a comment line that keeps idle
+connections open through proxies.
+
 See the Gateway README for high level design and usage details.
 """
 
-from typing import Iterable
+from typing import Any, Iterable, Optional
 from . import jsonx
 
+# SSE comment line: ignored by EventSource clients, but keeps proxies from
+# closing an idle connection while a slow stage is running.
+SSE_HEARTBEAT = ": keep-alive\n\n"
+
 
 def _chunks(text: str, chunk_size: int) -> Iterable[str]:
     """
@@ -118,4 +128,31 @@ def stream_answer_with_final(
     yield f"data: {jsonx.dumps(final_payload)}\n\n"
     if include_event:
         yield "event: done\n"
-    yield "data: [DONE]\n\n"
\ No newline at end of file
+    yield "data: [DONE]\n\n"
+
+
+def format_event(data: Any, *, event: Optional[str] = None) -> str:
+    """Encode one SSE message (optional ``event:`` line plus a JSON ``data:`` line)."""
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {jsonx.dumps(data)}\n\n"
+
+
+def short_answer_tokens(
+    short_answer: str,
+    *,
+    include_event: bool = False,
+    chunk_size: int = 24,
+) -> Iterable[str]:
+    """Token messages only (same framing as :func:`stream_chunks`, no terminator)."""
+    for token in _chunks(short_answer or "", chunk_size):
+        if include_event:
+            yield "event: short_answer\n"
+        yield f"data: {jsonx.dumps({'token': token})}\n\n"
+
+
+def final_and_done(final_payload: dict, *, include_event: bool = False) -> Iterable[str]:
+    """The final payload followed by the terminal marker (tail of :func:`stream_answer_with_final`)."""
+    yield f"data: {jsonx.dumps(final_payload)}\n\n"
+    if include_event:
+        yield "event: done\n"
+    yield "data: [DONE]\n\n"
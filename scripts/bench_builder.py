@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the gateway response builder.
+
+Runs ``build_why_decision_response`` on synthetic evidence (no Memory API,
+Redis or MinIO) and reports CPU time per call and peak Python allocations.
+A second section times the evidence serialization pattern on its own.
+
+  python scripts/bench_builder.py --edges 200 --iterations 200
+
+Requires the gateway runtime deps (pydantic, orjson, PyNaCl, ...). If
+GATEWAY_ED25519_PRIV_B64 is unset, a throwaway signing key is generated.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for p in (ROOT / "packages").glob("*/src"):
+    sys.path.append(str(p))
+sys.path.append(str(ROOT / "services" / "gateway" / "src"))
+
+try:
+    import pydantic as _pydantic  # noqa: F401
+    import orjson as _orjson  # noqa: F401
+except ImportError as e:
+    sys.stderr.write(f"[bench_builder] Missing a required dependency ({e.name}).\n")
+    sys.exit(1)
+
+if not os.getenv("GATEWAY_ED25519_PRIV_B64"):
+    try:
+        from nacl import signing as _signing
+    except ImportError:
+        sys.stderr.write("[bench_builder] Set GATEWAY_ED25519_PRIV_B64 or install PyNaCl.\n")
+        sys.exit(1)
+    os.environ["GATEWAY_ED25519_PRIV_B64"] = base64.b64encode(
+        bytes(_signing.SigningKey.generate()._seed)
+    ).decode("ascii")
+os.environ.setdefault("POLICY_REGISTRY_URL", "")
+
+
+def _synthetic_evidence(n_edges: int):
+    from core_models_gen import WhyDecisionEvidence
+
+    anchor_id = "bench-decision-0001"
+    edges, ids = [], [anchor_id]
+    for i in range(n_edges):
+        ev_id = f"bench-event-{i:05d}"
+        ids.append(ev_id)
+        if i % 2:
+            edges.append({"type": "LED_TO", "from": ev_id, "to": anchor_id,
+                          "timestamp": "2024-01-01T00:00:00Z"})
+        else:
+            edges.append({"type": "CAUSAL", "from": anchor_id, "to": ev_id,
+                          "timestamp": "2024-01-02T00:00:00Z"})
+    return WhyDecisionEvidence(
+        anchor={"id": anchor_id, "type": "DECISION", "title": "Benchmark decision",
+                "domain": "bench", "timestamp": "2024-01-01T00:00:00Z",
+                "rationale": "x" * 512},
+        graph={"edges": edges},
+        allowed_ids=sorted(ids),
+        snapshot_etag="bench-etag",
+        meta={"allowed_ids_fp": "sha256:" + "a" * 64, "policy_fp": "sha256:" + "b" * 64,
+              "snapshot_etag": "bench-etag", "fingerprints": {"graph_fp": "sha256:" + "c" * 64}},
+    )
+
+
+def _isolate(builder) -> None:
+    """Keep the run CPU-bound: no Redis writes, no artifact spool."""
+    async def _noop(*_a, **_k):
+        return None
+    builder.store_evidence_cache = _noop
+    builder.get_redis_pool = lambda *_a, **_k: None
+    fake_app = types.ModuleType("gateway.app")
+    fake_app._persist_artifacts = _noop
+    sys.modules["gateway.app"] = fake_app
+
+
+async def _bench_builder(n_edges: int, iterations: int) -> None:
+    from gateway import builder
+    from gateway.budget_gate import run_gate
+
+    _isolate(builder)
+
+    async def _once(i: int):
+        ev = _synthetic_evidence(n_edges)
+        plan, _ = run_gate(envelope={"policy": {}}, evidence_obj=ev, request_id=f"bench{i:012d}")
+        req = types.SimpleNamespace(
+            intent="why_decision", anchor_id=ev.anchor["id"] if isinstance(ev.anchor, dict) else ev.anchor.id,
+            evidence=ev, request_id=f"bench{i:012d}", template_id=None, org=None,
+        )
+        return await builder.build_why_decision_response(
+            req, None, source="query", gateway_plan=plan, stage_times={},
+        )
+
+    for i in range(min(5, iterations)):  # warm caches / imports
+        await _once(i)
+
+    cpu_ms = []
+    for i in range(iterations):
+        t0 = time.process_time()
+        await _once(i)
+        cpu_ms.append((time.process_time() - t0) * 1000.0)
+
+    tracemalloc.start()
+    await _once(0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cpu_ms.sort()
+    print(f"builder  edges={n_edges} iterations={iterations}")
+    print(f"  cpu_ms   mean={statistics.fmean(cpu_ms):.3f} "
+          f"p50={cpu_ms[len(cpu_ms) // 2]:.3f} p95={cpu_ms[int(len(cpu_ms) * 0.95) - 1]:.3f}")
+    print(f"  peak_alloc_kib={peak / 1024:.1f}")
+
+
+def _bench_serialization(n_edges: int, iterations: int) -> None:
+    from core_utils import jsonx
+
+    ev = _synthetic_evidence(n_edges)
+
+    def _before():
+        # evidence_pre / evidence_canonical / evidence cache: three dumps
+        for _ in range(3):
+            jsonx.dumps(ev.model_dump(mode="python", exclude_none=True)).encode()
+
+    def _after():
+        jsonx.dumps_bytes(ev.model_dump(mode="python", exclude_none=True))
+
+    for label, fn in (("3x dumps().encode()", _before), ("1x dumps_bytes()", _after)):
+        t0 = time.process_time()
+        for _ in range(iterations):
+            fn()
+        per_call = (time.process_time() - t0) * 1000.0 / iterations
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"serialize  {label:<22} cpu_ms={per_call:.3f} peak_alloc_kib={peak / 1024:.1f}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--edges", type=int, default=200)
+    ap.add_argument("--iterations", type=int, default=200)
+    ap.add_argument("--skip-builder", action="store_true", help="only run the serialization section")
+    args = ap.parse_args()
+    _bench_serialization(args.edges, args.iterations)
+    if not args.skip_builder:
+        asyncio.run(_bench_builder(args.edges, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
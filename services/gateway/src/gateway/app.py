@@ -1,17 +1,20 @@
-import asyncio, functools, io, os, time, inspect
-from typing import List, Optional, Any, Mapping
+import asyncio, functools, io, os, threading, time, inspect
+from typing import Awaitable, Callable, List, Optional, Any, Mapping
 from typing import Iterator
 from core_utils import jsonx
 from fastapi import APIRouter, FastAPI, HTTPException, Request, Response, Query, UploadFile, File
 from fastapi.responses import JSONResponse, StreamingResponse
 from core_http.client import get_http_client
-from core_utils.sse import stream_answer_with_final, stream_chunks
+from core_utils.sse import (
+    SSE_HEARTBEAT, format_event, short_answer_tokens, stream_chunks,
+)
 from core_utils.fingerprints import schema_dir_fp
 from core_http.headers import (
     REQUEST_SNAPSHOT_ETAG, BV_POLICY_FP, BV_ALLOWED_IDS_FP,
     extract_policy_headers, BV_GRAPH_FP, RESPONSE_SNAPSHOT_ETAG,
 )
-from .evidence import EvidenceBuilder
+from .evidence import EvidenceBuilder, run_snapshot_etag_listener
+from .artifact_spool import ArtifactWriteBehind
 from core_storage.artifact_index import (
      build_named_bundles, upload_named_bundles)
 from pathlib import Path
@@ -35,11 +38,20 @@ from core_models_gen import (
 )
 from core_utils.health import attach_health_routes
 from core_storage.minio_utils import ensure_bucket as ensure_minio_bucket
+from core_storage.minio_utils import (
+    build_http_pool as build_minio_http_pool,
+    get_objects_parallel as minio_get_objects_parallel,
+    put_objects_parallel as minio_put_objects_parallel,
+)
 from core_utils.load_shed import should_load_shed, start_background_refresh, stop_background_refresh
 from .builder import build_why_decision_response
 from .budget_gate import run_gate as budget_run_gate
 from core_cache.redis_client import get_redis_pool
+from core_cache.redis_cache import RedisCache
+from redis.exceptions import RedisError
 from core_cache import keys as cache_keys
+from core_cache.generation import run_generation_reaper
+from core_cache.roundtrips import note_round_trip
 from core_config.constants import TTL_BUNDLE_CACHE_SEC
 from core_http.errors import attach_standard_error_handlers, raise_http_error
 from core_metrics import counter as metric_counter
@@ -51,7 +63,7 @@ except ImportError:  # pragma: no cover - tests may not install minio
         pass
 from core_idem import (
     idem_redis_key, idem_key_fp,
-    idem_get, idem_set, idem_merge,
+    idem_claim, idem_wait, idem_merge, idem_complete,
     idem_log_replay, idem_log_pending,
     idem_log_resume_seed, idem_log_progress, idem_log_complete,
     compute_request_scope_fp,
@@ -334,33 +346,59 @@ async def resolve_decision_text(
     return await resolver_fn(text, request_id=request_id, snapshot_etag=snapshot_etag)
 
 # ---- MinIO helpers ---------------------------------------------------------
+# Clients are process-wide: Minio objects are thread-safe and each owns a
+# pooled urllib3 transport, so building one per call threw away warm sockets.
+_MINIO_LOCK = threading.Lock()
+_MINIO_CLIENT: Any = None
+_MINIO_PRESIGN_CLIENT: Any = None
+_MINIO_UNAVAILABLE = False
+
+def _minio_http_pool(secure: bool):
+    return build_minio_http_pool(
+        max_connections=settings.minio_max_connections,
+        connect_timeout_s=settings.minio_connect_timeout_ms / 1000.0,
+        read_timeout_s=settings.minio_object_timeout_ms / 1000.0,
+        secure=secure,
+    )
+
 def _minio_client_or_null():
-    # Lazy import to keep tests importable without MinIO
-    try:
-        from minio import Minio  # type: ignore
-    except ImportError as exc:
-        log_stage(logger, "artifacts", "minio_unavailable", error=str(exc), request_id="startup")
-        return None
-    # Strategic breadcrumb: record config once per-process (safe to log; no secrets)
-    try:
-        log_stage(
-            logger, "init", "minio_client_config",
-            endpoint=settings.minio_endpoint,
-            bucket=settings.minio_bucket,
-            secure=bool(settings.minio_secure),
-            region=(settings.minio_region or None),
-            public_endpoint=(getattr(settings, "minio_public_endpoint", None) or None),
-            request_id="startup",
+    global _MINIO_CLIENT, _MINIO_UNAVAILABLE
+    if _MINIO_CLIENT is not None or _MINIO_UNAVAILABLE:
+        return _MINIO_CLIENT
+    with _MINIO_LOCK:
+        if _MINIO_CLIENT is not None or _MINIO_UNAVAILABLE:
+            return _MINIO_CLIENT
+        # Lazy import to keep tests importable without MinIO
+        try:
+            from minio import Minio  # type: ignore
+        except ImportError as exc:
+            _MINIO_UNAVAILABLE = True
+            log_stage(logger, "artifacts", "minio_unavailable", error=str(exc), request_id="startup")
+            return None
+        # Strategic breadcrumb: record config once per-process (safe to log; no secrets)
+        try:
+            log_stage(
+                logger, "init", "minio_client_config",
+                endpoint=settings.minio_endpoint,
+                bucket=settings.minio_bucket,
+                secure=bool(settings.minio_secure),
+                region=(settings.minio_region or None),
+                public_endpoint=(getattr(settings, "minio_public_endpoint", None) or None),
+                max_connections=settings.minio_max_connections,
+                transfer_concurrency=settings.minio_transfer_concurrency,
+                request_id="startup",
+            )
+        except (RuntimeError, ValueError, TypeError, OSError):
+            pass
+        _MINIO_CLIENT = Minio(
+            settings.minio_endpoint,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            secure=settings.minio_secure,
+            region=settings.minio_region,
+            http_client=_minio_http_pool(bool(settings.minio_secure)),
         )
-    except (RuntimeError, ValueError, TypeError, OSError):
-        pass
-    return Minio(
-        settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=settings.minio_secure,
-        region=settings.minio_region,
-    )
+        return _MINIO_CLIENT
 
 def minio_client():
     return _minio_client_or_null()
@@ -369,26 +407,35 @@ _bucket_prepared: bool = False
 
 def minio_presign_client():
     """
-    Build a MinIO client used *only* for presigning with the public host:port.
+    MinIO client used *only* for presigning with the public host:port.
     Avoids post-sign URL rewriting (which breaks AWS SigV4).
     Falls back to the internal client if no public endpoint is configured.
     """
+    global _MINIO_PRESIGN_CLIENT
+    public_ep = (getattr(settings, "minio_public_endpoint", "") or "").strip()
+    if not public_ep:
+        return minio_client()
+    if _MINIO_PRESIGN_CLIENT is not None:
+        return _MINIO_PRESIGN_CLIENT
     try:
         from minio import Minio  # type: ignore
     except (ImportError, OSError, RuntimeError, ValueError):
         return None
-    public_ep = (getattr(settings, "minio_public_endpoint", "") or "").strip()
-    if not public_ep:
-        return minio_client()
     from urllib.parse import urlparse as _urlparse
     pu = _urlparse(public_ep if "://" in public_ep else f"http://{public_ep}")
-    return Minio(
-        pu.netloc or settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        secure=(pu.scheme == "https"),
-        region=settings.minio_region,
-    )
+    with _MINIO_LOCK:
+        if _MINIO_PRESIGN_CLIENT is None:
+            # Presigning is local (no I/O) once the region is known; the pool is
+            # only used by stat/list calls routed through this client.
+            _MINIO_PRESIGN_CLIENT = Minio(
+                pu.netloc or settings.minio_endpoint,
+                access_key=settings.minio_access_key,
+                secret_key=settings.minio_secret_key,
+                secure=(pu.scheme == "https"),
+                region=settings.minio_region,
+                http_client=_minio_http_pool(pu.scheme == "https"),
+            )
+    return _MINIO_PRESIGN_CLIENT
 
 def _minio_get_batch(request_id: str) -> dict[str, bytes] | None:
     """Fetch all artifacts for a request from MinIO as a {name: bytes} dict.
@@ -415,31 +462,33 @@ def _minio_get_batch(request_id: str) -> dict[str, bytes] | None:
             return None
         out: dict[str, bytes] = {}
         archives: list[tuple[str, bytes]] = []
+        # Download in parallel; wall time follows the largest object.
+        payloads, failures = minio_get_objects_parallel(
+            client, settings.minio_bucket, [obj.object_name for obj in objects],
+            max_workers=settings.minio_transfer_concurrency,
+            timeout_s=settings.minio_object_timeout_ms / 1000.0,
+        )
+        for object_name, exc in failures.items():
+            # carry on; partial bundles are acceptable but we log them
+            log_stage(logger, "artifacts", "minio_get_object_failed",
+                      request_id=request_id, object=object_name, error=str(exc))
         for obj in objects:
-            try:
-                resp = client.get_object(settings.minio_bucket, obj.object_name)
-                try:
-                    data = resp.read()
-                finally:
-                    resp.close()
-                    resp.release_conn()
-                # normalise to just the filename part (after the request_id/ prefix)
-                name = obj.object_name[len(prefix):] if obj.object_name.startswith(prefix) else obj.object_name
-                # keep concrete artifacts as-is
-                if not name.endswith(".tar.gz"):
-                    out[name] = data
-                    continue
-                # handle named bundle archives
-                base = name[:-7]  # strip ".tar.gz"
-                if base in BUNDLE_ARCHIVE_NAMES:
-                    archives.append((name, data))
-                else:
-                    # unknown archive name → keep raw for diagnostics
-                    out[name] = data
-            except (OSError, RuntimeError, ValueError) as exc:
-                # carry on; partial bundles are acceptable but we log them
-                log_stage(logger, "artifacts", "minio_get_object_failed",
-                          request_id=request_id, object=obj.object_name, error=str(exc))
+            data = payloads.get(obj.object_name)
+            if data is None:
+                continue
+            # normalise to just the filename part (after the request_id/ prefix)
+            name = obj.object_name[len(prefix):] if obj.object_name.startswith(prefix) else obj.object_name
+            # keep concrete artifacts as-is
+            if not name.endswith(".tar.gz"):
+                out[name] = data
+                continue
+            # handle named bundle archives
+            base = name[:-7]  # strip ".tar.gz"
+            if base in BUNDLE_ARCHIVE_NAMES:
+                archives.append((name, data))
+            else:
+                # unknown archive name → keep raw for diagnostics
+                out[name] = data
         # expand any bundle_view / bundle_full archives we found
         for arch_name, arch_bytes in archives:
             try:
@@ -479,20 +528,26 @@ def _minio_get_batch(request_id: str) -> dict[str, bytes] | None:
         return None
 
 def _load_bundle_dict(request_id: str) -> dict[str, bytes] | None:
-    """Load the bundle from object storage (preferred).
+    """Load the bundle from the write-behind spool or object storage.
 
-    The local in-process LRU is removed; Redis fallback is handled by
-    builder (by bundle fingerprint), while this endpoint remains keyed
-    by request_id and therefore uses MinIO for durability.
+    Batches still waiting for upload are served from the local spool; once
+    uploaded the spool entry is gone and MinIO is authoritative. Redis
+    fallback is handled by builder (by bundle fingerprint), while this
+    endpoint remains keyed by request_id.
     Returns a {filename: bytes} mapping, or None when not found.
     """
+    pending = _ARTIFACT_WRITE_BEHIND.load(request_id)
+    if pending:
+        log_stage(logger, "artifacts", "spool_served", request_id=request_id, count=len(pending))
+        return pending
     return _minio_get_batch(request_id)
 
-def _minio_put_batch(request_id: str, artifacts: Mapping[str, bytes]) -> None:
+def _minio_put_batch(request_id: str, artifacts: Mapping[str, bytes]) -> bool:
+    """Upload one batch plus its named bundles; False when MinIO is unavailable."""
     client = minio_client()
     if client is None:
-        # MinIO disabled; skip silently
-        return
+        # MinIO disabled; nothing uploaded (write-behind stops spooling via its enabled probe)
+        return False
     global _bucket_prepared
     if not _bucket_prepared:
         try:
@@ -509,14 +564,21 @@ def _minio_put_batch(request_id: str, artifacts: Mapping[str, bytes]) -> None:
                 error=str(exc),
             )
     total_bytes = 0
-    for name, blob in list(artifacts.items()):
-        client.put_object(
-            settings.minio_bucket,
-            f"{request_id}/{name}",
-            io.BytesIO(blob),
-            length=len(blob),
-            content_type="application/json",
-        )
+    failures = minio_put_objects_parallel(
+        client,
+        settings.minio_bucket,
+        {f"{request_id}/{name}": (blob, "application/json") for name, blob in artifacts.items()},
+        max_workers=settings.minio_transfer_concurrency,
+        timeout_s=settings.minio_object_timeout_ms / 1000.0,
+    )
+    if failures:
+        # Surface to the caller (write-behind retries the whole batch; puts are idempotent)
+        first_name, first_exc = next(iter(failures.items()))
+        log_stage(logger, "artifacts", "minio_put_batch_partial",
+                  request_id=request_id, failed=len(failures), count=len(artifacts),
+                  object=first_name, error=str(first_exc))
+        raise first_exc
+    for name, blob in artifacts.items():
         metric_counter("gateway_artifact_bytes_total", len(blob), artifact=name)
         total_bytes += len(blob)
 
@@ -543,7 +605,10 @@ def _minio_put_batch(request_id: str, artifacts: Mapping[str, bytes]) -> None:
         }
         _t_bundle = time.perf_counter()
         named_bundles, meta_bytes = build_named_bundles(artifacts_for_bundles, bundle_map)
-        upload_named_bundles(client, settings.minio_bucket, request_id, named_bundles, meta_bytes)
+        upload_named_bundles(
+            client, settings.minio_bucket, request_id, named_bundles, meta_bytes,
+            max_workers=settings.minio_transfer_concurrency,
+        )
         try:
             # Audit-only timing (cannot retrofit into already-sent meta)
             log_stage(logger, "artifacts", "bundle_write_ms", request_id=request_id,
@@ -553,6 +618,7 @@ def _minio_put_batch(request_id: str, artifacts: Mapping[str, bytes]) -> None:
     except (OSError, RuntimeError, ValueError) as exc:
         # Non-fatal, emit structured warning and continue
         log_stage(logger, "artifacts", "index_build_or_upload_failed", request_id=request_id, error=str(exc))
+    return True
 
 async def _minio_put_batch_async(
     request_id: str,
@@ -586,6 +652,32 @@ async def _minio_put_batch_async(
             error=str(exc),
         )
 
+# ---- Artifact write-behind -------------------------------------------------
+_ARTIFACT_WRITE_BEHIND = ArtifactWriteBehind(
+    settings.artifact_spool_dir,
+    _minio_put_batch,
+    queue_max=settings.artifact_queue_max,
+    workers=settings.artifact_upload_workers,
+    max_attempts=settings.artifact_upload_max_attempts,
+    object_timeout_s=settings.minio_object_timeout_ms / 1000.0,
+    extra_objects=3,  # named bundles: bundle_view, bundle_full, _index.json
+    retry_base_ms=settings.artifact_upload_retry_base_ms,
+    retry_cap_ms=settings.artifact_upload_retry_cap_ms,
+    sweep_s=float(settings.artifact_spool_sweep_s),
+    retention_s=float(settings.minio_retention_days) * 86400,
+    enabled=lambda: minio_client() is not None,
+)
+
+async def _persist_artifacts(request_id: str, artifacts: Mapping[str, bytes]) -> None:
+    """Spool artifacts durably and hand them to the background uploader.
+
+    Only the local spool write is awaited; MinIO latency stays off the request
+    path. If the spool is unusable we fall back to the bounded direct upload.
+    """
+    if await _ARTIFACT_WRITE_BEHIND.submit(request_id, artifacts):
+        return
+    await _minio_put_batch_async(request_id, artifacts)
+
 # ---- Ops & metrics endpoints ----------------------------------------------
 @app.post("/ops/minio/ensure-bucket")
 def ensure_bucket():
@@ -793,6 +885,32 @@ class QueryRequest(BaseModel):
     graph: dict | None = None
 
 # ---- /v3/query -------------------------------------------------------------
+StageEmitter = Callable[[str, dict], Awaitable[None]]
+
+def _evidence_summary(ev: Any, *, request_id: str, latency_ms: int = 0) -> dict:
+    """Compact, policy-filtered evidence counts for the SSE ``evidence`` event."""
+    graph = getattr(ev, "graph", None)
+    if isinstance(graph, dict):
+        edges = graph.get("edges") or []
+    else:
+        edges = getattr(graph, "edges", None) or []
+    orientations: dict[str, int] = {}
+    for e in edges:
+        if isinstance(e, dict):
+            o = str(e.get("orientation") or "unoriented").lower()
+            orientations[o] = orientations.get(o, 0) + 1
+    anchor = getattr(ev, "anchor", None)
+    anchor_id = anchor.get("id") if isinstance(anchor, dict) else getattr(anchor, "id", None)
+    return {
+        "request_id": request_id,
+        "anchor_id": anchor_id,
+        "edges": len(edges),
+        "orientation_counts": orientations,
+        "allowed_ids": len(getattr(ev, "allowed_ids", None) or []),
+        "snapshot_etag": getattr(ev, "snapshot_etag", None),
+        "latency_ms": latency_ms,
+    }
+
 @router.post("/query", response_model=WhyDecisionResponse)
 async def v3_query(
     request: Request,
@@ -803,6 +921,148 @@ async def v3_query(
     template: str | None = Query(default=None, pattern="^[a-z0-9._-]+$"),
     org: str | None = Query(default=None, pattern="^[A-Za-z0-9._-]+$"),
 ):
+    # Decide streaming mode based on query flag or Accept header (SSE)
+    want_stream = bool(stream) or ("text/event-stream" in (request.headers.get("accept","").lower()))
+    try:
+        log_stage(logger, "stream", "mode_selected",
+                  want_stream=want_stream,
+                  reason=("accept" if want_stream and not stream else ("flag" if stream else "off")))
+    except (RuntimeError, ValueError, TypeError): pass
+    run = functools.partial(
+        _v3_query_run, request, req,
+        fresh=fresh, template=template, org=org,
+    )
+    if not want_stream:
+        return await run()
+    return await _progressive_sse(request, run, include_event=include_event)
+
+async def _progressive_sse(
+    request: Request,
+    run: Callable[..., Awaitable[Any]],
+    *,
+    include_event: bool,
+) -> Response:
+    """Stream pipeline stages as SSE events while ``run`` is still working.
+
+    Order: ``anchor`` → ``evidence`` → short-answer tokens → final envelope →
+    ``bundle`` → ``[DONE]``, with heartbeat comments while a stage is slow.
+    The HTTP response is held back until the first stage event so failures
+    before the anchor is known (400/404/409/429, idempotent replays) keep
+    their normal status codes. A client disconnect cancels the pipeline.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    _DONE = object()
+
+    async def _emit(stage: str, data: dict) -> None:
+        await queue.put((stage, data))
+
+    async def _runner() -> None:
+        try:
+            res = await run(progress=_emit)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # surfaced to the client as an error event / status
+            await queue.put((_DONE, exc))
+        else:
+            await queue.put((_DONE, res))
+
+    t0 = time.perf_counter()
+    task = asyncio.create_task(_runner())
+    try:
+        first = await queue.get()
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if first[0] is _DONE:
+        # Finished before any stage event: plain (non-streamed) outcome.
+        if isinstance(first[1], Exception):
+            raise first[1]
+        return first[1]
+    rid = str((first[1] or {}).get("request_id") or "")
+    heartbeat_s = max(0.05, settings.sse_heartbeat_ms / 1000.0)
+
+    def _render(stage: str, data: dict) -> Iterator[str]:
+        if stage == "short_answer":
+            yield from short_answer_tokens(data.get("short_answer") or "", include_event=include_event)
+        elif stage == "final":
+            yield f"data: {jsonx.dumps(data)}\n\n"
+        else:
+            yield format_event({"stage": stage, **data}, event=stage)
+
+    def _outcome(res: Any) -> Iterator[str]:
+        # None: final + bundle were already streamed. Otherwise the runner returned
+        # early after streaming began (replay / cached bundle) or failed.
+        if isinstance(res, HTTPException):
+            yield format_event({"stage": "error", "status": res.status_code, "detail": res.detail}, event="error")
+        elif isinstance(res, Exception):
+            yield format_event({"stage": "error", "status": 500, "error": type(res).__name__}, event="error")
+        elif isinstance(res, Response):
+            try:
+                body = jsonx.loads(bytes(res.body or b"{}"))
+            except (ValueError, TypeError):
+                body = {}
+            if res.status_code == 200:
+                yield f"data: {jsonx.dumps(body)}\n\n"
+            else:
+                yield format_event({"stage": "error", "status": res.status_code, "detail": body}, event="error")
+        if include_event:
+            yield "event: done\n"
+        yield "data: [DONE]\n\n"
+
+    async def _events():
+        log_stage(logger, "query", "stream_open", request_id=rid,
+                  first_event_ms=int((time.perf_counter() - t0) * 1000))
+        completed = False
+        try:
+            for chunk in _render(*first):
+                yield chunk
+            while True:
+                try:
+                    stage, data = await asyncio.wait_for(queue.get(), timeout=heartbeat_s)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        log_stage(logger, "query", "stream_client_disconnected", request_id=rid)
+                        return
+                    yield SSE_HEARTBEAT
+                    continue
+                if stage is _DONE:
+                    completed = True
+                    for chunk in _outcome(data):
+                        yield chunk
+                    return
+                for chunk in _render(stage, data):
+                    yield chunk
+        finally:
+            if not task.done():
+                # Client went away (or the stream was torn down): stop the pipeline.
+                task.cancel()
+                if not completed:
+                    log_stage(logger, "query", "stream_cancelled", request_id=rid)
+            log_stage(logger, "query", "stream_close", request_id=rid,
+                      total_ms=int((time.perf_counter() - t0) * 1000))
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if rid:
+        headers["X-Request-Id"] = rid
+    _sfp = _schema_fp()
+    if _sfp:
+        headers["X-BV-Schema-FP"] = _sfp
+    return StreamingResponse(_events(), media_type="text/event-stream", headers=headers)
+
+async def _v3_query_run(
+    request: Request,
+    req: QueryRequest,
+    *,
+    fresh: bool = False,
+    template: str | None = None,
+    org: str | None = None,
+    progress: StageEmitter | None = None,
+):
+    """The /v3/query pipeline. ``progress`` receives stage events for SSE."""
+    async def _stage(name: str, data: dict) -> None:
+        if progress is not None:
+            await progress(name, data)
+
     if should_load_shed():
         ra = getattr(settings, "load_shed_retry_after_seconds", 1)
         return JSONResponse(status_code=429, headers={"Retry-After": str(ra)},
@@ -880,11 +1140,17 @@ async def v3_query(
                     status_code=409,
                     detail={'detail': 'multiple anchors', 'candidates': cand}
                 )
+    await _stage("anchor", {
+        "request_id": req_id,
+        "anchor_id": anchor["id"],
+        "resolved": not (req.anchor or "").strip(),
+        "latency_ms": stage_times.get("intent_resolve", 0),
+    })
 
     # ---- Idempotency replay / resume (client header: Idempotency-Key) ----------
     prev_fp = None
     _idem_hdr = request.headers.get("Idempotency-Key") or request.headers.get("x-idempotency-key")
-    _idem_key = idem_redis_key(_idem_hdr, service="gateway", version=2) if _idem_hdr else None
+    _idem_key = idem_redis_key(_idem_hdr, service="gateway", version=3) if _idem_hdr else None
     _idem_fp  = idem_key_fp(_idem_hdr) if _idem_hdr else None
     _policy_fp = request.headers.get(BV_POLICY_FP)
     _snapshot  = request.headers.get(REQUEST_SNAPSHOT_ETAG)
@@ -915,26 +1181,42 @@ async def v3_query(
         rc = get_redis_pool()
         if rc is not None:
             try:
-                rec = await idem_get(rc, _idem_key)
+                # Claim-or-replay in one atomic round trip (core_idem Lua scripts).
+                claim = await idem_claim(
+                    rc, _idem_key,
+                    {
+                        "status": "pending",
+                        "request_id": req_id,
+                        "path": str(request.url.path),
+                        "started_at": int(time.time()),
+                        "request_fingerprint": _req_fp,
+                        "request_scope_fp": _scope_fp, "policy_fp": _policy_fp, "snapshot_etag": _snapshot,
+                    },
+                    scope_fp=_scope_fp, request_fp=_req_fp,
+                    lease_ms=int(settings.idem_lease_ms),
+                )
                 # HARDEN: reject reuse of the key for a different request payload
-                if isinstance(rec, dict):
-                    _stored_fp = rec.get("request_fingerprint")
-                    _stored_scope = rec.get("request_scope_fp")
-                    if (_stored_fp and _stored_fp != _req_fp) or (_stored_scope and _stored_scope != _scope_fp):
-                        # Strategic breadcrumb for audit drawer; no PII, fingerprints only
-                        try:
-                            log_stage(logger, "idem", "idem.scope_conflict.replay",
-                                      key_fp=_idem_fp or "", stored_req_fp=_stored_fp, incoming_req_fp=_req_fp,
-                                      stored_scope_fp=_stored_scope, incoming_scope_fp=_scope_fp, request_id=req_id)
-                        except (RuntimeError, ValueError, TypeError):
-                            pass
-                        return JSONResponse(
-                            status_code=409,
-                            content={"error": "Idempotency key reused with a different request.",
-                                     "hint": "Generate a new Idempotency-Key for each unique request."}
-                        )
+                if claim.status == "conflict":
+                    # Strategic breadcrumb for audit drawer; no PII, fingerprints only
+                    try:
+                        log_stage(logger, "idem", "idem.scope_conflict.replay",
+                                  key_fp=_idem_fp or "", incoming_req_fp=_req_fp,
+                                  incoming_scope_fp=_scope_fp, request_id=req_id)
+                    except (RuntimeError, ValueError, TypeError):
+                        pass
+                    return JSONResponse(
+                        status_code=409,
+                        content={"error": "Idempotency key reused with a different request.",
+                                 "hint": "Generate a new Idempotency-Key for each unique request."}
+                    )
+                _replay = claim.response if claim.status == "complete" else None
+                if claim.status == "in_progress":
+                    # Another replica is computing this key: wait briefly for its result
+                    # instead of recomputing; fall through to compute on timeout.
+                    _replay = await idem_wait(rc, _idem_key, wait_ms=int(settings.idem_wait_ms))
+                    metric_counter("gateway_idem_wait_total", 1, outcome=("replayed" if _replay else "timeout"))
                 # Full replay if a completed outcome exists
-                if isinstance(rec, dict) and rec.get("status") == "complete" and isinstance(rec.get("response"), dict):
+                if isinstance(_replay, dict):
                     idem_log_replay(logger, key_fp=_idem_fp or "", request_id=req_id)
                     # v3: do not mirror any envelope/meta fields into headers on replay
                     log_stage(logger, "headers", "passthrough_only", request_id=req_id)
@@ -944,48 +1226,64 @@ async def v3_query(
                         _h["X-BV-Schema-FP"] = _sfp
                     return JSONResponse(
                         status_code=200,
-                        content=rec["response"],
+                        content=_replay,
                         headers=_h,
                     )
                 # Resume: seed SWR with prior bundle_fp if present
-                _p = rec.get("progress") if isinstance(rec, dict) else None
+                _p = claim.progress
                 if isinstance(_p, dict):
                     _prev_bfp = _p.get("bundle_fp")
                     if _prev_bfp:
                         prev_fp = str(_prev_bfp)
                         idem_log_resume_seed(logger, key_fp=_idem_fp or "", bundle_fp=prev_fp)
-                # Ensure at least a pending record exists for this key
-                if not rec:
-                    await idem_set(
-                        rc, _idem_key,
-                        {
-                            "status": "pending",
-                            "request_id": req_id,
-                            "path": str(request.url.path),
-                            "started_at": int(time.time()),
-                            "request_fingerprint": _req_fp,
-                            "request_scope_fp": _scope_fp, "policy_fp": _policy_fp, "snapshot_etag": _snapshot,
-                        }
-                    )
+                if claim.status == "claimed":
                     idem_log_pending(logger, key_fp=_idem_fp or "", request_id=req_id)
             except (OSError, RuntimeError, ValueError, TypeError) as exc:
                 # Emit structured error; keep request flowing
                 log_stage(logger, "idem", "idem.error", request_id=req_id, error=type(exc).__name__)
 
-    # -------- SWR fast-path for bv:gw:v1:bundle:{bundle_fp} (opt-in via X-Bundle-FP) ----
+    # -------- Batched cache read: bundle (SWR), header-keyed evidence, evidence index ----
+    # Every key this request may read before computing is known here, so they
+    # are fetched with one MGET instead of one round trip each.
+    prev_fp = prev_fp or (request.headers.get("X-Bundle-FP") or request.headers.get("x-bundle-fp"))
+    _ev_hdr_key: str | None = None
+    if not fresh:
+        # Requests MUST provide the request header form only (deck invariant).
+        _etag = request.headers.get(REQUEST_SNAPSHOT_ETAG)
+        _policy_fp = request.headers.get(BV_POLICY_FP)
+        _allowed_ids_fp = request.headers.get(BV_ALLOWED_IDS_FP)
+        if _etag and _policy_fp and _allowed_ids_fp:
+            _ev_hdr_key = cache_keys.evidence(str(_etag), str(_allowed_ids_fp), str(_policy_fp))
+    _prefetch_keys = [k for k in (
+        cache_keys.bundle(str(prev_fp)) if prev_fp else None,
+        _ev_hdr_key,
+        None if fresh else _evidence_builder.index_key(anchor["id"], policy_headers=policy_hdrs),
+    ) if k]
+    _prefetched: dict[str, tuple] = {}
+    if _prefetch_keys:
+        try:
+            rc = get_redis_pool()
+            if rc is not None:
+                _prefetched = dict(zip(_prefetch_keys, await RedisCache(get_redis_pool(binary=True)).lookup_many(_prefetch_keys)))
+        except (RedisError, AttributeError, TypeError, ValueError, OSError) as exc:
+            log_stage(logger, "cache", "error", layer="prefetch", error=type(exc).__name__)
+
+    # -------- SWR fast-path for bv:gw:v1:bundle:g{gen}:{bundle_fp} (opt-in via X-Bundle-FP) ----
     try:
-        prev_fp = prev_fp or (request.headers.get("X-Bundle-FP") or request.headers.get("x-bundle-fp"))
         if prev_fp:
             rc = get_redis_pool()
             if rc is not None:
                 k = cache_keys.bundle(str(prev_fp))
                 log_stage(logger, "cache", "get", layer="bundle", cache_key=k)
-                cached = rc.get(k)
-                cached = await cached if inspect.isawaitable(cached) else cached
+                cached, tier = _prefetched.get(k) or (None, "miss")
                 if cached:
-                    log_stage(logger, "cache", "hit", layer="bundle", cache_key=k)
+                    log_stage(logger, "cache", "hit", layer="bundle", cache_key=k, tier=tier)
                     try:
-                        ttl = rc.ttl(k); ttl = await ttl if inspect.isawaitable(ttl) else ttl
+                        # TTL probe only on a Redis hit: L1 copies are capped well inside the SWR window.
+                        ttl = -1
+                        if tier == "redis":
+                            ttl = rc.ttl(k); ttl = await ttl if inspect.isawaitable(ttl) else ttl
+                            note_round_trip(1, op="ttl")
                         if isinstance(ttl, int) and ttl >= 0 and ttl < max(1, int(TTL_BUNDLE_CACHE_SEC * 0.2)):
                             # background refresh keyed by evidence (anchor + policy headers)
                             async def _refresh():
@@ -1020,21 +1318,15 @@ async def v3_query(
     ev = None
     # Opportunistic evidence cache READ if caller supplies the composite key parts
     if not fresh:
-        # Requests MUST provide the request header form only (deck invariant).
-        _etag = request.headers.get(REQUEST_SNAPSHOT_ETAG)
-        _policy_fp = (
-            request.headers.get(BV_POLICY_FP)
-        )
-        _allowed_ids_fp = request.headers.get(BV_ALLOWED_IDS_FP)
-        if _etag and _policy_fp and _allowed_ids_fp:
+        if _ev_hdr_key:
             rc = get_redis_pool()
             if rc is not None:
-                k = cache_keys.evidence(str(_etag), str(_allowed_ids_fp), str(_policy_fp))
+                k = _ev_hdr_key
                 log_stage(logger, "cache", "get", layer="evidence", cache_key=k)
-                cached = rc.get(k)
-                cached = await cached if inspect.isawaitable(cached) else cached
+                cached = (_prefetched.get(k) or (None, "miss"))[0]
                 if cached:
                     log_stage(logger, "cache", "hit", layer="evidence", cache_key=k)
+                    metric_counter("cache_hit_total", 1, service="gateway_evidence", path="headers")
                     obj = jsonx.loads(cached)
                     try:
                         ev = WhyDecisionEvidence.model_validate(obj)
@@ -1042,6 +1334,14 @@ async def v3_query(
                         ev = WhyDecisionEvidence(**(obj if isinstance(obj, dict) else {}))
                 else:
                     log_stage(logger, "cache", "miss", layer="evidence", cache_key=k)
+                    metric_counter("cache_miss_total", 1, service="gateway_evidence", path="headers")
+        if ev is None:
+            # Plain requests: derive the key server-side (local snapshot etag +
+            # request policy headers → anchor index → evidence key).
+            ev = await _evidence_builder.lookup_cached(
+                anchor["id"], policy_headers=policy_hdrs,
+                prefetched={k: v for k, (v, _) in _prefetched.items()},
+            )
 
     if ev is None:
         t_expand = time.perf_counter()
@@ -1059,6 +1359,8 @@ async def v3_query(
     else:
         # cache hit: treat expand time as ~0 for telemetry
         stage_times["expand_raw"] = 0
+    if progress is not None:
+        await _stage("evidence", _evidence_summary(ev, request_id=req_id, latency_ms=stage_times.get("expand_raw", 0)))
     # Deterministic budget gate (LLM-free) — prompt-only.
     # Responsibility boundary: orchestrator computes a prompt view without mutating the public bundle view.
     try:
@@ -1106,6 +1408,7 @@ async def v3_query(
         fresh=fresh,
         policy_headers=policy_hdrs,
         gateway_plan=gate_plan,
+        on_stage=(_stage if progress is not None else None),
     )
     # v3 hardening: ensure meta.request_id is always present and matches uploads/prefixes
     try:
@@ -1114,12 +1417,12 @@ async def v3_query(
             log_stage(logger, "meta", "request_id_injected", request_id=req_id)
     except (TypeError, ValueError, AttributeError):
         pass
-    # Ship artifacts to MinIO asynchronously so download endpoints can find them.
+    # Hand artifacts to the write-behind uploader; /bundles serves them from the
+    # spool until they are visible in MinIO.
     try:
         _count = len(artifacts or {})
         if _count:
-            # For interactive FE downloads we prefer to block until objects are visible
-            await _minio_put_batch_async(req_id, artifacts)
+            await _persist_artifacts(req_id, artifacts)
             log_stage(logger, "artifacts", "minio_put_batch_scheduled",
                       request_id=req_id, count=_count)
         else:
@@ -1136,24 +1439,12 @@ async def v3_query(
             if rc is not None and isinstance(resp.meta, dict):
                 bundle_fp = resp.meta.get("bundle_fp")
                 if bundle_fp:
-                    # Guard merge by scope to avoid cross-request bleed
-                    _rec = await idem_get(rc, _idem_key)
-                    if isinstance(_rec, dict) and _rec.get("request_scope_fp") == _scope_fp:
-                        await idem_merge(
-                            rc, _idem_key, {"progress": {"bundle_fp": str(bundle_fp)}},
-                            expected_scope_fp=_scope_fp
-                        )
+                    # Scope-guarded atomic merge (avoids cross-request bleed)
+                    if await idem_merge(
+                        rc, _idem_key, {"progress": {"bundle_fp": str(bundle_fp)}},
+                        expected_scope_fp=_scope_fp
+                    ):
                         idem_log_progress(logger, key_fp=_idem_fp or "", bundle_fp=str(bundle_fp))
-                    else:
-                        try:
-                            log_stage(
-                                logger, "idem", "idem.scope_conflict.merge",
-                                key_fp=_idem_fp or "",
-                                stored_scope_fp=((_rec or {}).get("request_scope_fp")),
-                                incoming_scope_fp=_scope_fp, request_id=req_id
-                            )
-                        except (RuntimeError, ValueError, TypeError):
-                            pass
         except (OSError, RuntimeError, ValueError, TypeError) as exc:
             log_stage(logger, "idem", "idem.error", request_id=req_id, error=type(exc).__name__)
     # Write-through cache for bundle:{bundle_fp} so future SWR can serve
@@ -1163,20 +1454,12 @@ async def v3_query(
         if bundle_fp:
             key = cache_keys.bundle(str(bundle_fp))
             payload = resp.model_dump(mode="json", by_alias=True)
-            await rc.setex(key, int(TTL_BUNDLE_CACHE_SEC), jsonx.dumps(payload))
+            await RedisCache(get_redis_pool(binary=True)).setex(key, int(TTL_BUNDLE_CACHE_SEC), jsonx.dumps_bytes(payload))
             log_stage(logger, "cache", "store", layer="bundle",
                       cache_key=key, ttl=int(TTL_BUNDLE_CACHE_SEC))
-    # Decide streaming mode based on query flag or Accept header (SSE)
-    want_stream = bool(stream) or ("text/event-stream" in (request.headers.get("accept","").lower()))
-    try:
-        log_stage(logger, "stream", "mode_selected", request_id=req_id,
-                  want_stream=want_stream,
-                  reason=("accept" if want_stream and not stream else ("flag" if stream else "off")))
-    except (RuntimeError, ValueError, TypeError): pass
-    if want_stream:
-        headers = {"Cache-Control": "no-cache", "X-Request-Id": req_id}
-        log_stage(logger, "headers", "passthrough_only", request_id=req_id)
-        # Emit tokens and then the full final response envelope; mirror snapshot ETag to headers
+    if progress is not None:
+        # Progressive SSE: answer tokens were already streamed by the builder;
+        # finish with the signed final envelope and the bundle reference.
         final_payload = jsonx.sanitize(resp.model_dump(mode="python"))  # WhyDecisionResponse
         # Ensure request_id is mirrored into the final envelope's meta for FE adoption.
         try:
@@ -1196,21 +1479,13 @@ async def v3_query(
             try:
                 rc = get_redis_pool()
                 if rc is not None:
-                    _rec = await idem_get(rc, _idem_key)
-                    if isinstance(_rec, dict) and _rec.get("request_scope_fp") == _scope_fp:
-                        _rec.update({
-                            "status": "complete",
-                            "completed_at": int(time.time()),
-                            "request_id": req_id,
-                            "response": envelope,
-                        })
-                        await idem_set(rc, _idem_key, _rec)
+                    if await idem_complete(rc, _idem_key, response=envelope, request_id=req_id,
+                                           expected_scope_fp=_scope_fp):
                         idem_log_complete(logger, key_fp=_idem_fp or "", request_id=req_id, mode="stream")
                     else:
                         try:
                             log_stage(logger, "idem", "idem.scope_conflict.complete",
-                                      key_fp=_idem_fp or "", stored_scope_fp=((_rec or {}).get("request_scope_fp")),
-                                      incoming_scope_fp=_scope_fp, request_id=req_id)
+                                      key_fp=_idem_fp or "", incoming_scope_fp=_scope_fp, request_id=req_id)
                         except (RuntimeError, ValueError, TypeError):
                             pass
             except (OSError, RuntimeError, ValueError, TypeError) as exc:
@@ -1219,58 +1494,20 @@ async def v3_query(
             log_stage(logger, "request", "v3_query_end", request_id=req_id)
         except (RuntimeError, ValueError, TypeError):
             pass
-        try:
-            log_stage(
-                logger, "stream", "stream.start",
-                request_id=req_id,
-                policy_fp=envelope.get("meta", {}).get("policy_fp"),
-                bundle_fp=envelope.get("meta", {}).get("bundle_fp"),
-            )
-        except (RuntimeError, ValueError, TypeError):
-            pass
-        # Compose headers including schema + policy fingerprints (if available)
-        _hdrs = dict(headers or {"Cache-Control": "no-cache"})
-        _sfp = _schema_fp()
-        if _sfp:
-            _hdrs["X-BV-Schema-FP"] = _sfp
-        # Mirror effective policy/ids/snapshot so FE can detect mismatch early
-        try:
-            # final_payload is the WhyDecisionResponse (dict) we just built
-            _meta = (final_payload or {}).get("meta", {}) or {}
-            _pfp = _meta.get("policy_fp")
-            _aid_fp = _meta.get("allowed_ids_fp")
-            _etag = _meta.get("snapshot_etag")
-            _bfp = _meta.get("bundle_fp")
-            if _bfp:
-                _hdrs["X-BV-Bundle-FP"] = str(_bfp)
-            if _pfp:
-                _hdrs[BV_POLICY_FP] = str(_pfp)
-            if _aid_fp:
-                _hdrs[BV_ALLOWED_IDS_FP] = str(_aid_fp)
-            if _etag:
-                _hdrs[RESPONSE_SNAPSHOT_ETAG] = str(_etag)
-        except (RuntimeError, ValueError, TypeError, KeyError):
-            # Never fail streaming due to header decoration
-            pass
-        def _with_logs():
-            try:
-                log_stage(logger, "query", "stream_open", request_id=req_id)
-                # token stream + final envelope
-                yield from stream_answer_with_final(
-                    resp.answer.short_answer,
-                    envelope,
-                    include_event=include_event,
-                )
-            except (RuntimeError, ValueError, TypeError, OSError) as _exc:
-                log_stage(logger, "query", "stream_error", request_id=req_id, error=type(_exc).__name__)
-                raise
-            finally:
-                log_stage(logger, "query", "stream_close", request_id=req_id)
-        return StreamingResponse(
-            _with_logs(),
-            media_type="text/event-stream",
-            headers=_hdrs,
-        )
+        _meta = (final_payload or {}).get("meta", {}) or {}
+        log_stage(logger, "stream", "stream.final", request_id=req_id,
+                  policy_fp=_meta.get("policy_fp"), bundle_fp=_meta.get("bundle_fp"))
+        await _stage("final", envelope)
+        await _stage("bundle", {
+            "request_id": req_id,
+            "bundle_url": f"/v3/bundles/{req_id}",
+            "bundle_fp": _meta.get("bundle_fp"),
+            "policy_fp": _meta.get("policy_fp"),
+            "allowed_ids_fp": _meta.get("allowed_ids_fp"),
+            "snapshot_etag": _meta.get("snapshot_etag"),
+            "downloads": _meta.get("downloads"),
+        })
+        return None
     if routing_info:
         resp.meta.update(
             {
@@ -1293,22 +1530,14 @@ async def v3_query(
         try:
             rc = get_redis_pool()
             if rc is not None:
-                _rec = await idem_get(rc, _idem_key)
-                if isinstance(_rec, dict) and _rec.get("request_scope_fp") == _scope_fp:
-                    _rec.update({
-                        "status": "complete",
-                        "completed_at": int(time.time()),
-                        "request_id": req_id,
-                        "response": env,
-                    })
-                    await idem_set(rc, _idem_key, _rec)
+                if await idem_complete(rc, _idem_key, response=env, request_id=req_id,
+                                       expected_scope_fp=_scope_fp):
                     idem_log_complete(logger, key_fp=_idem_fp or "", request_id=req_id, mode="json")
                 else:
                     try:
                         log_stage(
                             logger, "idem", "idem.scope_conflict.complete",
-                            key_fp=_idem_fp or "", stored_scope_fp=((_rec or {}).get("request_scope_fp")),
-                            incoming_scope_fp=_scope_fp, request_id=req_id
+                            key_fp=_idem_fp or "", incoming_scope_fp=_scope_fp, request_id=req_id
                         )
                     except (RuntimeError, ValueError, TypeError):
                         pass
@@ -1587,6 +1816,15 @@ async def download_bundle(request: Request, request_id: str, name: str = Query("
     except (OSError, RuntimeError, ValueError, AttributeError):
         # leave url as fallback
         pass
+    # Archives are built by the write-behind uploader; until it has run, report pending.
+    if not presigned_ok and _ARTIFACT_WRITE_BEHIND.is_pending(rid):
+        log_stage(logger, "bundle", "pending_upload", request_id=rid, raw_rid=raw_rid,
+                  bundle=name, source="spool")
+        return JSONResponse(
+            status_code=202,
+            headers={"Retry-After": "1"},
+            content={"status": "pending", "hint": "Artifacts upload in progress", "fallback": url, "expires_in": expires_sec},
+        )
     # If we could not presign and the batch is not yet visible, surface "pending" for backoff/retry UX.
     if not presigned_ok:
         _probe = _load_bundle_dict(rid)
@@ -1751,6 +1989,64 @@ async def _ensure_minio_bucket_startup() -> None:
         # Best-effort; ops endpoint still available at /ops/minio/ensure-bucket
         pass
 
+@app.on_event("startup")
+async def _start_artifact_write_behind() -> None:
+    """Start upload workers and re-offer anything left in the spool by a previous run."""
+    try:
+        _ARTIFACT_WRITE_BEHIND.start()
+    except (RuntimeError, OSError) as exc:
+        log_stage(logger, "init", "artifact_write_behind_start_failed",
+                  error=str(exc), request_id="startup")
+
+@app.on_event("shutdown")
+async def _stop_artifact_write_behind() -> None:
+    await _ARTIFACT_WRITE_BEHIND.stop()
+
+@app.on_event("startup")
+async def _warm_reranker_startup() -> None:
+    """Load the cross-encoder once per process in the background (startup is not blocked)."""
+    if not settings.rerank_enable:
+        return
+    try:
+        from gateway.resolver.reranker import warm_reranker
+    except ImportError:
+        return
+    asyncio.ensure_future(warm_reranker())
+
+# Snapshot ETag pushes from ingest keep evidence preconditions current without HEAD probes.
+_SNAPSHOT_LISTENER: asyncio.Task | None = None
+
+@app.on_event("startup")
+async def _start_snapshot_etag_listener() -> None:
+    global _SNAPSHOT_LISTENER
+    if _SNAPSHOT_LISTENER is None or _SNAPSHOT_LISTENER.done():
+        _SNAPSHOT_LISTENER = asyncio.create_task(run_snapshot_etag_listener(), name="snapshot-etag-listener")
+
+@app.on_event("shutdown")
+async def _stop_snapshot_etag_listener() -> None:
+    global _SNAPSHOT_LISTENER
+    task, _SNAPSHOT_LISTENER = _SNAPSHOT_LISTENER, None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+# Tracks the cache generation and sweeps superseded generations after a snapshot flip.
+_GENERATION_REAPER: asyncio.Task | None = None
+
+@app.on_event("startup")
+async def _start_generation_reaper() -> None:
+    global _GENERATION_REAPER
+    if _GENERATION_REAPER is None or _GENERATION_REAPER.done():
+        _GENERATION_REAPER = asyncio.create_task(run_generation_reaper(), name="cache-generation-reaper")
+
+@app.on_event("shutdown")
+async def _stop_generation_reaper() -> None:
+    global _GENERATION_REAPER
+    task, _GENERATION_REAPER = _GENERATION_REAPER, None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
 @app.on_event("shutdown")
 async def _stop_load_shed_refresher() -> None:
     try:
@@ -0,0 +1,351 @@
+"""
+Durable write-behind for request artifacts.
+
+``v3_query`` used to wait for every MinIO ``put_object`` plus the named-bundle
+tarballs before it answered. ``ArtifactWriteBehind`` moves that work off the
+request path:
+
+  • submit  – artifacts are written to a local spool directory
+              (``<spool>/<request_id>/<name>``, staged in a temp dir and
+              renamed into place so a half-written batch is never visible),
+              then the request id is offered to a bounded in-process queue.
+  • drain   – background workers pop ids, read the batch back from the spool
+              and run the uploader in a thread with a per-attempt timeout
+              sized to the batch (per-object timeout × objects uploaded),
+              retrying with capped exponential backoff. The spool entry is
+              removed only after a successful upload.
+  • recover – on start (and on every sweep) spool entries that are not queued
+              are re-offered, so a full queue, exhausted retries or a restart
+              never loses a batch; entries older than the retention window
+              are pruned.
+
+When the ``enabled`` probe reports the upload target as disabled (MinIO not
+configured), ``submit`` drops batches instead of spooling them and nothing is
+retried: there is no upload for them to wait on. Entries left by an earlier
+process stay on disk until uploads are enabled again or retention prunes them.
+
+While an upload is pending, ``load()`` serves the batch from the spool so
+``/v3/bundles/{rid}`` works immediately after the response is returned.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+from core_logging import get_logger, log_stage
+from core_metrics import counter as metric_counter, gauge as metric_gauge
+
+logger = get_logger("gateway.artifact_spool")
+
+_TMP_PREFIX = ".tmp-"
+
+Uploader = Callable[[str, Mapping[str, bytes]], bool]
+
+
+def _safe_name(name: str) -> bool:
+    return bool(name) and name == os.path.basename(name) and name not in (".", "..")
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ArtifactWriteBehind:
+    """Spool-backed upload queue (see module docstring)."""
+
+    def __init__(
+        self,
+        spool_dir: str,
+        uploader: Uploader,
+        *,
+        queue_max: int = 256,
+        workers: int = 2,
+        max_attempts: int = 5,
+        object_timeout_s: float = 5.0,
+        extra_objects: int = 0,
+        retry_base_ms: int = 200,
+        retry_cap_ms: int = 10_000,
+        sweep_s: float = 30.0,
+        retention_s: float = 14 * 86400,
+        enabled: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self._root = Path(spool_dir)
+        self._uploader = uploader
+        self._enabled = enabled
+        self._queue_max = max(1, int(queue_max))
+        self._n_workers = max(1, int(workers))
+        self._max_attempts = max(1, int(max_attempts))
+        self._object_timeout_s = max(0.1, float(object_timeout_s))
+        self._extra_objects = max(0, int(extra_objects))
+        self._retry_base_s = max(0, int(retry_base_ms)) / 1000.0
+        self._retry_cap_s = max(0, int(retry_cap_ms)) / 1000.0
+        self._sweep_s = max(1.0, float(sweep_s))
+        self._retention_s = max(0.0, float(retention_s))
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: set[str] = set()
+        self._tasks: list[asyncio.Task] = []
+
+    # ------------------------------------------------------------------
+    # Spool I/O (blocking; always called through asyncio.to_thread)
+    # ------------------------------------------------------------------
+    def _entry(self, request_id: str) -> Path:
+        return self._root / request_id
+
+    def _write_spool(self, request_id: str, artifacts: Mapping[str, bytes]) -> bool:
+        """Persist one batch; returns False when the id is already spooled."""
+        final = self._entry(request_id)
+        if final.is_dir():
+            return False
+        self._root.mkdir(parents=True, exist_ok=True)
+        staging = self._root / f"{_TMP_PREFIX}{request_id}-{uuid.uuid4().hex[:8]}"
+        staging.mkdir()
+        try:
+            for name, blob in artifacts.items():
+                if not _safe_name(name):
+                    log_stage(logger, "artifacts", "spool_name_rejected",
+                              request_id=request_id, artifact=name)
+                    continue
+                with open(staging / name, "wb") as fh:
+                    fh.write(blob if isinstance(blob, (bytes, bytearray)) else bytes(str(blob), "utf-8"))
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            _fsync_dir(staging)
+            try:
+                os.rename(staging, final)
+            except OSError:
+                # Lost a race with a concurrent submit for the same id.
+                if final.is_dir():
+                    shutil.rmtree(staging, ignore_errors=True)
+                    return False
+                raise
+            _fsync_dir(self._root)
+            return True
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _read_spool(self, request_id: str) -> Optional[dict[str, bytes]]:
+        entry = self._entry(request_id)
+        if not entry.is_dir():
+            return None
+        out: dict[str, bytes] = {}
+        try:
+            for path in entry.iterdir():
+                if path.is_file():
+                    out[path.name] = path.read_bytes()
+        except OSError:
+            # Entry removed by a worker mid-read; MinIO is authoritative now.
+            return None
+        return out or None
+
+    def _remove_spool(self, request_id: str) -> None:
+        shutil.rmtree(self._entry(request_id), ignore_errors=True)
+
+    def _scan_spool(self) -> list[str]:
+        """Return spooled ids oldest-first; drop stale staging dirs and expired entries."""
+        if not self._root.is_dir():
+            return []
+        now = time.time()
+        entries: list[tuple[float, str]] = []
+        for path in self._root.iterdir():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if path.name.startswith(_TMP_PREFIX):
+                # Crash between write and rename; the caller never got an ack
+                # for a spool write this old, so it is safe to discard.
+                if now - mtime > self._sweep_s:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            if not path.is_dir():
+                continue
+            if self._retention_s and now - mtime > self._retention_s:
+                shutil.rmtree(path, ignore_errors=True)
+                metric_counter("gateway_artifact_spool_expired_total", 1)
+                log_stage(logger, "artifacts", "spool_entry_expired", request_id=path.name)
+                continue
+            entries.append((mtime, path.name))
+        entries.sort()
+        return [rid for _, rid in entries]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def submit(self, request_id: str, artifacts: Mapping[str, bytes]) -> bool:
+        """
+        Durably spool *artifacts* and schedule their upload.
+
+        Returns True once the batch is on local disk (or was already spooled)
+        or was dropped because uploads are disabled; False only when the spool
+        write itself failed, in which case the caller should fall back to a
+        direct upload.
+        """
+        if not _safe_name(request_id) or request_id.startswith(_TMP_PREFIX) or not artifacts:
+            return False
+        if not self.uploads_enabled():
+            metric_counter("gateway_artifact_upload_disabled_total", 1)
+            log_stage(logger, "artifacts", "write_behind_disabled",
+                      request_id=request_id, count=len(artifacts))
+            return True
+        if request_id in self._queued:
+            return True  # already spooled and waiting for upload
+        try:
+            await asyncio.to_thread(self._write_spool, request_id, dict(artifacts))
+        except OSError as exc:
+            metric_counter("gateway_artifact_spool_write_failed_total", 1)
+            log_stage(logger, "artifacts", "spool_write_failed",
+                      request_id=request_id, error=str(exc))
+            return False
+        self.start()
+        self._offer(request_id)
+        return True
+
+    def uploads_enabled(self) -> bool:
+        """False when the ``enabled`` probe says the upload target is not configured."""
+        if self._enabled is None:
+            return True
+        try:
+            return bool(self._enabled())
+        except Exception:
+            return True  # an unreadable probe must not drop batches
+
+    def is_pending(self, request_id: str) -> bool:
+        return _safe_name(request_id) and self._entry(request_id).is_dir()
+
+    def load(self, request_id: str) -> Optional[dict[str, bytes]]:
+        """Artifacts still waiting for upload, or None (blocking; small reads)."""
+        if not _safe_name(request_id):
+            return None
+        return self._read_spool(request_id)
+
+    def start(self) -> None:
+        """Start workers and the recovery sweeper on the running loop (idempotent)."""
+        if self._tasks and not all(t.done() for t in self._tasks):
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_max)
+        self._queued.clear()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"artifact-upload-{i}")
+            for i in range(self._n_workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._sweeper(), name="artifact-spool-sweeper"))
+        log_stage(logger, "init", "artifact_write_behind_started",
+                  spool_dir=str(self._root), workers=self._n_workers,
+                  queue_max=self._queue_max, request_id="startup")
+
+    async def stop(self) -> None:
+        """Cancel workers; anything not yet uploaded stays in the spool."""
+        tasks, self._tasks = self._tasks, []
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _offer(self, request_id: str) -> None:
+        if self._queue is None or request_id in self._queued:
+            return
+        try:
+            self._queue.put_nowait(request_id)
+        except asyncio.QueueFull:
+            # Stays on disk; the next sweep offers it again.
+            metric_counter("gateway_artifact_queue_full_total", 1)
+            log_stage(logger, "artifacts", "write_behind_queue_full",
+                      request_id=request_id, queue_max=self._queue_max)
+            return
+        self._queued.add(request_id)
+        metric_gauge("gateway_artifact_queue_depth", self._queue.qsize())
+
+    def _attempt_timeout_s(self, artifacts: Mapping[str, bytes]) -> float:
+        """Upper bound for one attempt: every object of the batch (plus the
+        uploader's ``extra_objects``) at its per-object timeout, so a slow but
+        successful upload is never cut off and uploaded twice."""
+        return self._object_timeout_s * (len(artifacts) + self._extra_objects)
+
+    def _backoff_s(self, attempt: int) -> float:
+        return min(self._retry_cap_s, self._retry_base_s * (2 ** (attempt - 1)))
+
+    async def _upload_one(self, request_id: str) -> bool:
+        if not self.uploads_enabled():
+            return False  # nothing to retry against; the entry stays spooled
+        artifacts = await asyncio.to_thread(self._read_spool, request_id)
+        if not artifacts:
+            return True  # already uploaded and removed by an earlier attempt
+        for attempt in range(1, self._max_attempts + 1):
+            t0 = time.perf_counter()
+            try:
+                ok = await asyncio.wait_for(
+                    asyncio.to_thread(self._uploader, request_id, artifacts),
+                    timeout=self._attempt_timeout_s(artifacts),
+                )
+                error = None if ok else "uploader_unavailable"
+            except asyncio.TimeoutError:
+                ok, error = False, "timeout"
+            except Exception as exc:
+                ok, error = False, type(exc).__name__
+            if ok:
+                await asyncio.to_thread(self._remove_spool, request_id)
+                metric_counter("gateway_artifact_upload_ok_total", 1)
+                log_stage(logger, "artifacts", "write_behind_uploaded",
+                          request_id=request_id, attempt=attempt, count=len(artifacts),
+                          latency_ms=int((time.perf_counter() - t0) * 1000))
+                return True
+            metric_counter("gateway_artifact_upload_retry_total", 1, reason=error or "unknown")
+            log_stage(logger, "artifacts", "write_behind_attempt_failed",
+                      request_id=request_id, attempt=attempt, error=error)
+            if attempt < self._max_attempts:
+                await asyncio.sleep(self._backoff_s(attempt))
+        metric_counter("gateway_artifact_upload_parked_total", 1)
+        log_stage(logger, "artifacts", "write_behind_parked",
+                  request_id=request_id, attempts=self._max_attempts,
+                  hint="left in spool; retried on next sweep")
+        return False
+
+    async def _worker(self, idx: int) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            request_id = await queue.get()
+            try:
+                await self._upload_one(request_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # a worker must never die on one bad batch
+                log_stage(logger, "artifacts", "write_behind_worker_error",
+                          request_id=request_id, worker=idx, error=type(exc).__name__)
+            finally:
+                self._queued.discard(request_id)
+                queue.task_done()
+                metric_gauge("gateway_artifact_queue_depth", queue.qsize())
+
+    async def _sweeper(self) -> None:
+        while True:
+            try:
+                pending = await asyncio.to_thread(self._scan_spool)
+                metric_gauge("gateway_artifact_spool_pending", len(pending))
+                if self.uploads_enabled():
+                    for request_id in pending:
+                        self._offer(request_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log_stage(logger, "artifacts", "spool_sweep_failed",
+                          error=type(exc).__name__, request_id="spool")
+            await asyncio.sleep(self._sweep_s)
@@ -1,12 +1,13 @@
 from __future__ import annotations
-from typing import Any, Tuple, Dict
+from typing import Any, Awaitable, Callable, Tuple, Dict
 import time, uuid, os
 from datetime import datetime, timezone
 from core_models_gen import GraphEdgesModel
 from core_utils.graph import derive_events_from_edges
-from core_utils.fingerprints import canonical_json, sha256_hex
+from core_utils.fingerprints import canonical_json
 from core_logging import get_logger, trace_span, log_stage, current_request_id
 from .signing import select_and_sign, SigningError
+from .manifest import ArtifactDigests, MANIFEST_NAME
 from core_models.ontology import CAUSAL_EDGE_TYPES, canonical_edge_type
 try:
     # Prefer the selector's authoritative policy identifier
@@ -52,7 +53,7 @@ def _get_cache() -> RedisCache:
     """
     global _cache
     if _cache is None:
-        client = get_redis_pool()
+        client = get_redis_pool(binary=True)
         _cache = RedisCache(client)
     return _cache
 
@@ -65,6 +66,7 @@ def _build_exec_summary_envelope(
     ev_obj: Any,
     mem_meta: Dict[str, Any],
     request_id: str,
+    ev_dump: Dict[str, Any] | None = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any], str]:
     _t0 = time.perf_counter()
     """
@@ -79,7 +81,8 @@ def _build_exec_summary_envelope(
     src = dict(response_obj or {})
     # Prefer explicit Evidence object; fallback to any embedded dict in response_obj.
     try:
-        ev  = (ev_obj.model_dump(mode="python", exclude_none=True)
+        ev  = (ev_dump if ev_dump is not None
+               else ev_obj.model_dump(mode="python", exclude_none=True)
                if hasattr(ev_obj, "model_dump")
                else dict(ev_obj or {}))
     except (AttributeError, TypeError, ValueError, KeyError, RuntimeError, OSError):
@@ -390,9 +393,10 @@ def _evidence_cache_key_from_ev(ev: WhyDecisionEvidence) -> str | None:
         return cache_keys.evidence(etag, allowed_ids_fp, policy_fp)
     return None
 
-async def store_evidence_cache(ev: WhyDecisionEvidence) -> None:
+async def store_evidence_cache(ev: WhyDecisionEvidence, *, payload: bytes | None = None) -> None:
     """
     Persist the masked evidence JSON under its composite cache key with TTL_EVIDENCE_CACHE_SEC.
+    ``payload`` lets the builder reuse bytes it already serialized for artifacts.
     No broad exception handling: simply no-ops if meta is incomplete.
     """
     k = _evidence_cache_key_from_ev(ev)
@@ -401,7 +405,7 @@ async def store_evidence_cache(ev: WhyDecisionEvidence) -> None:
     await _get_cache().setex(
         k,
         int(TTL_EVIDENCE_CACHE_SEC),
-        jsonx.dumps(ev.model_dump(mode="python", exclude_none=True)),
+        payload if payload is not None else jsonx.dumps_bytes(ev.model_dump(mode="python", exclude_none=True)),
     )
     try:
         _rid = (current_request_id() or "unknown")
@@ -412,6 +416,16 @@ async def store_evidence_cache(ev: WhyDecisionEvidence) -> None:
               request_id=_rid)
 
 # ───────────────────── main entry-point ─────────────────────────
+def short_answer_text(answer: WhyDecisionAnswer | None) -> str:
+    """Plain-text short answer: explicit ``short_answer`` if set, else the lead block."""
+    if answer is None:
+        return ""
+    explicit = (answer.model_extra or {}).get("short_answer")
+    if isinstance(explicit, str) and explicit:
+        return explicit
+    blocks = getattr(answer, "blocks", None)
+    return str(getattr(blocks, "lead", "") or "")
+
 async def build_why_decision_response(
     req: "AskIn",                          # forward-declared (defined in app.py)
     evidence_builder,                      # EvidenceBuilder instance (singleton passed from app.py)
@@ -420,10 +434,14 @@ async def build_why_decision_response(
     fresh: bool = False,                   # bypass caches when gathering evidence
     policy_headers: dict | None = None,    # pass policy headers through to Memory API
     stage_times: dict | None = None,       # STAGE 5: accumulate per-stage latencies (ms)
-    gateway_plan: dict | None = None) -> Tuple[WhyDecisionResponse, Dict[str, bytes], str]:
+    gateway_plan: dict | None = None,
+    on_stage: Callable[[str, dict], Awaitable[None]] | None = None,  # progressive SSE hook
+) -> Tuple[WhyDecisionResponse, Dict[str, bytes], str]:
     """
     Assemble Why-Decision response and audit artifacts.
     Returns (response, artifacts_dict, request_id).
+    ``on_stage`` (optional) is awaited with ("short_answer", {...}) as soon as
+    the templated answer exists, ahead of signing, validation and persistence.
     """
     t0      = time.perf_counter()
     # Prefer explicit request_id from the AskIn. Do NOT reuse a stale/global id.
@@ -455,20 +473,23 @@ async def build_why_decision_response(
     _ctx_anchor_id = (getattr(getattr(ev, "anchor", None), "id", None) or "unknown")
     _ctx_bundle_fp = "unknown"  # Filled once envelope fingerprints are computed.
 
-    artifacts["evidence_pre.json"] = jsonx.dumps(ev.model_dump(mode="python", exclude_none=True)).encode()
+    # Serialize the incoming evidence once: evidence_pre.json, evidence_canonical.json
+    # and the Redis evidence cache all carry these same canonical bytes.
+    _ev_pre_bytes = jsonx.dumps_bytes(ev.model_dump(mode="python", exclude_none=True))
+    artifacts["evidence_pre.json"] = _ev_pre_bytes
 
     # Persist deterministic gateway plan (strongly typed by schema)
     if gateway_plan is None:
         raise ValueError("gateway_plan not provided")
-    artifacts["gateway.plan.json"] = jsonx.dumps(gateway_plan).encode()
+    artifacts["gateway.plan.json"] = jsonx.dumps_bytes(gateway_plan)
 
     # Persist canonicalised, pre-gate evidence (post-dedupe, pre-trim)
-    artifacts["evidence_canonical.json"] = jsonx.dumps(ev.model_dump(mode="python", exclude_none=True)).encode()
+    artifacts["evidence_canonical.json"] = _ev_pre_bytes
     log_stage(logger, "builder", "evidence_final_persisted",
               request_id=req_id,
               allowed_ids=len(getattr(ev, "allowed_ids", []) or []))
     # Write-through to Redis evidence cache (keyed by snapshot/policy/allowed_ids)
-    await store_evidence_cache(ev)
+    await store_evidence_cache(ev, payload=_ev_pre_bytes)
 
     try:
         from core_config import get_settings as _get_settings
@@ -602,7 +623,9 @@ async def build_why_decision_response(
                   request_id=req_id, error=type(e).__name__,
                   anchor_id=_ctx_anchor_id, bundle_fp=_ctx_bundle_fp)
         raise
-    artifacts["evidence_post.json"] = jsonx.dumps(ev.model_dump(mode="python", exclude_none=True)).encode()
+    # Post-orientation evidence: dumped once, reused for the envelope projection below.
+    _ev_post = ev.model_dump(mode="python", exclude_none=True)
+    artifacts["evidence_post.json"] = jsonx.dumps_bytes(_ev_post)
     # v3: events not attached to evidence; ranking kept internal for meta if needed.
 
 # Build new meta inputs
@@ -901,6 +924,8 @@ async def build_why_decision_response(
     # 3) Compute deterministic citations within allowed_ids (unchanged policy)
     cited = _compute_cited_ids(ev)
     ans = WhyDecisionAnswer(blocks=t_blocks, cited_ids=cited)
+    if on_stage is not None:
+        await on_stage("short_answer", {"short_answer": short_answer_text(ans), "cited_ids": list(cited or [])})
 
     # Forward-looking shape: WhyDecisionResponse requires top-level anchor/graph.
     # Keep extra fields (e.g., intent, bundle_url) harmlessly via extra="allow".
@@ -952,6 +977,7 @@ async def build_why_decision_response(
         response_obj=resp.model_dump(mode="python", by_alias=True, exclude_none=True),
         ts_utc=str(meta_dict.get("request", {}).get("ts_utc") or _ts_utc),
         ev_obj=ev,
+        ev_dump=_ev_post,
         mem_meta=(getattr(ev, "meta", None) or {}),
         request_id=req_id,
     )
@@ -967,17 +993,17 @@ async def build_why_decision_response(
         except (AttributeError, TypeError, ValueError, OSError, RuntimeError):
             pass
     _ctx_bundle_fp = bundle_fp_final or _ctx_bundle_fp
-    artifacts["response.json"] = jsonx.dumps(envelope).encode("utf-8")
-    artifacts["receipt.json"]  = jsonx.dumps(signature).encode("utf-8")
+    artifacts["response.json"] = jsonx.dumps_bytes(envelope)
+    artifacts["receipt.json"]  = jsonx.dumps_bytes(signature)
     # Optional: persist the bundle to Redis using the canonical key (now that bundle_fp is known).
     try:
-        redis_client = get_redis_pool()
+        redis_client = get_redis_pool(binary=True)
         if redis_client is not None and isinstance(bundle_fp_final, str) and bundle_fp_final:
             rc = RedisCache(redis_client)
             # Artifacts are JSON → store a single JSON object for speed (deterministic: sort keys).
-            serialized = jsonx.dumps(
+            serialized = jsonx.dumps_bytes(
                 {k: (v.decode("utf-8") if isinstance(v, (bytes, bytearray)) else str(v)) for k, v in artifacts.items()}
-            ).encode("utf-8")
+            )
             await rc.setex(cache_keys.bundle(bundle_fp_final), int(TTL_BUNDLE_CACHE_SEC), serialized)
             log_stage(logger, "bundle", "redis_cached",
                       bundle_fp=bundle_fp_final, bytes=len(serialized))
@@ -1042,40 +1068,19 @@ async def build_why_decision_response(
         "response_preview": trace_base.get("response_preview", {}),
         "validator": {},  # filled by run_validator() below
     }
-    artifacts["trace.json"] = jsonx.dumps(trace_view).encode("utf-8")
-    # Compute bundle.manifest.json deterministically over current artifacts BEFORE validation
-    import mimetypes
-    items = []
-    for name in sorted(artifacts.keys()):
-        blob = artifacts[name]
-        h = sha256_hex(blob)
-        ctype = mimetypes.guess_type(name, strict=False)[0] or "application/json"
-        items.append({"name": name, "sha256": h, "bytes": len(blob), "content_type": ctype})
-    artifacts["bundle.manifest.json"] = jsonx.dumps({"artifacts": items}).encode("utf-8")
-    # Sanity checks
-    assert "bundle.manifest.json" in artifacts, "builder: missing bundle.manifest.json before validation"
+    artifacts["trace.json"] = jsonx.dumps_bytes(trace_view)
+    # One digest registry per request: every blob is hashed once and shared by
+    # the view manifest, the validator's manifest check and the full manifest.
+    digests = ArtifactDigests()
 
     # Stage-7 validator report (delegates to core validator) and fail-closed.
     from .validator import view_artifacts_allowed
     from .validator import run_validator as _run_validator
     _allowed = view_artifacts_allowed()
-    _artifacts_for_view = {k: v for k, v in artifacts.items() if k in _allowed}
-    # Recompute a bundle.manifest.json strictly for the view subset.
-    # IMPORTANT: exclude the manifest itself when computing the manifest to avoid
-    # self-hash/size mismatches (the subset currently contains the full-bundle manifest).
-    _artifacts_for_view.pop("bundle.manifest.json", None)
-    _items_view = []
-    for _name in sorted(_artifacts_for_view.keys()):
-        _blob = _artifacts_for_view[_name]
-        _sha  = sha256_hex(_blob)
-        _ctype = mimetypes.guess_type(_name, strict=False)[0] or "application/json"
-        _items_view.append({"name": _name, "sha256": _sha, "bytes": len(_blob), "content_type": _ctype})
-    _artifacts_for_view["bundle.manifest.json"] = jsonx.dumps({"artifacts": _items_view}).encode("utf-8")
-    # Defensive: the view manifest must not list itself (prevents non-convergent fixed points).
-    _mn = [it.get("name") for it in (jsonx.loads(_artifacts_for_view["bundle.manifest.json"]).get("artifacts") or [])]
-    assert "bundle.manifest.json" not in _mn, "view manifest must not list itself"
-    # Sanity: validator input must include a manifest that matches its own subset.
-    assert "bundle.manifest.json" in _artifacts_for_view, "validator input missing bundle.manifest.json"
+    _artifacts_for_view = {k: v for k, v in artifacts.items() if k in _allowed and k != MANIFEST_NAME}
+    # The view manifest never lists itself (prevents non-convergent fixed points).
+    _artifacts_for_view[MANIFEST_NAME], _items_view = digests.manifest(_artifacts_for_view)
+    assert all(it.get("name") != MANIFEST_NAME for it in _items_view), "view manifest must not list itself"
     # Helpful audit log of exactly what the validator sees.
     log_stage(
         logger, "validator", "input_inventory",
@@ -1088,18 +1093,24 @@ async def build_why_decision_response(
         envelope,   # validate the response (bundle_fp still lives in meta)
         _artifacts_for_view,
         request_id=req_id,
+        digests=digests,
     )
-    artifacts["validator_report.json"] = jsonx.dumps(_val_report).encode("utf-8")
+    artifacts["validator_report.json"] = jsonx.dumps_bytes(_val_report)
 
     # Enrich trace with validator outcome (best-effort; keep base trace on failure).
+    # The trace dict is still in hand, so update it in place instead of re-parsing the bytes.
     try:
-        _trace = jsonx.loads(artifacts["trace.json"])
-        _trace.setdefault("gateway_path", {})["validation"] = {
+        trace_view.setdefault("gateway_path", {})["validation"] = {
             "error_count": int(len(_val_report.get("errors", []) or []))
         }
-        artifacts["trace.json"] = jsonx.dumps(_trace).encode("utf-8")
+        artifacts["trace.json"] = jsonx.dumps_bytes(trace_view)
     except (KeyError, ValueError, TypeError) as e:
         log_stage(logger, "trace", "validation_enrich_failed", request_id=req_id, error=type(e).__name__)
+    # Full-bundle manifest over the final artifacts (enriched trace and validator
+    # report included); unchanged blobs reuse their digests from the view pass.
+    artifacts[MANIFEST_NAME], _ = digests.manifest(artifacts)
+    log_stage(logger, "bundle", "manifest_digests",
+              request_id=req_id, hashed=digests.hashed, reused=digests.reused)
     # Baseline metric: count validator errors (kept, but emitted in a single place).
     try:
         metric_counter("validator_errors", float(len(_val_report.get("errors", []))), request_id=req_id)
@@ -1123,14 +1134,13 @@ async def build_why_decision_response(
             detail={"error": "bundle_validation_failed", "errors": (_val_report.get("errors") or [])[:5]},
         )
 
-    # Optionally persist artifacts to MinIO without blocking the request path.
+    # Persist artifacts via the write-behind spool (local disk only; the MinIO
+    # upload runs in background workers).
     try:
         # Lazy-import to avoid hard runtime dep in tests/local.
-        from gateway.app import _minio_put_batch_async as _minio_save
-        import asyncio as _asyncio
-        # Snapshot the dict to avoid concurrent mutations while uploading
-        _snapshot = dict(artifacts)
-        _asyncio.create_task(_minio_save(req_id, _snapshot))
+        from gateway.app import _persist_artifacts as _artifact_save
+        # Snapshot the dict to avoid concurrent mutations while spooling
+        await _artifact_save(req_id, dict(artifacts))
     except (ImportError, RuntimeError, OSError) as _minio_err:
         # MinIO not configured or background scheduling failed — log and continue.
         log_stage(logger, "builder", "artifact_upload_skipped",
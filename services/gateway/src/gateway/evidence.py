@@ -1,14 +1,17 @@
 # Imports
 from __future__ import annotations
-import asyncio, httpx
+import asyncio, httpx, time
+from redis.exceptions import RedisError
 from core_utils.fingerprints import allowed_ids_fp, ensure_sha256_prefix, graph_fp as compute_graph_fp
+from core_utils.fingerprints import canonical_json, sha256_hex
 from typing import Any, Optional
 from core_metrics import counter as _ctr
 from core_cache.redis_client import get_redis_pool
+from core_cache.redis_cache import RedisCache
 from core_utils import jsonx
 from core_config import get_settings
 from core_logging import get_logger, trace_span, log_stage, current_request_id
-from core_http.client import fetch_json, get_http_client
+from core_http.client import fetch_json
 from core_http.headers import BV_POLICY_FP, BV_ALLOWED_IDS_FP, REQUEST_SNAPSHOT_ETAG
 from core_observability.otel import inject_trace_context
 from fastapi import HTTPException
@@ -21,7 +24,9 @@ from core_models_gen import (
     MemoryMetaModel,
 )
 from .selector import bundle_size_bytes
-from core_http.headers import RESPONSE_SNAPSHOT_ETAG, IF_NONE_MATCH
+from core_http.headers import RESPONSE_SNAPSHOT_ETAG
+from core_http.headers import REQUIRED_POLICY_HEADERS_LOWER, OPTIONAL_POLICY_HEADERS_LOWER
+from core_cache import keys as cache_keys
 from core_models.ontology import canonical_edge_type
 
 settings        = get_settings()
@@ -66,41 +71,32 @@ def _raise_as_http_exception(exc: httpx.HTTPError, *, url: str | None = None, st
 async def expand_graph(decision_id: str, *, intent: str | None = None, k: int = 1, policy_headers: dict | None = None):
     settings = get_settings()
     payload = {"anchor": decision_id}
-    # Snapshot-bind: fetch the current ETag via HEAD, then send it as X-Snapshot-ETag.
+    # Snapshot-bind optimistically with the locally tracked ETag; retry once on 412.
+    hdr_etag = current_snapshot_etag()
     try:
-        client = get_http_client(timeout_ms=int(settings.timeout_expand_ms))
-        head_resp = await client.request(
-            "HEAD",
-            f"{settings.memory_api_url}/api/enrich",
-            params={"anchor": decision_id},
-            headers=inject_trace_context(dict(policy_headers or {})),
-        )
-        hdr_etag = _extract_snapshot_etag(head_resp)
-    except (httpx.HTTPStatusError, httpx.RequestError, OSError, asyncio.TimeoutError, ValueError):
-        hdr_etag = "unknown"
-    try:
-        data = await fetch_json(
+        data, hdrs = await fetch_json(
             "POST",
             f"{settings.memory_api_url}/api/graph/expand_candidates",
             json=payload,
             stage="expand",
             headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: hdr_etag, **(dict(policy_headers or {}))}),
+            return_headers=True,
         )
+        note_snapshot_etag(_header_etag(hdrs))
         # v3 contract: prefer edges-only graph view from Memory
         return data or {"graph": {"edges": []}, "meta": {}}
     except httpx.HTTPStatusError as exc:
         # Single retry on snapshot drift: prefer the server's advertised ETag.
-        if exc.response is not None and exc.response.status_code == 412:
-            new_etag = _extract_snapshot_etag(exc.response) or "unknown"
-            if new_etag and new_etag != hdr_etag:
-                data = await fetch_json(
-                    "POST",
-                    f"{settings.memory_api_url}/api/graph/expand_candidates",
-                    json=payload,
-                    stage="expand",
-                    headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
-                )
-                return data or {"graph": {"edges": []}, "meta": {}}
+        new_etag = _precondition_etag(exc, hdr_etag, stage="expand")
+        if new_etag:
+            data = await fetch_json(
+                "POST",
+                f"{settings.memory_api_url}/api/graph/expand_candidates",
+                json=payload,
+                stage="expand",
+                headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
+            )
+            return data or {"graph": {"edges": []}, "meta": {}}
         _raise_as_http_exception(exc, url=f"{settings.memory_api_url}/api/graph/expand_candidates", stage="expand")
     except (OSError, asyncio.TimeoutError, ValueError) as exc:
         logger.warning("expand_candidates_failed", extra={"anchor_id": decision_id, "error": type(exc).__name__})
@@ -110,7 +106,7 @@ async def expand_graph(decision_id: str, *, intent: str | None = None, k: int =
 def _make_cache_key(ev) -> str:
     """
     Evidence (masked) key via core_cache:
-      bv:gw:v1:evidence:{snapshot_etag}|{allowed_ids_fp}|{policy_fp}
+      bv:gw:v1:evidence:g{generation}:{snapshot_etag}|{allowed_ids_fp}|{policy_fp}
     """
     from core_cache import keys as cache_keys
     try:
@@ -138,6 +134,110 @@ def _make_cache_key(ev) -> str:
         pol_fp = ""
     return cache_keys.evidence(str(ev.snapshot_etag or "unknown"), ids_fp, pol_fp)
 
+# ── Snapshot etag tracking (no HEAD probes) ──────────────────────────────────
+# The gateway keeps the last snapshot etag Memory reported and sends it
+# optimistically as X-Snapshot-ETag. Memory mirrors the current etag on every
+# response (412s included) and ingest pushes changes on SNAPSHOT_ETAG_CHANNEL,
+# so a stale value costs one 412 + retry and steady state costs nothing.
+# The snapshot is corpus-wide: any Memory response refreshes it.
+_SNAPSHOT_SEEN: tuple[str, float] | None = None   # (etag, monotonic seen-at)
+_SNAPSHOT_PUSH_ACTIVE = False
+
+def note_snapshot_etag(etag: str | None, *, source: str = "response") -> None:
+    global _SNAPSHOT_SEEN
+    if not etag or etag == "unknown":
+        return
+    previous = _SNAPSHOT_SEEN[0] if _SNAPSHOT_SEEN else None
+    _SNAPSHOT_SEEN = (str(etag), time.monotonic())
+    if previous != etag:
+        _ctr("gateway_snapshot_etag_update_total", 1, source=source)
+        log_stage(logger, "snapshot", "snapshot_etag_changed",
+                  source=source, snapshot_etag=str(etag), request_id="snapshot")
+
+def current_snapshot_etag() -> str:
+    """Last known snapshot etag ("unknown" until Memory has answered once)."""
+    seen = _SNAPSHOT_SEEN
+    return seen[0] if seen else "unknown"
+
+def recent_snapshot_etag(max_age_ms: int) -> str | None:
+    """
+    The locally cached snapshot etag if it is recent enough to build cache keys
+    without asking Memory, else None. While the push channel is connected the
+    value is trusted for SNAPSHOT_ETAG_MAX_AGE_MS (as Memory does).
+    """
+    seen = _SNAPSHOT_SEEN
+    if seen is None or max_age_ms <= 0:
+        return None
+    if _SNAPSHOT_PUSH_ACTIVE:
+        max_age_ms = max(max_age_ms, int(settings.snapshot_etag_max_age_ms))
+    etag, at = seen
+    return etag if (time.monotonic() - at) * 1000.0 <= max_age_ms else None
+
+async def run_snapshot_etag_listener() -> None:
+    """Apply snapshot etag pushes from ingest; reconnects with capped backoff until cancelled."""
+    global _SNAPSHOT_PUSH_ACTIVE
+    channel = settings.snapshot_etag_channel
+    attempt = 0
+    while True:
+        pubsub = None
+        try:
+            client = get_redis_pool()
+            if client is None:
+                raise RuntimeError("redis_unavailable")
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(channel)
+            _SNAPSHOT_PUSH_ACTIVE = True
+            attempt = 0
+            log_stage(logger, "snapshot", "snapshot_etag_subscribed",
+                      channel=channel, request_id="startup")
+            while True:
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if msg and msg.get("type") == "message":
+                    data = msg.get("data")
+                    if isinstance(data, (bytes, bytearray)):
+                        data = data.decode("utf-8", "replace")
+                    note_snapshot_etag(str(data or "").strip() or None, source="push")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # the listener must outlive Redis outages
+            attempt += 1
+            if attempt == 1:
+                log_stage(logger, "snapshot", "snapshot_etag_listener_degraded",
+                          error=type(exc).__name__, channel=channel, request_id="snapshot")
+        finally:
+            _SNAPSHOT_PUSH_ACTIVE = False
+            if pubsub is not None:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+        await asyncio.sleep(min(1.0 * attempt, 30.0))
+
+def _precondition_etag(exc: httpx.HTTPStatusError, sent: str, *, stage: str) -> str | None:
+    """On a 412, learn Memory's current etag and return it when a retry can help."""
+    if exc.response is None or exc.response.status_code != 412:
+        return None
+    new_etag = _extract_snapshot_etag(exc.response)
+    if not new_etag or new_etag == sent:
+        return None
+    note_snapshot_etag(new_etag, source="precondition")
+    _ctr("gateway_snapshot_precondition_retry_total", 1, stage=stage)
+    return new_etag
+
+def request_policy_fp(policy_headers: dict | None) -> str:
+    """
+    Fingerprint of the policy/identity inputs a request sends to Memory.
+    Memory derives its policy_fp from exactly these headers (X-Policy-Version
+    and X-Policy-Key included), so equal inputs map to the same masked view.
+    """
+    src = {str(k).lower(): str(v).strip() for k, v in (policy_headers or {}).items()}
+    picked = {
+        name: src[name]
+        for name in (*REQUIRED_POLICY_HEADERS_LOWER, *OPTIONAL_POLICY_HEADERS_LOWER)
+        if src.get(name)
+    }
+    return ensure_sha256_prefix(sha256_hex(canonical_json(picked)))
+
 def _extract_snapshot_etag(resp: Any) -> str:
     """
     Extract the mirrored snapshot ETag from a Memory response.
@@ -161,6 +261,16 @@ def _extract_snapshot_etag(resp: Any) -> str:
             pass
     return "unknown"
 
+def _header_etag(headers: dict | None) -> str | None:
+    """Mirrored snapshot ETag from a ``fetch_json(..., return_headers=True)`` header dict."""
+    if not headers:
+        return None
+    key = str(RESPONSE_SNAPSHOT_ETAG).lower()
+    for k, v in headers.items():
+        if str(k).lower() == key and v:
+            return str(v)
+    return None
+
 # EvidenceBuilder class
 class EvidenceBuilder:
     def __init__(self, *, redis_client: Optional[Any] = None):
@@ -192,22 +302,9 @@ class EvidenceBuilder:
 
         with trace_span("gateway.plan", logger=logger, anchor_id=anchor_id):
             plan = {"anchor": anchor_id}
-            # Use configured per-stage budgets; defaults already come from constants/env.
-            enrich_ms = int(settings.timeout_enrich_ms)
-            expand_ms = int(settings.timeout_expand_ms)
-            enrich_client = get_http_client(timeout_ms=int(enrich_ms))
-            expand_client = get_http_client(timeout_ms=int(expand_ms))
-            # Probe snapshot etag via cheap HEAD to snapshot-bind subsequent reads
-            try:
-                head_resp = await expand_client.request(
-                    "HEAD",
-                    f"{settings.memory_api_url}/api/enrich",
-                    params={"anchor": anchor_id},
-                    headers=inject_trace_context(dict(policy_headers or {})),
-                )
-                hdr_etag = _extract_snapshot_etag(head_resp)
-            except (httpx.HTTPStatusError, httpx.RequestError, OSError, asyncio.TimeoutError, ValueError):
-                hdr_etag = "unknown"
+            # Snapshot-bind optimistically with the locally tracked ETag (no HEAD
+            # probe); each call retries once with Memory's ETag on 412.
+            hdr_etag = current_snapshot_etag()
 
             # Concurrently fetch anchor and neighbors; each task handles its own errors
             anchor_json: dict = {"id": anchor_id}
@@ -238,21 +335,20 @@ class EvidenceBuilder:
                         stage="enrich",
                         return_headers=True,
                     )
-                    # Do not overwrite the snapshot etag learned via HEAD; enrich mirrors it in headers.
-                    # (enrich does not include snapshot_etag in the JSON body by design).
+                    # enrich mirrors the snapshot etag in headers only (not in the JSON body).
                 except httpx.HTTPStatusError as exc:
                     # Retry once on snapshot drift using the ETag from the 412 response
-                    if exc.response is not None and exc.response.status_code == 412:
-                        new_etag = _extract_snapshot_etag(exc.response) or "unknown"
-                        if new_etag and new_etag != hdr_etag:
-                            anchor_json = await fetch_json(
-                                "GET",
-                                f"{settings.memory_api_url}/api/enrich",
-                                params={"anchor": anchor_id},
-                                headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
-                                stage="enrich",
-                            )
-                            return
+                    new_etag = _precondition_etag(exc, hdr_etag, stage="enrich")
+                    if new_etag:
+                        anchor_json, _hdrs_anchor = await fetch_json(
+                            "GET",
+                            f"{settings.memory_api_url}/api/enrich",
+                            params={"anchor": anchor_id},
+                            headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
+                            stage="enrich",
+                            return_headers=True,
+                        )
+                        return
                     # Otherwise, propagate
                     _raise_as_http_exception(exc, url=f"{settings.memory_api_url}/api/enrich", stage="enrich")
                 except httpx.RequestError as exc:
@@ -284,19 +380,19 @@ class EvidenceBuilder:
                     policy_trace = neigh.get("policy_trace") or {}
                 except httpx.HTTPStatusError as exc:
                     # Retry once on snapshot drift using the ETag from the 412 response
-                    if exc.response is not None and exc.response.status_code == 412:
-                        new_etag = _extract_snapshot_etag(exc.response) or "unknown"
-                        if new_etag and new_etag != hdr_etag:
-                            neigh = await fetch_json(
-                                "POST",
-                                f"{settings.memory_api_url}/api/graph/expand_candidates",
-                                json=plan,
-                                headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
-                                stage="expand",
-                            )
-                            meta = neigh.get("meta") or {}
-                            policy_trace = neigh.get("policy_trace") or {}
-                            return
+                    new_etag = _precondition_etag(exc, hdr_etag, stage="expand")
+                    if new_etag:
+                        neigh, _hdrs_expand = await fetch_json(
+                            "POST",
+                            f"{settings.memory_api_url}/api/graph/expand_candidates",
+                            json=plan,
+                            headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
+                            stage="expand",
+                            return_headers=True,
+                        )
+                        meta = neigh.get("meta") or {}
+                        policy_trace = neigh.get("policy_trace") or {}
+                        return
                     # Otherwise, propagate
                     _raise_as_http_exception(exc, url=f"{settings.memory_api_url}/api/graph/expand_candidates", stage="expand")
                 except httpx.RequestError as exc:
@@ -311,9 +407,50 @@ class EvidenceBuilder:
                         request_id=(current_request_id() or "unknown")
                     )
 
-            log_stage(logger, "evidence", "concurrent_fetch_start", anchor_id=anchor_id)
-            await asyncio.gather(_fetch_anchor(), _expand_neighbors())
-            log_stage(logger, "evidence", "concurrent_fetch_done", anchor_id=anchor_id)
+            async def _fetch_fused():
+                # One Memory call: enriched anchor + graph view share policy, snapshot and OPA work.
+                nonlocal anchor_json, neigh, meta, policy_trace, _hdrs_anchor, _hdrs_expand
+                url = f"{settings.memory_api_url}/api/evidence"
+                try:
+                    data, hdrs = await fetch_json(
+                        "POST", url, json=plan,
+                        headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: hdr_etag, **(dict(policy_headers or {}))}),
+                        stage="enrich",
+                        return_headers=True,
+                    )
+                except httpx.HTTPStatusError as exc:
+                    new_etag = _precondition_etag(exc, hdr_etag, stage="evidence")
+                    if not new_etag:
+                        _raise_as_http_exception(exc, url=url, stage="evidence")
+                    data, hdrs = await fetch_json(
+                        "POST", url, json=plan,
+                        headers=inject_trace_context({REQUEST_SNAPSHOT_ETAG: new_etag, **(dict(policy_headers or {}))}),
+                        stage="enrich",
+                        return_headers=True,
+                    )
+                except httpx.RequestError as exc:
+                    _raise_as_http_exception(exc, url=url, stage="evidence")
+                except (OSError, asyncio.TimeoutError, ValueError) as exc:
+                    logger.warning("evidence_fetch_failed", extra={"anchor_id": anchor_id, "error": type(exc).__name__})
+                    raise raise_http_error(
+                        502, ErrorCode.upstream_error, "evidence fetch failed",
+                        request_id=(current_request_id() or "unknown")
+                    )
+                data = dict(data or {})
+                anchor_json = dict(data.pop("anchor", None) or {"id": anchor_id})
+                neigh = data or {"graph": {"edges": []}}
+                meta = neigh.get("meta") or {}
+                policy_trace = neigh.get("policy_trace") or {}
+                _hdrs_anchor = _hdrs_expand = hdrs
+
+            if settings.gateway_fused_evidence:
+                log_stage(logger, "evidence", "fused_fetch_start", anchor_id=anchor_id)
+                await _fetch_fused()
+                log_stage(logger, "evidence", "fused_fetch_done", anchor_id=anchor_id)
+            else:
+                log_stage(logger, "evidence", "concurrent_fetch_start", anchor_id=anchor_id)
+                await asyncio.gather(_fetch_anchor(), _expand_neighbors())
+                log_stage(logger, "evidence", "concurrent_fetch_done", anchor_id=anchor_id)
 
         # ── Light gate: fail-closed on policy fingerprint mismatch (schema-agnostic) ──
         # Headers may vary in case; prefer canonical constants and fallback to lowercase dict lookup.
@@ -348,7 +485,8 @@ class EvidenceBuilder:
                 },
             )
 
-        snapshot_etag = hdr_etag
+        # The etag Memory actually served (after any 412 retry) wins over the one we sent.
+        snapshot_etag = _header_etag(_hdrs_expand) or _header_etag(_hdrs_anchor) or hdr_etag
         if isinstance(neigh, dict) and "graph" not in neigh and "edges" in neigh:
             neigh = {
                 "graph": {"edges": neigh.get("edges")},
@@ -530,6 +668,7 @@ class EvidenceBuilder:
                            extra={"anchor_id": anchor_id, "error": type(exc).__name__})
             ev.meta = MemoryMetaModel(snapshot_etag=snapshot_etag)
         ev.snapshot_etag = snapshot_etag
+        note_snapshot_etag(snapshot_etag)
         # Strategic: meta typed; include fingerprints for audit (no secrets)
         try:
             logger.info("memory_meta_typed", extra={
@@ -558,7 +697,16 @@ class EvidenceBuilder:
                 from core_config.constants import TTL_EVIDENCE_CACHE_SEC as _TTL_EVIDENCE_S
                 # Async-only writes; no executor or sync fallbacks
                 # Persist the primary evidence under the composite key
-                await self._redis.setex(composite_key, _TTL_EVIDENCE_S, ev.model_dump_json())
+                # Evidence + anchor-level pointer in one round trip; the pointer
+                # lets plain requests (no fingerprint headers) find this entry.
+                entries = [(composite_key, _TTL_EVIDENCE_S, ev.model_dump_json())]
+                if ev.snapshot_etag and ev.snapshot_etag != "unknown":
+                    entries.append((
+                        cache_keys.gw_evidence_index(anchor_id, ev.snapshot_etag, request_policy_fp(policy_headers)),
+                        _TTL_EVIDENCE_S,
+                        composite_key,
+                    ))
+                await RedisCache(get_redis_pool(binary=True)).setex_many(entries)
                 try:
                     # Strategic logging: evidence cache stored (policy/ids/snapshot all in key)
                     logger.info(
@@ -584,40 +732,67 @@ class EvidenceBuilder:
 
         return ev
 
+    def index_key(self, anchor_id: str, *, policy_headers: dict | None = None) -> Optional[str]:
+        """Anchor index key ``lookup_cached`` would read now, or None without a recent snapshot."""
+        snapshot = recent_snapshot_etag(int(settings.evidence_snapshot_max_age_ms))
+        if not snapshot:
+            return None
+        return cache_keys.gw_evidence_index(anchor_id, snapshot, request_policy_fp(policy_headers))
+
+    async def lookup_cached(
+        self,
+        anchor_id: str,
+        *,
+        policy_headers: dict | None = None,
+        prefetched: Optional[dict] = None,
+    ) -> Optional[WhyDecisionEvidence]:
+        """
+        Server-side evidence cache read for requests without fingerprint headers.
+
+        The key parts come from local state only: the recently seen snapshot
+        etag and the request's policy headers, resolved to the full evidence
+        key through the anchor-level index written by ``build``. *prefetched*
+        maps keys the caller already read (batched) to their values, so the
+        index read can be skipped. Returns None on any miss; never calls Memory.
+        """
+        snapshot = recent_snapshot_etag(int(settings.evidence_snapshot_max_age_ms))
+        if not snapshot or not self._redis:
+            _ctr("cache_miss_total", 1, service="gateway_evidence", path="index",
+                 reason=("no_snapshot" if not snapshot else "no_redis"))
+            return None
+        idx_key = cache_keys.gw_evidence_index(anchor_id, snapshot, request_policy_fp(policy_headers))
+        try:
+            cache = RedisCache(get_redis_pool(binary=True))
+            if prefetched is not None and idx_key in prefetched:
+                ev_key = prefetched[idx_key]
+            else:
+                ev_key = await cache.get(idx_key)
+            raw = await cache.get(ev_key.decode() if isinstance(ev_key, bytes) else ev_key) if ev_key else None
+            if raw:
+                ev = WhyDecisionEvidence.model_validate(jsonx.loads(raw))
+                # The pointer is snapshot-scoped; double-check the payload agrees.
+                if ev.snapshot_etag == snapshot:
+                    _ctr("cache_hit_total", 1, service="gateway_evidence", path="index")
+                    log_stage(logger, "cache", "hit", layer="evidence", path="index",
+                              anchor_id=anchor_id, snapshot_etag=snapshot)
+                    return ev
+        except (RedisError, asyncio.TimeoutError, OSError, RuntimeError, ValueError, TypeError) as exc:
+            log_stage(logger, "cache", "error", layer="evidence", path="index",
+                      anchor_id=anchor_id, error=type(exc).__name__)
+        _ctr("cache_miss_total", 1, service="gateway_evidence", path="index", reason="absent")
+        log_stage(logger, "cache", "miss", layer="evidence", path="index", anchor_id=anchor_id)
+        return None
+
     async def _is_fresh(self, anchor_id: str, cached_etag: str, policy_headers: dict | None = None) -> bool:
+        """Compare against the locally tracked snapshot etag (kept current by pushes and responses)."""
         if not cached_etag:
             return True
         if cached_etag == "unknown":
             return False
-        try:
-            client = get_http_client(timeout_ms=50)
-            url = f"{settings.memory_api_url}/api/enrich"
-            # Use HEAD + If-None-Match to avoid duplicate GET body + logs.
-            resp = await client.head(
-                url,
-                params={"anchor": anchor_id},
-                headers=inject_trace_context({**dict(policy_headers or {}), IF_NONE_MATCH: cached_etag}),
-            )
-            fresh = False
-            try:
-                # 304 means fresh; otherwise compare returned ETag header defensively.
-                if getattr(resp, "status_code", 0) == 304:
-                    fresh = True
-                else:
-                    fresh = (_extract_snapshot_etag(resp) == cached_etag)
-            except (AttributeError, TypeError, ValueError):
-                fresh = False
-            try:
-                logger.info("etag_head_check", extra={"anchor_id": anchor_id, "fresh": bool(fresh)})
-            except (TypeError, ValueError, AttributeError):
-                pass
-            return fresh
-        except (OSError, asyncio.TimeoutError, ValueError, TypeError):
-            try:
-                logger.warning("etag_check_failed", extra={"anchor_id": anchor_id})
-            except (TypeError, ValueError, AttributeError):
-                pass
-            return False
+        current = recent_snapshot_etag(int(settings.evidence_snapshot_max_age_ms))
+        fresh = bool(current) and current == cached_etag
+        log_stage(logger, "cache", "etag_local_check", anchor_id=anchor_id, fresh=fresh)
+        return fresh
 
     async def get_evidence(self, anchor_id: str, *, fresh: bool = False) -> WhyDecisionEvidence:
         return await self.build(anchor_id, fresh=fresh)
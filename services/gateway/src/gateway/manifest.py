@@ -0,0 +1,78 @@
+"""
+Per-request content digests for bundle manifests.
+
+The builder emits two manifests (full and view bundle) over overlapping
+artifact sets, and the in-process validator checks the view manifest right
+after. ``ArtifactDigests`` hashes each artifact blob once per request and
+hands the digest to every reader. Entries are keyed by artifact name and pinned
+to the exact blob object that was hashed: when an artifact is replaced (e.g.
+``trace.json`` after validator enrichment) the new blob is hashed on first use.
+"""
+from __future__ import annotations
+
+import mimetypes
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from core_utils import jsonx
+from core_utils.fingerprints import sha256_hex
+
+MANIFEST_NAME = "bundle.manifest.json"
+
+
+def content_type_for(name: str) -> str:
+    return mimetypes.guess_type(name, strict=False)[0] or "application/json"
+
+
+class ArtifactDigests:
+    """Request-scoped registry: artifact name → sha256 hex of its current blob."""
+
+    __slots__ = ("_entries", "hashed", "reused")
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Any, str]] = {}
+        self.hashed = 0
+        self.reused = 0
+
+    def sha256(self, name: str, blob: bytes) -> str:
+        hit = self._entries.get(name)
+        # Identity, not equality: the registry holds a reference to the hashed
+        # blob, so ``is`` proves the bytes are unchanged without reading them.
+        if hit is not None and hit[0] is blob:
+            self.reused += 1
+            return hit[1]
+        digest = sha256_hex(blob)
+        self._entries[name] = (blob, digest)
+        self.hashed += 1
+        return digest
+
+    def manifest_items(
+        self,
+        artifacts: Mapping[str, bytes],
+        *,
+        exclude: Iterable[str] = (MANIFEST_NAME,),
+    ) -> List[Dict[str, Any]]:
+        skip = set(exclude)
+        return [
+            {
+                "name": name,
+                "sha256": self.sha256(name, artifacts[name]),
+                "bytes": len(artifacts[name]),
+                "content_type": content_type_for(name),
+            }
+            for name in sorted(artifacts.keys())
+            if name not in skip
+        ]
+
+    def manifest(
+        self,
+        artifacts: Mapping[str, bytes],
+        *,
+        exclude: Iterable[str] = (MANIFEST_NAME,),
+    ) -> Tuple[bytes, List[Dict[str, Any]]]:
+        """Return ``(bundle.manifest.json bytes, items)`` for *artifacts* (never lists itself)."""
+        items = self.manifest_items(artifacts, exclude=exclude)
+        return jsonx.dumps_bytes({"artifacts": items}), items
+
+
+def artifact_sha256(name: str, blob: bytes, digests: Optional[ArtifactDigests] = None) -> str:
+    return digests.sha256(name, blob) if digests is not None else sha256_hex(blob)
@@ -42,6 +42,7 @@ async def search_bm25(
             log_stage(
                 logger, "resolver", "bm25_search_complete",
                 match_count=len(matches), vector_used=bool((doc or {}).get("vector_used")),
+                vector_path=(doc or {}).get("vector_path"),
                 request_id=request_id, snapshot_etag=etag,
             )
         except httpx.HTTPStatusError as e:
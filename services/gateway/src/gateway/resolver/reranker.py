@@ -1,11 +1,13 @@
 from __future__ import annotations
-import asyncio, inspect
-from typing import List, Tuple
+import asyncio, inspect, threading, time
+from typing import Callable, List, Optional, Tuple
 from core_config import get_settings
 from core_cache.redis_client import get_redis_pool
+from core_cache.roundtrips import note_round_trip
 from core_utils import jsonx
 from core_logging import get_logger, log_stage, current_request_id
 from core_utils.fingerprints import sha256_hex
+from core_metrics import counter as metric_counter, gauge as metric_gauge, histogram_ms as metric_histogram_ms
 
 logger = get_logger("gateway.resolver.reranker")
 
@@ -22,20 +24,120 @@ def _pick_text(c: dict) -> str:
         or ""
     )
 
-def _score_sync(model_name: str, query: str, texts: list[str]) -> list[float]:
-    # Imported lazily so the feature is truly optional.
-    from transformers import AutoTokenizer, AutoModelForSequenceClassification  # type: ignore
-    import torch  # type: ignore
-    tok = AutoTokenizer.from_pretrained(model_name)
-    mdl = AutoModelForSequenceClassification.from_pretrained(model_name)
-    inputs = tok([query] * len(texts), texts, truncation=True, padding=True, max_length=384, return_tensors="pt")
-    with torch.no_grad():
-        out = mdl(**inputs)
-        logits = out.logits
-    # Support both regression (1-dim) and classification heads
-    if logits.dim() == 2 and logits.size(1) == 1:
-        return logits.squeeze(1).tolist()
-    return logits.max(dim=1).values.tolist()
+# ── Process-lifetime model ──────────────────────────────────────────────────
+# Loading a cross-encoder takes seconds, far beyond RERANK_TIMEOUT_MS, so the
+# model is loaded once per process (eagerly via ``warm_reranker`` at startup,
+# or lazily on first use) and kept for the lifetime of the process. Requests
+# that arrive before it is ready keep the BM25 order instead of waiting.
+# CROSS_ENCODER_MODEL=stub selects a deterministic lexical scorer (no torch).
+# A failed load (hub/network hiccup, bad files) is retried after a capped
+# exponential backoff; only missing dependencies disable the reranker for good.
+
+STUB_MODEL = "stub"
+_WARMUP_PAIR = ("warmup query", "warmup passage")
+
+class _StubScorer:
+    """Deterministic token-overlap scorer for tests and model-less environments."""
+    def __call__(self, query: str, texts: list[str]) -> list[float]:
+        q = set(query.lower().split())
+        return [
+            (len(q & set(t.lower().split())) / (len(q) or 1)) for t in texts
+        ]
+
+class _CrossEncoder:
+    def __init__(self, model_name: str) -> None:
+        # Imported lazily so the feature is truly optional.
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification  # type: ignore
+        import torch  # type: ignore
+        self._torch = torch
+        self._tok = AutoTokenizer.from_pretrained(model_name)
+        self._mdl = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self._mdl.eval()
+
+    def __call__(self, query: str, texts: list[str]) -> list[float]:
+        inputs = self._tok([query] * len(texts), texts, truncation=True, padding=True,
+                           max_length=384, return_tensors="pt")
+        with self._torch.no_grad():
+            logits = self._mdl(**inputs).logits
+        # Support both regression (1-dim) and classification heads
+        if logits.dim() == 2 and logits.size(1) == 1:
+            return logits.squeeze(1).tolist()
+        return logits.max(dim=1).values.tolist()
+
+_MODEL: Optional[Callable[[str, list[str]], list[float]]] = None
+_MODEL_NAME: Optional[str] = None
+_MODEL_ERROR: Optional[str] = None
+_MODEL_LOCK = threading.Lock()
+_LOAD_TASK: Optional[asyncio.Future] = None
+_LOAD_FAILURES = 0
+_RETRY_AT = 0.0  # monotonic; no load attempts before this
+_RETRY_BASE_S = 5.0
+_RETRY_CAP_S = 300.0
+
+def _load_due() -> bool:
+    return _MODEL_ERROR is None or time.monotonic() >= _RETRY_AT
+
+def _load_sync(model_name: str) -> bool:
+    """Load + warm the scorer once (thread-safe). Returns True when it is usable."""
+    global _MODEL, _MODEL_NAME, _MODEL_ERROR, _LOAD_FAILURES, _RETRY_AT
+    with _MODEL_LOCK:
+        if _MODEL is not None and _MODEL_NAME == model_name:
+            return True
+        if not _load_due():
+            return False
+        t0 = time.perf_counter()
+        try:
+            scorer = _StubScorer() if model_name == STUB_MODEL else _CrossEncoder(model_name)
+            load_ms = (time.perf_counter() - t0) * 1000.0
+            # Warmup: first inference pays for lazy kernels / allocator growth.
+            t1 = time.perf_counter()
+            scorer(_WARMUP_PAIR[0], [_WARMUP_PAIR[1]])
+            warmup_ms = (time.perf_counter() - t1) * 1000.0
+        except ImportError as exc:
+            _MODEL_ERROR, _RETRY_AT = "deps_missing", float("inf")
+            log_stage(logger, "resolver", "rerank_model_unavailable",
+                      model=model_name, reason=_MODEL_ERROR, error=str(exc), request_id="startup")
+            return False
+        except (OSError, ValueError, RuntimeError) as exc:  # hub/network, bad files: BM25 until retry
+            _LOAD_FAILURES += 1
+            backoff_s = min(_RETRY_CAP_S, _RETRY_BASE_S * (2 ** (_LOAD_FAILURES - 1)))
+            _MODEL_ERROR, _RETRY_AT = type(exc).__name__, time.monotonic() + backoff_s
+            metric_counter("gateway_rerank_model_load_failed_total", 1, error=_MODEL_ERROR)
+            log_stage(logger, "resolver", "rerank_model_unavailable",
+                      model=model_name, reason="load_failed", error=_MODEL_ERROR,
+                      retry_in_s=backoff_s, request_id="startup")
+            return False
+        _MODEL, _MODEL_NAME = scorer, model_name
+        _MODEL_ERROR, _LOAD_FAILURES, _RETRY_AT = None, 0, 0.0
+    metric_gauge("gateway_rerank_model_load_ms", load_ms)
+    metric_gauge("gateway_rerank_model_warmup_ms", warmup_ms)
+    log_stage(logger, "resolver", "rerank_model_loaded",
+              model=model_name, load_ms=round(load_ms, 1), warmup_ms=round(warmup_ms, 1),
+              request_id="startup")
+    return True
+
+def _model_name() -> str:
+    return str(getattr(_S, "cross_encoder_model", "cross-encoder/ms-marco-MiniLM-L-6-v2") or "")
+
+def reranker_ready() -> bool:
+    return _MODEL is not None and _MODEL_NAME == _model_name()
+
+async def warm_reranker() -> bool:
+    """Load and warm the model off the event loop; repeated calls share one load."""
+    global _LOAD_TASK
+    if reranker_ready():
+        return True
+    if _LOAD_TASK is None or _LOAD_TASK.done():
+        _LOAD_TASK = asyncio.ensure_future(asyncio.to_thread(_load_sync, _model_name()))
+    return bool(await asyncio.shield(_LOAD_TASK))
+
+def _score_sync(query: str, texts: list[str]) -> list[float]:
+    assert _MODEL is not None
+    t0 = time.perf_counter()
+    scores = _MODEL(query, texts)
+    metric_histogram_ms("gateway_rerank_inference_ms", (time.perf_counter() - t0) * 1000.0,
+                        model=str(_MODEL_NAME))
+    return scores
 
 async def rerank(query: str, candidates: list[dict]) -> list[tuple[dict, float]]:
     """
@@ -51,13 +153,15 @@ async def rerank(query: str, candidates: list[dict]) -> list[tuple[dict, float]]
     texts = [_pick_text(c) for c in items]
 
     # Cache key: model + query + ordered ids (shortened hash)
+    model_name = _model_name()
     ids = ",".join(str(c.get("id") or "") for c in items)
-    h = sha256_hex((query + "|" + ids).encode("utf-8"))[:24]
-    key = f"rr:cx:v1:{h}"
+    h = sha256_hex((model_name + "|" + query + "|" + ids).encode("utf-8"))[:24]
+    key = f"rr:cx:v2:{h}"
     rc = get_redis_pool()
     if rc is not None:
         cached = rc.get(key)
         cached = await cached if inspect.isawaitable(cached) else cached
+        note_round_trip(1, op="get")
         if cached:
             try:
                 arr = [float(x) for x in jsonx.loads(cached)]
@@ -72,25 +176,36 @@ async def rerank(query: str, candidates: list[dict]) -> list[tuple[dict, float]]
                 pairs.sort(key=lambda t: (-t[1], str(t[0].get("id") or "")))
                 return pairs
 
-    model_name = getattr(_S, "cross_encoder_model", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+    if not reranker_ready():
+        # Not loaded (yet) → start the one-time load in the background and keep
+        # BM25 ordering/scores for this request rather than spend the budget on it.
+        retry = _load_due()
+        if retry:
+            asyncio.ensure_future(warm_reranker())
+        log_stage(
+            logger, "resolver", "rerank_bypassed",
+            reason=("model_loading" if retry else "model_unavailable"),
+            request_id=(current_request_id() or "unknown"),
+        )
+        return [(c, float(c.get("score") or 0.0)) for c in items]
+
     timeout = float(getattr(_S, "rerank_timeout_ms", 50)) / 1000.0
     loop = asyncio.get_running_loop()
     try:
         scores = await asyncio.wait_for(
-            loop.run_in_executor(None, _score_sync, model_name, query, texts),
+            loop.run_in_executor(None, _score_sync, query, texts),
             timeout,
         )
     except asyncio.TimeoutError:
         # Budget exceeded → keep BM25 ordering/scores
-        return [(c, float(c.get("score") or 0.0)) for c in items]
-    except ImportError:
-        # transformers/torch not installed → keep BM25 ordering/scores
+        metric_counter("gateway_rerank_timeout_total", 1)
         return [(c, float(c.get("score") or 0.0)) for c in items]
 
     # Persist best-effort cache (10 min). Ignore cache errors.
     if rc is not None:
         try:
             await rc.setex(key, 600, jsonx.dumps([float(s) for s in scores]))
+            note_round_trip(1, op="setex")
         except (OSError, RuntimeError, ValueError, TypeError):
             log_stage(
                 logger, "resolver", "rerank_cache_set_failed",
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Mapping, Optional
 import os, base64, binascii, mimetypes
 from core_utils.fingerprints import canonical_json, sha256_hex, ensure_sha256_prefix, parse_fingerprint
 from core_utils import jsonx
+from .manifest import ArtifactDigests, artifact_sha256
 from core_logging import get_logger, log_stage
 from core_logging.error_codes import ErrorCode
 from core_validator.validator import (
@@ -162,12 +163,17 @@ def _signature_check(
     except Exception as exc:
         return check, {"code": ErrorCode.bundle_signature_invalid, "reason": "ed25519_invalid", "error": type(exc).__name__}
 
-def _manifest_check(artifacts: Optional[Mapping[str, bytes]]) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+def _manifest_check(
+    artifacts: Optional[Mapping[str, bytes]],
+    digests: Optional[ArtifactDigests] = None,
+) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
     """
     Validate bundle.manifest.json:
       - present and valid JSON
       - for each listed artifact: sha256, bytes, content_type match actual data
       - no extra artifacts present that are not listed
+    ``digests`` (in-process callers) supplies digests already computed for the
+    same blobs this request; without it every blob is hashed here.
     """
     check = {"name": "manifest_integrity", "ok": False}
     if not artifacts or "bundle.manifest.json" not in artifacts:
@@ -199,7 +205,7 @@ def _manifest_check(artifacts: Optional[Mapping[str, bytes]]) -> tuple[Dict[str,
         # Accept either 'sha256:<hex>' or bare '<hex>'
         alg, expected_hex = parse_fingerprint(sha) if ":" in sha else ("sha256", sha)
         # Deterministically recompute
-        if sha256_hex(blob) != expected_hex:
+        if artifact_sha256(name, blob, digests) != expected_hex:
             errs.append({"code": "manifest_sha_mismatch", "name": name})
         if len(blob) != size:
             errs.append({"code": "manifest_size_mismatch", "name": name})
@@ -222,9 +228,11 @@ def run_validator(
     artifacts: Optional[Mapping[str, bytes]] = None,
     *,
     request_id: str = "",
+    digests: Optional[ArtifactDigests] = None,
 ) -> Dict[str, Any]:
     """
     Build a validation report for the Exec Summary bundle (view flavor).
+    ``digests`` is the builder's per-request registry (see gateway.manifest).
     """
     checks: List[Dict[str, Any]] = []
     errors: List[Dict[str, Any]] = []
@@ -241,7 +249,7 @@ def run_validator(
     c, e = _signature_check(resp if "response" in (resp or {}) else {"response": resp}, artifacts, request_id=request_id)
     checks.append(c);  e and errors.append(e)
 
-    c, e = _manifest_check(artifacts)
+    c, e = _manifest_check(artifacts, digests)
     checks.append(c);  e and errors.append(e)
 
     c, es = _edge_schema_check(resp, request_id=request_id)
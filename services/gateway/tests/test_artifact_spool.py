@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from gateway.artifact_spool import ArtifactWriteBehind
+
+
+def _write_behind(tmp_path, uploader, *, enabled=None):
+    return ArtifactWriteBehind(
+        str(tmp_path / "spool"), uploader,
+        workers=1, max_attempts=2, retry_base_ms=0, retry_cap_ms=0, sweep_s=1.0,
+        enabled=enabled,
+    )
+
+
+async def _drain(wb, timeout_s=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout_s
+    while wb._queued and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_batch_is_spooled_uploaded_and_removed(tmp_path):
+    uploaded = {}
+
+    def _upload(rid, artifacts):
+        uploaded[rid] = dict(artifacts)
+        return True
+
+    wb = _write_behind(tmp_path, _upload)
+    try:
+        assert await wb.submit("r1", {"response.json": b"{}"})
+        await _drain(wb)
+    finally:
+        await wb.stop()
+    assert uploaded == {"r1": {"response.json": b"{}"}}
+    assert not wb.is_pending("r1")
+
+
+@pytest.mark.asyncio
+async def test_disabled_uploads_are_not_spooled(tmp_path):
+    calls = []
+    wb = _write_behind(tmp_path, lambda rid, artifacts: calls.append(rid) or False,
+                       enabled=lambda: False)
+    assert await wb.submit("r1", {"response.json": b"{}"})
+    assert not wb.is_pending("r1")
+    assert wb.load("r1") is None
+    assert not wb._tasks and calls == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_uploads_leave_existing_entries_alone(tmp_path):
+    enabled = [True]
+    calls = []
+    wb = _write_behind(tmp_path, lambda rid, artifacts: calls.append(rid) or True,
+                       enabled=lambda: enabled[0])
+    wb._write_spool("r0", {"response.json": b"{}"})
+    enabled[0] = False
+    assert await wb._upload_one("r0") is False
+    assert calls == [] and wb.is_pending("r0")
@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from gateway.resolver import reranker
+
+
+@pytest.fixture(autouse=True)
+def stub_reranker(monkeypatch):
+    """CROSS_ENCODER_MODEL=stub, no Redis, and a fresh (unloaded) model slot."""
+    monkeypatch.setattr(reranker, "_S", SimpleNamespace(
+        cross_encoder_model=reranker.STUB_MODEL, rerank_pair_max=10, rerank_timeout_ms=1000,
+    ))
+    monkeypatch.setattr(reranker, "get_redis_pool", lambda: None)
+    for name, value in (("_MODEL", None), ("_MODEL_NAME", None), ("_MODEL_ERROR", None),
+                        ("_LOAD_TASK", None), ("_LOAD_FAILURES", 0), ("_RETRY_AT", 0.0)):
+        monkeypatch.setattr(reranker, name, value)
+
+
+def _candidates():
+    return [
+        {"id": "a", "score": 3.0, "snippet": "unrelated text"},
+        {"id": "b", "score": 2.0, "snippet": "vendor choice for payments"},
+        {"id": "c", "score": 1.0, "snippet": "payments vendor choice rationale"},
+        {"id": "d", "score": 0.5, "snippet": "payments"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stub_model_loads_once_and_is_ready():
+    loads = []
+    real = reranker._StubScorer
+
+    class _Counting(real):
+        def __init__(self):
+            loads.append(1)
+
+    reranker._StubScorer = _Counting
+    try:
+        assert not reranker.reranker_ready()
+        assert await asyncio.gather(reranker.warm_reranker(), reranker.warm_reranker()) == [True, True]
+        assert await reranker.warm_reranker()
+    finally:
+        reranker._StubScorer = real
+    assert reranker.reranker_ready()
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_rerank_order_is_deterministic():
+    await reranker.warm_reranker()
+    first = await reranker.rerank("payments vendor choice", _candidates())
+    second = await reranker.rerank("payments vendor choice", list(reversed(_candidates())))
+    assert [c["id"] for c, _ in first] == ["b", "c", "d", "a"]
+    assert [c["id"] for c, _ in second] == [c["id"] for c, _ in first]
+    assert [s for _, s in first] == sorted((s for _, s in first), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_bm25_order_is_kept_while_loading(monkeypatch):
+    started = []
+
+    async def _slow_warm():
+        started.append(1)
+        return False
+
+    monkeypatch.setattr(reranker, "warm_reranker", _slow_warm)
+    out = await reranker.rerank("payments vendor choice", _candidates())
+    await asyncio.sleep(0)
+    assert [(c["id"], s) for c, s in out] == [("a", 3.0), ("b", 2.0), ("c", 1.0), ("d", 0.5)]
+    assert started == [1]
+
+
+def test_transient_load_failure_is_retried_after_backoff(monkeypatch):
+    real = reranker._StubScorer
+    calls = []
+
+    class _Flaky(real):
+        def __init__(self):
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("hub unreachable")
+
+    monkeypatch.setattr(reranker, "_StubScorer", _Flaky)
+    assert reranker._load_sync(reranker.STUB_MODEL) is False
+    assert reranker._load_sync(reranker.STUB_MODEL) is False  # backing off
+    assert len(calls) == 1
+    monkeypatch.setattr(reranker, "_RETRY_AT", 0.0)
+    assert reranker._load_sync(reranker.STUB_MODEL) is True
+    assert reranker.reranker_ready() and reranker._MODEL_ERROR is None
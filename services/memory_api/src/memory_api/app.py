@@ -1,7 +1,8 @@
 import asyncio
+import copy
 import time
 import os
-from typing import List, Optional, Mapping
+from typing import Dict, List, Optional, Mapping, Tuple
 from functools import lru_cache
 import inspect
 from pathlib import Path
@@ -19,7 +20,7 @@ from core_observability.otel import inject_trace_context
 from core_storage import ArangoStore
 from core_utils.health import attach_health_routes
 from core_utils.ids import generate_request_id
-from core_policy_opa import opa_decide_if_enabled, OPADecision
+from core_policy_opa import opa_decide_if_enabled_async, OPADecision
 from core_logging import log_once
 from core_models.ontology import is_valid_anchor
 from core_utils.domain import anchor_to_storage_key, storage_key_to_anchor
@@ -30,12 +31,15 @@ from core_utils.graph import alias_meta, compute_allowed_ids
 from core_validator import validate_graph_view
 from core_utils.fingerprints import graph_fp as fp_graph, allowed_ids_fp as fp_allowed_ids, normalize_fingerprint
 from core_cache import keys as cache_keys
+from core_cache.generation import run_generation_reaper
 from core_cache.redis_cache import RedisCache
 from core_cache.redis_client import get_redis_pool
+from core_cache.singleflight import SingleFlight
+from redis.exceptions import RedisError
 from core_http.client import get_http_client
 from core_config.constants import timeout_for_stage, TTL_EVIDENCE_CACHE_SEC
 from core_metrics import histogram as metric_histogram, counter as metric_counter
-from .policy import compute_effective_policy, field_mask, field_mask_with_summary, acl_check, PolicyHeaderError
+from .policy import compute_effective_policy, field_mask, field_mask_with_summary, acl_check, hydrate_nodes, PolicyHeaderError
 from core_http.headers import REQUEST_SNAPSHOT_ETAG, RESPONSE_SNAPSHOT_ETAG, BV_POLICY_FP, BV_ALLOWED_IDS_FP, BV_GRAPH_FP, BV_POLICY_ENGINE_FP, ETAG, IF_NONE_MATCH
 
 settings = get_settings()
@@ -228,11 +232,31 @@ async def bootstrap_arango():
         st = store()
         # Triggers _connect() and idempotent bootstrap here, not on the hot read path.
         _ = st.get_snapshot_etag()
+        # Keep the in-process snapshot ETag current via ingest pushes (polling fallback),
+        # so preconditions and cache keys never read ArangoDB on the request path.
+        st.start_snapshot_etag_listener()
         log_stage(logger, "bootstrap", "arango_ready", status="ok", request_id="startup")
     except (RuntimeError, OSError, ValueError) as exc:
         # Startup-time audit; do not move this work to the read path.
         log_stage(logger, "bootstrap", "arango_ready_failed", error=str(exc), request_id="startup")
 
+# Tracks the cache generation and sweeps superseded generations after a snapshot flip.
+_GENERATION_REAPER: asyncio.Task | None = None
+
+@app.on_event("startup")
+async def _start_generation_reaper() -> None:
+    global _GENERATION_REAPER
+    if _GENERATION_REAPER is None or _GENERATION_REAPER.done():
+        _GENERATION_REAPER = asyncio.create_task(run_generation_reaper(), name="cache-generation-reaper")
+
+@app.on_event("shutdown")
+async def _stop_generation_reaper() -> None:
+    global _GENERATION_REAPER
+    task, _GENERATION_REAPER = _GENERATION_REAPER, None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Shared helper: always attach the current snapshot ETag
 # ──────────────────────────────────────────────────────────────────────────────
@@ -303,6 +327,7 @@ def _require_snapshot_precondition(
 ) -> str:
     """Return the current snapshot etag if the precondition passes; otherwise 412."""
     try:
+        # Served from the process-local holder; no I/O in steady state.
         _raw = store().get_snapshot_etag()
     except (RuntimeError, OSError, AttributeError):
         _raw = None
@@ -371,6 +396,22 @@ def _edges_with_acl_and_alias_tail(
     edges_in: list = (st.get_edges_adjacent(node_id) or {}).get("edges") or []
     edges_kept: list = []
 
+    # Hydrate every neighbor (alias events included) in one bulk read instead of
+    # one get_node round trip per edge; ACL decisions below are unchanged.
+    neighbor_ids: set[str] = set()
+    for e in edges_in:
+        f = (e or {}).get("from"); t = (e or {}).get("to")
+        if node_id in (f, t):
+            other = t if f == node_id else f
+            if isinstance(other, str) and other:
+                neighbor_ids.add(other)
+    docs = hydrate_nodes(st, neighbor_ids)
+    try:
+        log_stage(logger, "edges_scope", "neighbors_hydrated",
+                  requested=len(neighbor_ids), found=len(docs), request_id=request_id)
+    except (RuntimeError, ValueError, TypeError):
+        pass
+
     for e in edges_in:
         et = canonical_edge_type((e or {}).get("type"))
         if et not in allowed_types:
@@ -380,7 +421,7 @@ def _edges_with_acl_and_alias_tail(
             continue
         # Always evaluate ACL on the neighbor node so allowed_ids reflect real visibility
         other = t if f == node_id else f
-        other_doc = st.get_node(other) or {}
+        other_doc = docs.get(other) or {}
         # Explicit intra-domain rule for CAUSAL only (Baseline §5)
         if et in set(CAUSAL_EDGE_TYPES):
             if (other_doc.get("domain") and other_doc.get("domain") != (anchor_doc or {}).get("domain")):
@@ -419,12 +460,25 @@ def _edges_with_acl_and_alias_tail(
         ev_id = (e or {}).get("from")
         if not ev_id:
             continue
-        # ACL on the alias event itself
-        ev_doc = st.get_node(ev_id) or {}
+        # ACL on the alias event itself (already hydrated as a neighbor)
+        ev_doc = docs.get(ev_id) or {}
         allowed_ev, _ = acl_check(ev_doc, policy)
         if not allowed_ev:
             continue
         alias_event_ids.append(ev_id)
+    # One round trip for every alias event's decision tail (up to 3 each).
+    alias_decisions: dict = {}
+    if alias_event_ids:
+        try:
+            bulk_tail = getattr(st, "next_decisions_from_events", None)
+            if callable(bulk_tail):
+                alias_decisions = bulk_tail(alias_event_ids, limit=3) or {}
+            else:
+                alias_decisions = {ev: (st.next_decisions_from_event(ev, limit=3) or []) for ev in alias_event_ids}
+        except (RuntimeError, OSError):
+            alias_decisions = {}
+    # Decision documents returned alongside the tail rows; reused for the target ACL below.
+    target_docs: dict = {}
     alias_edges_to_add: list[dict] = []
     for ev_id in alias_event_ids:
         # Always derive the alias anchor from the storage key.  If conversion fails,
@@ -440,14 +494,13 @@ def _edges_with_acl_and_alias_tail(
         except (ValueError, TypeError, AttributeError):
             alias_anchor = str(ev_id)
 
-        # Fetch up to 3 decisions following this event in its domain
-        try:
-            decisions = st.next_decisions_from_event(ev_id, limit=3) or []
-        except (RuntimeError, OSError):
-            decisions = []
+        # Up to 3 decisions following this event in its domain
+        decisions = alias_decisions.get(ev_id) or []
         for d in decisions[:3]:
-            # next_decisions_from_event returns the decision’s storage key in d["id"]
+            # next_decisions_from_event(s) returns the decision’s storage key in d["id"]
             other_id = (d or {}).get("id")
+            if other_id and isinstance((d or {}).get("node"), dict):
+                target_docs[other_id] = d["node"]
             dec_anchor: Optional[str] = None
             if other_id:
                 try:
@@ -477,6 +530,17 @@ def _edges_with_acl_and_alias_tail(
                 )
     if alias_edges_to_add:
         # Enforce ACL on alias-tail decision targets before adding edges (prevents id-only leaks)
+        # Targets not already carried by the tail rows or the neighbor set are hydrated in one read.
+        _missing: set[str] = set()
+        for ed in alias_edges_to_add:
+            try:
+                _k = anchor_to_storage_key(ed.get("to"))
+            except (ValueError, TypeError, AttributeError):
+                continue
+            if _k not in target_docs and _k not in docs:
+                _missing.add(_k)
+        if _missing:
+            target_docs.update(hydrate_nodes(st, _missing))
         guarded: list[dict] = []
         for ed in alias_edges_to_add:
             tgt_wire = ed.get("to")
@@ -493,10 +557,7 @@ def _edges_with_acl_and_alias_tail(
                 except (RuntimeError, ValueError, TypeError):
                     pass
                 continue
-            try:
-                tgt_doc = st.get_node(tgt_key) or {}
-            except (RuntimeError, OSError):
-                tgt_doc = {}
+            tgt_doc = target_docs.get(tgt_key) or docs.get(tgt_key) or {}
             ok, _reason = acl_check(tgt_doc, policy)
             if ok:
                 guarded.append(ed)
@@ -515,7 +576,98 @@ def _edges_with_acl_and_alias_tail(
     return edges_kept
 
 
+# --------------- Miss coalescing (single-flight + optional cross-process lease) -------------
+_SINGLE_FLIGHT = SingleFlight()
+
+
+async def _coalesced(cache_key: str, fn, *, copy_result=copy.deepcopy, layer: str):
+    """
+    Run ``fn`` (an awaitable factory) once per in-flight ``cache_key``; concurrent
+    identical misses await the leader and receive their own copy of its result.
+    """
+    if not getattr(get_settings(), "memory_singleflight_enabled", True):
+        return await fn()
+    res, shared = await _SINGLE_FLIGHT.do(cache_key, fn, copy=copy_result)
+    metric_counter("memory_singleflight_total", 1, layer=layer, role=("follower" if shared else "leader"))
+    if shared:
+        log_stage(logger, "cache", "coalesced", layer=layer, cache_key=cache_key)
+    return res
+
+
+async def _cached_or_compute(
+    cache_key: str,
+    compute,
+    *,
+    layer: str,
+    store: bool,
+    side_entries: Optional[list] = None,
+) -> tuple[Optional[dict], str]:
+    """
+    Read-through for a JSON document (``core_cache.RedisCache.get_or_compute``):
+    one computation per key across concurrent requests (in-process single-flight,
+    optional Redis lease MEMORY_CACHE_LEASE_MS with a bounded follower wait of
+    MEMORY_CACHE_LEASE_WAIT_MS) and probabilistic early refresh before expiry.
+
+    ``compute`` must return the document's JSON and keep any per-request
+    extras itself. Returns ``(doc, source)``: ``doc`` is the cached document,
+    or None when ``compute`` ran in this request. Redis failures fall back to
+    computing locally.
+    """
+    s = get_settings()
+    started = False
+
+    async def _run():
+        nonlocal started
+        started = True
+        return await compute()
+
+    try:
+        raw, source = await RedisCache(get_redis_pool(binary=True)).get_or_compute(
+            cache_key, int(TTL_EVIDENCE_CACHE_SEC), _run,
+            lease_ms=int(getattr(s, "memory_cache_lease_ms", 0) or 0),
+            wait_ms=int(getattr(s, "memory_cache_lease_wait_ms", 250)),
+            store=store,
+            side_entries=side_entries,
+        )
+    except (RedisError, RuntimeError, OSError, AttributeError):
+        if started:
+            raise
+        await compute()
+        return None, "computed"
+    if source in ("computed", "refreshed"):
+        log_stage(logger, "cache", "miss" if source == "computed" else "early_refresh",
+                  layer=layer, cache_key=cache_key)
+        if store:
+            log_stage(logger, "cache", "store", layer=layer, cache_key=cache_key, ttl=int(TTL_EVIDENCE_CACHE_SEC))
+        return None, source
+    try:
+        doc = jsonx.loads(raw)
+    except (ValueError, TypeError):
+        doc = None
+    if not isinstance(doc, dict):
+        await compute()
+        return None, "computed"
+    log_stage(logger, "cache", "hit", layer=layer, cache_key=cache_key, source=source)
+    return doc, source
+
+
 # --------------- Enrichment -------------
+def _enriched_from_context(st, storage_key: str, *, node_type: str | None = None) -> Optional[dict]:
+    """
+    Enriched node via the store's one-query ``get_enrich_context`` (which also
+    primes the adjacency cache); stores without it fall back to the per-type getters.
+    """
+    ctx_fn = getattr(st, "get_enrich_context", None)
+    if callable(ctx_fn):
+        doc = (ctx_fn(storage_key) or {}).get("enriched")
+        if node_type and (doc or {}).get("type") != node_type:
+            return None
+        return doc
+    if node_type == "EVENT":
+        return st.get_enriched_event(storage_key)
+    return st.get_enriched_node(storage_key)
+
+
 @app.get("/api/enrich")
 async def enrich(anchor: str, response: Response, request: Request):
     """Type-agnostic enrich: lookup by anchor (Decision, Event, future types).
@@ -531,13 +683,17 @@ async def enrich(anchor: str, response: Response, request: Request):
     key = anchor_to_storage_key(anchor)
     # Strict snapshot precondition (enforce early to avoid wasted work)
     safe_etag = _require_snapshot_precondition(request, stage="enrich")
-    # Blocking store call → thread
+    # Blocking store call → thread (single combined read)
     def _work() -> Optional[dict]:
-        return store().get_enriched_node(key)
+        return _enriched_from_context(store(), key)
+    sf_key = cache_keys.mem_enrich(safe_etag, str(policy.get("policy_fp") or ""), anchor)
     with trace_span("memory.enrich", anchor=anchor):
         try:
             budget_s = max(0.1, float(get_settings().timeout_enrich_ms) / 1000.0)
-            doc = await asyncio.wait_for(asyncio.to_thread(_work), timeout=budget_s)
+            doc = await asyncio.wait_for(
+                _coalesced(sf_key, lambda: asyncio.to_thread(_work), layer="enrich"),
+                timeout=budget_s,
+            )
         except asyncio.TimeoutError:
             raise HTTPException(status_code=504, detail="timeout")
     if doc is None:
@@ -557,12 +713,13 @@ async def enrich(anchor: str, response: Response, request: Request):
     )
     # --- OPA/Rego decision (parity with expand/enrich_batch) -----------------
     # Use engine decision for visibility/scopes; DO NOT override locally computed policy_fp.
-    opa_decision: OPADecision | None = opa_decide_if_enabled(
+    opa_decision: OPADecision | None = await opa_decide_if_enabled_async(
         anchor_id=anchor,
         edges=[],  # single-node enrich; no edges context
         headers={k: v for k, v in request.headers.items()},
         snapshot_etag=safe_etag,
         intents=["enrich"],
+        policy_fp=str(policy.get("policy_fp") or "") or None,
     )
     engine_fp: str | None = None
     if opa_decision:
@@ -643,8 +800,7 @@ async def enrich_event(anchor: str, response: Response, request: Request):
     key = anchor_to_storage_key(anchor)
     with trace_span("memory.enrich_event", node_id=node_id):
         def _work() -> Optional[dict]:
-            st = store()
-            return st.get_enriched_event(node_id)
+            return _enriched_from_context(store(), node_id, node_type="EVENT")
         try:
             budget_s = max(0.1, float(get_settings().timeout_enrich_ms) / 1000.0)
             doc = await asyncio.wait_for(asyncio.to_thread(_work), timeout=budget_s)
@@ -664,12 +820,13 @@ async def enrich_event(anchor: str, response: Response, request: Request):
     )
 
     # --- OPA/Rego decision (event parity) -----------------------------------
-    opa_decision: OPADecision | None = opa_decide_if_enabled(
+    opa_decision: OPADecision | None = await opa_decide_if_enabled_async(
         anchor_id=anchor,
         edges=[],  # event-only enrich
         headers={k: v for k, v in request.headers.items()},
         snapshot_etag=safe_etag,
         intents=["enrich_event"],
+        policy_fp=str(policy.get("policy_fp") or "") or None,
     )
     engine_fp: str | None = None
     if opa_decision:
@@ -707,6 +864,115 @@ async def enrich_event(anchor: str, response: Response, request: Request):
     return _resp
 
 # --------------- Batch Enrichment (bounded, policy- & snapshot-bound) -------------
+# Process-wide cap on worker threads held by batch enrichment, so one large
+# batch cannot monopolise the default executor single-item routes also use.
+_ENRICH_BATCH_SLOTS: Optional[asyncio.Semaphore] = None
+
+
+def _enrich_batch_slots() -> asyncio.Semaphore:
+    global _ENRICH_BATCH_SLOTS
+    if _ENRICH_BATCH_SLOTS is None:
+        _ENRICH_BATCH_SLOTS = asyncio.Semaphore(
+            max(1, int(getattr(get_settings(), "enrich_batch_concurrency", 4)))
+        )
+    return _ENRICH_BATCH_SLOTS
+
+
+def _enrich_batch_chunk(st, wire_ids: List[str], policy: dict) -> Dict[str, dict]:
+    """Bulk-fetch, ACL-guard and mask one chunk of wire ids (worker thread)."""
+    keys: Dict[str, str] = {}
+    for wid in wire_ids:
+        try:
+            keys[anchor_to_storage_key(wid)] = wid
+        except (ValueError, TypeError):
+            continue
+    bulk = getattr(st, "get_enriched_nodes_bulk", None)
+    docs: Dict[str, dict] = {}
+    if callable(bulk):
+        docs = bulk(list(keys)) or {}
+    else:
+        for k in keys:
+            try:
+                d = st.get_enriched_node(k)
+            except (RuntimeError, OSError, AttributeError, TypeError, ValueError):
+                d = None
+            if isinstance(d, dict):
+                docs[k] = d
+    out: Dict[str, dict] = {}
+    for k, wid in keys.items():
+        doc = docs.get(k)
+        if not isinstance(doc, dict):
+            continue
+        allowed, _reason = acl_check(doc, policy)
+        if not allowed:
+            continue
+        masked, mask_summary = field_mask_with_summary(dict(doc), policy)
+        masked["mask_summary"] = mask_summary
+        out[wid] = masked
+    return out
+
+
+async def _enrich_batch_items(
+    st, wire_ids: List[str], policy: dict, *, request_id: str,
+) -> Tuple[Dict[str, dict], List[str], List[str]]:
+    """
+    Enrich ``wire_ids`` in bulk chunks with bounded concurrency.
+    Every chunk shares one deadline (ENRICH_BATCH_ITEM_TIMEOUT_MS from batch
+    start); chunks that miss it or fail are reported back instead of failing
+    the call. A slot stays taken until its worker thread actually returns,
+    even when the caller stopped waiting, so the concurrency cap always holds.
+    Returns ``(items_in_request_order, timed_out_ids, failed_ids)``.
+    """
+    s = get_settings()
+    size = max(1, int(getattr(s, "enrich_batch_chunk_size", 25)))
+    budget_s = max(0.05, float(getattr(s, "enrich_batch_item_timeout_ms", 800)) / 1000.0)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget_s
+    slots = _enrich_batch_slots()
+
+    def _release(fut: asyncio.Future) -> None:
+        slots.release()
+        if not fut.cancelled():
+            fut.exception()  # retrieved here when the caller already timed out
+
+    async def _run(ids: List[str]) -> Tuple[List[str], str, Dict[str, dict]]:
+        await slots.acquire()
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            slots.release()
+            return ids, "timeout", {}
+        fut = asyncio.ensure_future(asyncio.to_thread(_enrich_batch_chunk, st, ids, policy))
+        fut.add_done_callback(_release)
+        try:
+            return ids, "ok", await asyncio.wait_for(asyncio.shield(fut), timeout=remaining)
+        except asyncio.TimeoutError:
+            return ids, "timeout", {}
+        except (RuntimeError, OSError, AttributeError, TypeError, ValueError) as e:
+            log_stage(logger, "enrich_batch", "chunk_failed",
+                      error=type(e).__name__, count=len(ids), request_id=request_id)
+            return ids, "failed", {}
+
+    chunks = [wire_ids[i:i + size] for i in range(0, len(wire_ids), size)]
+    merged: Dict[str, dict] = {}
+    timed_out: List[str] = []
+    failed: List[str] = []
+    for ids, status, res in await asyncio.gather(*(_run(c) for c in chunks)):
+        if status == "timeout":
+            timed_out.extend(ids)
+        elif status == "failed":
+            failed.extend(ids)
+        else:
+            merged.update(res)
+    if timed_out:
+        metric_counter("enrich_batch_items_timed_out_total", len(timed_out))
+        log_stage(logger, "enrich_batch", "partial_timeout",
+                  timed_out=len(timed_out), returned=len(merged),
+                  budget_ms=int(budget_s * 1000), request_id=request_id)
+    if failed:
+        metric_counter("enrich_batch_items_failed_total", len(failed))
+    return {wid: merged[wid] for wid in wire_ids if wid in merged}, timed_out, failed
+
+
 @app.post("/api/enrich/batch")
 async def enrich_batch(payload: dict, response: Response, request: Request):
     """
@@ -718,6 +984,9 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
         **denies the whole call** if `requested_ids ⊄ allowed_ids` (default 403; optional 404 via x-denied-status).
       - Precondition: snapshot_etag is REQUIRED (body or X-Snapshot-ETag); missing/mismatch → 412.
       - Output on success: {"items": {"<id>": {...masked enriched node...}, ...}} with minimal meta.
+      - Storage work runs off the event loop in bounded bulk chunks; ids whose chunk misses
+        the per-item deadline are listed in meta.timed_out_ids, ids whose chunk failed in
+        meta.failed_ids (either sets meta.partial=true).
     """
     # Fail-closed policy headers (centralized)
     rid = (request.headers.get("x-request-id") or request.headers.get("X-Request-Id") or "")
@@ -738,9 +1007,12 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
     from core_utils.domain import parse_anchor, anchor_to_storage_key, storage_key_to_anchor
     _, node_id = parse_anchor(anchor_wire)               # wire id (domain-less)
     key = anchor_to_storage_key(anchor_wire)             # storage key (domain_prefix)
+    scope_budget_s = max(0.1, float(get_settings().timeout_enrich_ms) / 1000.0)
     try:
         st = store()
-        anchor_doc = st.get_node(key) or {}
+        anchor_doc = await asyncio.wait_for(asyncio.to_thread(st.get_node, key), timeout=scope_budget_s) or {}
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="timeout")
     except (RuntimeError, OSError, AttributeError) as e:
         log_stage(logger, "enrich_batch", "store_unavailable",
                   error=type(e).__name__, request_id=rid)
@@ -762,10 +1034,15 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
         storage_node_id=key,
     )
 
-    # Recompute scope deterministically (k=1 + bounded alias tail) using shared helper
-    edges_kept = _edges_with_acl_and_alias_tail(
-        st, key, anchor_doc, policy, request_id=rid
-    )
+    # Recompute scope deterministically (k=1 + bounded alias tail) using shared helper.
+    # Scope is mandatory (fail-closed), so a timeout here fails the call.
+    try:
+        edges_kept = await asyncio.wait_for(
+            asyncio.to_thread(_edges_with_acl_and_alias_tail, st, key, anchor_doc, policy, request_id=rid),
+            timeout=scope_budget_s,
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="timeout")
     # Use the same SoT for shaping/dedup before computing allowed_ids to avoid drift
     _edges_wire_for_ids: List[dict] = to_wire_edges(edges_kept)
     try:
@@ -782,12 +1059,13 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
     allowed_wire_ids: List[str] = sorted(set(local_allowed_ids))
 
     # --- OPA/Rego externalized decision (only narrows via intersection) ---
-    opa_decision: OPADecision | None = opa_decide_if_enabled(
+    opa_decision: OPADecision | None = await opa_decide_if_enabled_async(
         anchor_id=anchor_wire,
         edges=_edges_wire_for_ids,
         headers={k: v for k, v in request.headers.items()},
         snapshot_etag=etag_now,
         intents=["enrich_batch"],
+        policy_fp=str(policy.get("policy_fp") or "") or None,
     )
     engine_fp: str | None = None
     if opa_decision and opa_decision.allowed_ids:
@@ -842,24 +1120,7 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
         raise HTTPException(status_code=int(policy.get("denied_status") or 403),
                             detail="acl:requested_ids_out_of_scope")
 
-    for wid in ids_to_fetch:
-        try:
-            storage_key = anchor_to_storage_key(wid)
-        except (ValueError, TypeError):
-            continue
-        doc = None
-        try:
-            doc = store().get_enriched_node(storage_key)
-        except (RuntimeError, OSError, AttributeError, TypeError, ValueError):
-            doc = None
-        if not isinstance(doc, dict):
-            continue
-        allowed, _reason = acl_check(doc, policy)
-        if not allowed:
-            continue
-        masked, mask_summary = field_mask_with_summary(dict(doc), policy)
-        masked["mask_summary"] = mask_summary
-        out[wid] = masked
+    out, timed_out_ids, failed_ids = await _enrich_batch_items(st, ids_to_fetch, policy, request_id=rid)
 
     if etag_now:
         response.headers[RESPONSE_SNAPSHOT_ETAG] = etag_now
@@ -884,16 +1145,20 @@ async def enrich_batch(payload: dict, response: Response, request: Request):
         # do not fail response on header encoding issues
         pass
     # Trim meta to *returned_count* (no totals). Keep allowlist/fps for FE/cache determinism.
-    return {
-        "items": out,
-        "meta": {
-            "returned_count": len(out),
-            "allowed_ids": allowed_wire_ids,
-            "allowed_ids_fp": meta_allowed_ids_fp,
-            "policy_fp": normalize_fingerprint(str(policy.get("policy_fp") or "")),
-            "snapshot_etag": etag_now,
-        },
+    meta = {
+        "returned_count": len(out),
+        "allowed_ids": allowed_wire_ids,
+        "allowed_ids_fp": meta_allowed_ids_fp,
+        "policy_fp": normalize_fingerprint(str(policy.get("policy_fp") or "")),
+        "snapshot_etag": etag_now,
     }
+    if timed_out_ids or failed_ids:
+        meta["partial"] = True
+    if timed_out_ids:
+        meta["timed_out_ids"] = timed_out_ids
+    if failed_ids:
+        meta["failed_ids"] = failed_ids
+    return {"items": out, "meta": meta}
 
 # --------------- Resolver ------------------
 @app.post("/api/resolve/text")
@@ -923,7 +1188,7 @@ async def resolve_text(payload: dict, response: Response, request: Request):
         cached = None
         redis_client = None
         try:
-            redis_client = get_redis_pool()
+            redis_client = get_redis_pool(binary=True)
         except (AttributeError, RuntimeError, OSError):
             redis_client = None
         if redis_client is not None and cache_key:
@@ -1071,7 +1336,7 @@ async def resolve_text(payload: dict, response: Response, request: Request):
     # - Logs: cache_store with layer="resolve" and ttl
     if cache_key and isinstance(doc, dict):
         try:
-            rc = RedisCache(get_redis_pool())
+            rc = RedisCache(get_redis_pool(binary=True))
             await rc.setex(cache_key, int(TTL_EVIDENCE_CACHE_SEC), jsonx.dumps(doc))
             log_stage(logger, "cache", "store", layer="resolve",
                       cache_key=cache_key, ttl=int(TTL_EVIDENCE_CACHE_SEC))
@@ -1089,72 +1354,27 @@ async def resolve_text(payload: dict, response: Response, request: Request):
         pass
     return _resp
 
-@app.post("/api/graph/expand_candidates")
-async def expand_candidates(payload: dict, response: Response, request: Request):
-    """Edges-only graph view around the anchor (k=1).
-    Snapshot policy: STRICT — requires X-Snapshot-ETag (or `snapshot_etag` in body); missing/mismatch → 412. Mirrors x-snapshot-etag in responses for cache keys.
-    Headers: sets X-BV-Graph-FP and mirrors X-BV-Policy-Fingerprint (graph fingerprint also present at meta.fingerprints.graph_fp).
-    Contract: meta.fingerprints ONLY contains graph_fp; bundle_fp is never present here.
+async def _compute_expand_view(
+    payload: dict,
+    request: Request,
+    *,
+    anchor: str,
+    key: str,
+    policy: dict,
+    safe_etag: str,
+    rid: str,
+    cache_key: str,
+    timers: "_StageTimers",
+    k: int = 1,
+) -> tuple[dict, int, Optional[str], Optional[OPADecision]]:
     """
-    _timers = _StageTimers()
-
-    # Ensure *etag* is always bound, even when the store raises and we
-    # fall back to a dummy-document.
-    etag: Optional[str] = None
-    # Anchors only on the wire
-    anchor = (payload or {}).get("anchor")
-    anchor = _validate_anchor_or_400(anchor)
-    from core_utils.domain import parse_anchor
-    _, node_id = parse_anchor(anchor)
-    # storage key (eng#d-eng-010 -> eng_d-eng-010)
-    key = anchor_to_storage_key(anchor)
-    # Always bound to 1 for the demo (policy may request lower).
-    k = 1
-    # Resolve effective policy BEFORE storage to avoid referencing undefined policy in worker.
-    policy = _policy_from_request_headers(request.headers)
-    # Stable request id for structured logs
-    rid = (request.headers.get("x-request-id") or request.headers.get("X-Request-Id") or "")
-    # Strict snapshot precondition (body `snapshot_etag` OR `X-Snapshot-ETag`)
-    safe_etag = _require_snapshot_precondition(request, payload=payload, stage="expand")
-
-    # ---- M5 cache (expand) : bv:mem:v1:expand:{fp(etag,policy_fp,anchor)} ----
-    from core_cache import keys as cache_keys  # local import to avoid import churn on startup
-    from core_cache.redis_cache import RedisCache
-    from core_cache.redis_client import get_redis_pool
-    from core_config.constants import TTL_EVIDENCE_CACHE_SEC
-    cache_key = cache_keys.mem_expand_candidates(
-        safe_etag, str(policy.get("policy_fp") or ""), anchor
-    )
-    try:
-        rc = RedisCache(get_redis_pool())
-        raw = await rc.get(cache_key)
-        cached = None
-        if raw:
-            try:
-                cached = jsonx.loads(raw)
-            except (ValueError, TypeError):
-                cached = None
-            if isinstance(cached, dict):
-                log_stage(logger, "cache", "hit", layer="expand", cache_key=cache_key)
-                # Heal meta for older cached entries (ensure body mirrors headers)
-                meta = (cached.get("meta") or {})
-                if not isinstance(meta, dict):
-                    meta = {}
-                if not meta.get("snapshot_etag"):
-                    meta["snapshot_etag"] = safe_etag
-                if not meta.get("policy_fp"):
-                    meta["policy_fp"] = normalize_fingerprint(str(policy.get("policy_fp") or ""))
-                cached["meta"] = meta
-                # Build the actual response, then attach headers to it.
-                res = _json_response_with_etag(cached, safe_etag)  # sets x-snapshot-etag
-                res.headers[BV_POLICY_FP] = str(policy.get("policy_fp") or "")
-                _maybe_add_policy_advice_header(res, request, str(policy.get("policy_fp") or ""))
-                return res
-    except (RuntimeError, OSError, AttributeError, TypeError, ValueError):
-        # best-effort; fall through on cache errors
-        pass
-    log_stage(logger, "cache", "miss", layer="expand", cache_key=cache_key)
-
+    Edges-only graph view for *anchor* after the snapshot precondition passed:
+    storage read, anchor ACL/domain checks, edge ACL + alias tail, OPA decision
+    and schema validation. Shared by /api/graph/expand_candidates and the fused
+    /api/evidence. *policy* is updated in place with the OPA field visibility.
+    Returns ``(candidate_set, alias_followed, engine_fp, opa_decision)``.
+    """
+    _timers = timers
     # Storage fetch: edges adjacent to anchor + snapshot etag
     def _work():
         st = store()
@@ -1163,7 +1383,13 @@ async def expand_candidates(payload: dict, response: Response, request: Request)
     _timers.start('expand')
     try:
         with trace_span("memory.expand_candidates", anchor=anchor, k=k):
-            doc, etag, st = await asyncio.wait_for(asyncio.to_thread(_work), timeout=timeout_for_stage("expand"))
+            doc, etag, st = await asyncio.wait_for(
+                _coalesced(
+                    cache_key, lambda: asyncio.to_thread(_work), layer="expand",
+                    copy_result=lambda r: (copy.deepcopy(r[0]), r[1], r[2]),
+                ),
+                timeout=timeout_for_stage("expand"),
+            )
     except asyncio.TimeoutError:
         log_stage(logger, "expand", "timeout",
                   request_id=(payload.get("request_id") if isinstance(payload, dict) else None),
@@ -1285,12 +1511,13 @@ async def expand_candidates(payload: dict, response: Response, request: Request)
         alias_block['returned'] = []
 
     # --- OPA/Rego externalized decision (fallback to deterministic local computation) ---
-    opa_decision: OPADecision | None = opa_decide_if_enabled(
+    opa_decision: OPADecision | None = await opa_decide_if_enabled_async(
         anchor_id=_wire_anchor_id,
         edges=edges_kept_wire,
         headers={k: v for k, v in request.headers.items()},
         snapshot_etag=safe_etag,
         intents=["expand_candidates"],
+        policy_fp=str(policy.get("policy_fp") or "") or None,
     )
     engine_fp: str | None = None
     if opa_decision and opa_decision.allowed_ids:
@@ -1403,21 +1630,73 @@ async def expand_candidates(payload: dict, response: Response, request: Request)
         except (RuntimeError, ValueError, TypeError, KeyError):
             pass
         raise HTTPException(status_code=500, detail="validation_error:graph_view_invalid")
+    return candidate_set, alias_followed, engine_fp, opa_decision
 
-    # Write-through store (same TTL as resolve cache)
-    # Skip cache writes if the snapshot ETag is unknown to prevent cross-snapshot reuse.
-    try:
-        rc = RedisCache(get_redis_pool())
-        cache_key = cache_keys.mem_expand_candidates(
-            safe_etag, str(policy.get("policy_fp") or ""), anchor
+
+@app.post("/api/graph/expand_candidates")
+async def expand_candidates(payload: dict, response: Response, request: Request):
+    """Edges-only graph view around the anchor (k=1).
+    Snapshot policy: STRICT — requires X-Snapshot-ETag (or `snapshot_etag` in body); missing/mismatch → 412. Mirrors x-snapshot-etag in responses for cache keys.
+    Headers: sets X-BV-Graph-FP and mirrors X-BV-Policy-Fingerprint (graph fingerprint also present at meta.fingerprints.graph_fp).
+    Contract: meta.fingerprints ONLY contains graph_fp; bundle_fp is never present here.
+    """
+    _timers = _StageTimers()
+
+    # Anchors only on the wire
+    anchor = (payload or {}).get("anchor")
+    anchor = _validate_anchor_or_400(anchor)
+    from core_utils.domain import parse_anchor
+    _, node_id = parse_anchor(anchor)
+    # storage key (eng#d-eng-010 -> eng_d-eng-010)
+    key = anchor_to_storage_key(anchor)
+    # Always bound to 1 for the demo (policy may request lower).
+    k = 1
+    # Resolve effective policy BEFORE storage to avoid referencing undefined policy in worker.
+    policy = _policy_from_request_headers(request.headers)
+    # Stable request id for structured logs
+    rid = (request.headers.get("x-request-id") or request.headers.get("X-Request-Id") or "")
+    # Strict snapshot precondition (body `snapshot_etag` OR `X-Snapshot-ETag`)
+    safe_etag = _require_snapshot_precondition(request, payload=payload, stage="expand")
+
+    from core_cache import keys as cache_keys  # local import to avoid import churn on startup
+    cache_key = cache_keys.mem_expand_candidates(
+        safe_etag, str(policy.get("policy_fp") or ""), anchor
+    )
+    def _serve_cached(cached: dict):
+        # Heal meta for older cached entries (ensure body mirrors headers)
+        meta = (cached.get("meta") or {})
+        if not isinstance(meta, dict):
+            meta = {}
+        if not meta.get("snapshot_etag"):
+            meta["snapshot_etag"] = safe_etag
+        if not meta.get("policy_fp"):
+            meta["policy_fp"] = normalize_fingerprint(str(policy.get("policy_fp") or ""))
+        cached["meta"] = meta
+        # Build the actual response, then attach headers to it.
+        res = _json_response_with_etag(cached, safe_etag)  # sets x-snapshot-etag
+        res.headers[BV_POLICY_FP] = str(policy.get("policy_fp") or "")
+        _maybe_add_policy_advice_header(res, request, str(policy.get("policy_fp") or ""))
+        return res
+
+    computed: dict = {}
+
+    async def _compute():
+        candidate_set, alias_followed, engine_fp, _ = await _compute_expand_view(
+            payload, request, anchor=anchor, key=key, policy=policy,
+            safe_etag=safe_etag, rid=rid, cache_key=cache_key, timers=_timers, k=k,
         )
-        if safe_etag == "unknown":
-            log_stage(logger, "cache", "store_skipped_etag_unknown", layer="expand", cache_key=cache_key)
-        else:
-            await rc.setex(cache_key, int(TTL_EVIDENCE_CACHE_SEC), jsonx.dumps(candidate_set))
-            log_stage(logger, "cache", "store", layer="expand", cache_key=cache_key, ttl=int(TTL_EVIDENCE_CACHE_SEC))
-    except (RuntimeError, OSError, AttributeError, TypeError, ValueError):
-        pass
+        computed.update(candidate_set=candidate_set, alias_followed=alias_followed, engine_fp=engine_fp)
+        return jsonx.dumps(candidate_set)
+
+    # Skip cache writes if the snapshot ETag is unknown to prevent cross-snapshot reuse.
+    if safe_etag == "unknown":
+        log_stage(logger, "cache", "store_skipped_etag_unknown", layer="expand", cache_key=cache_key)
+    cached, _ = await _cached_or_compute(cache_key, _compute, layer="expand", store=(safe_etag != "unknown"))
+    if cached is not None:
+        return _serve_cached(cached)
+    candidate_set = computed["candidate_set"]
+    alias_followed = computed["alias_followed"]
+    engine_fp = computed["engine_fp"]
     res = _json_response_with_etag(candidate_set, safe_etag)
     # Surface as a header for the FE/audit drawer without touching the schema
     try:
@@ -1436,3 +1715,93 @@ async def expand_candidates(payload: dict, response: Response, request: Request)
     _maybe_add_policy_advice_header(res, request, str(policy.get("policy_fp") or ""))
     return res
 
+
+@app.post("/api/evidence")
+async def evidence(payload: dict, request: Request):
+    """Fused enrich + expand_candidates: the enriched, masked anchor and its edges-only graph view.
+    Snapshot policy: STRICT — same as /api/graph/expand_candidates (412 on missing/mismatch).
+    Headers: same as expand_candidates (x-snapshot-etag, X-BV-Policy-Fingerprint, X-BV-Allowed-Ids-FP, X-BV-Graph-FP).
+    Contract: expand_candidates' body with ``anchor`` replaced by the /api/enrich node
+    (including mask_summary). Policy, snapshot precondition and OPA run once per call.
+    """
+    _timers = _StageTimers()
+    anchor = _validate_anchor_or_400((payload or {}).get("anchor"))
+    key = anchor_to_storage_key(anchor)
+    policy = _policy_from_request_headers(request.headers)
+    rid = (request.headers.get("x-request-id") or request.headers.get("X-Request-Id") or "")
+    safe_etag = _require_snapshot_precondition(request, payload=payload, stage="evidence")
+    policy_fp = str(policy.get("policy_fp") or "")
+    cache_key = cache_keys.mem_evidence(safe_etag, policy_fp, anchor)
+
+    def _respond(doc: dict, *, alias_followed: int | None = None, engine_fp: str | None = None):
+        res = _json_response_with_etag(doc, safe_etag)
+        res.headers[BV_POLICY_FP] = policy_fp
+        if alias_followed is not None:
+            res.headers["X-BV-Alias-Followed"] = str(int(alias_followed))
+        if engine_fp:
+            res.headers[BV_POLICY_ENGINE_FP] = str(engine_fp)
+        _maybe_add_policy_advice_header(res, request, policy_fp)
+        return res
+
+    computed: dict = {}
+    # The graph view also goes under its own expand key (a later
+    # /api/graph/expand_candidates for this anchor is then a hit), written in
+    # the same round trip as the fused document.
+    side_entries: list = []
+    store_ok = safe_etag != "unknown"
+
+    async def _compute():
+        # Enriched anchor first: the combined read also primes the adjacency cache
+        # that the graph view's edge fetch reads next.
+        try:
+            enriched = await asyncio.wait_for(
+                _coalesced(
+                    cache_keys.mem_enrich(safe_etag, policy_fp, anchor),
+                    lambda: asyncio.to_thread(lambda: _enriched_from_context(store(), key)),
+                    layer="enrich",
+                ),
+                timeout=max(0.1, float(get_settings().timeout_enrich_ms) / 1000.0),
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="timeout")
+        if enriched is None:
+            raise HTTPException(status_code=404, detail="not_found")
+
+        candidate_set, alias_followed, engine_fp, opa_decision = await _compute_expand_view(
+            payload, request, anchor=anchor, key=key, policy=policy,
+            safe_etag=safe_etag, rid=rid, cache_key=cache_keys.mem_expand_candidates(safe_etag, policy_fp, anchor),
+            timers=_timers,
+        )
+        # Anchor masking with the same (OPA-adjusted) policy the graph view used.
+        if opa_decision is not None:
+            if getattr(opa_decision, "denied_status", None):
+                policy["denied_status"] = int(opa_decision.denied_status)
+            if getattr(opa_decision, "extra_visible", None):
+                policy["extra_visible"] = opa_decision.extra_visible
+        allowed, reason = acl_check(enriched, policy)
+        if not allowed:
+            log_stage(logger, "evidence", "acl_denied", anchor=anchor, reason=reason,
+                      domain=(enriched or {}).get("domain", ""), request_id=rid)
+            raise HTTPException(status_code=403, detail=reason or "acl:denied")
+        base = dict(enriched)
+        base["id"] = storage_key_to_anchor(key)
+        masked, mask_summary = field_mask_with_summary(base, policy)
+        doc = {**candidate_set, "anchor": {"mask_summary": mask_summary, **masked}}
+        computed.update(doc=doc, alias_followed=alias_followed, engine_fp=engine_fp)
+        if store_ok:
+            side_entries.append((cache_keys.mem_expand_candidates(safe_etag, policy_fp, anchor),
+                                 int(TTL_EVIDENCE_CACHE_SEC), jsonx.dumps(candidate_set)))
+        return jsonx.dumps(doc)
+
+    if not store_ok:
+        log_stage(logger, "cache", "store_skipped_etag_unknown", layer="evidence", cache_key=cache_key)
+    cached, _ = await _cached_or_compute(
+        cache_key, _compute, layer="evidence", store=store_ok, side_entries=side_entries,
+    )
+    if cached is not None:
+        return _respond(cached)
+    doc = computed["doc"]
+    alias_followed = computed["alias_followed"]
+    engine_fp = computed["engine_fp"]
+    _log_policy_fp_pair(stage="evidence", request_id=rid, local_fp=policy_fp or None, engine_fp=engine_fp)
+    return _respond(doc, alias_followed=alias_followed, engine_fp=engine_fp)
@@ -1,4 +1,5 @@
-import os, json, fnmatch
+import os, json, fnmatch, re
+from dataclasses import dataclass
 from pathlib import Path
 from core_utils.fingerprints import canonical_json, sha256_hex, ensure_sha256_prefix, normalize_fingerprint
 import orjson
@@ -56,6 +57,8 @@ def _load_roles_config() -> dict:
             data = {"roles": {}}
         _ROLES_CACHE = data
         _ROLES_MTIME = mtime
+        # Compiled field masks derive from roles.json → drop them on reload only.
+        _MASK_CACHE.clear()
         log_stage(logger, "policy", "roles_config_loaded", path=str(path))
         return _ROLES_CACHE
     except (ValueError, OSError) as e:
@@ -368,42 +371,97 @@ def acl_check(node: Dict[str, Any], policy: Dict[str, Any]) -> Tuple[bool, Optio
         return False, "acl:domain_out_of_scope"
     return True, None
 
-def field_mask(node: Dict[str, Any], policy: Dict[str, Any]) -> Dict[str, Any]:
+# ──────────────────────────────────────────────────────────────────────────────
+# Field masking (compiled once per policy fingerprint + node type)
+# ──────────────────────────────────────────────────────────────────────────────
+_INTERNAL_KEYS = frozenset({"_key", "_id", "_rev"})
+# Reserved fields must never leak into the wire anchor/items
+# NOTE: snapshot_etag is required in the wire meta → do NOT reserve/mask it.
+_RESERVED_KEYS = frozenset({"meta"})
+_SUMMARY_SKIP_KEYS = frozenset({"_key", "_id", "_rev", "id", "type", "domain", "edge", "meta", "x-extra"})
+_MASK_CACHE_MAX = 1024
+
+
+@dataclass(frozen=True)
+class CompiledMask:
+    """Matcher for one (policy_fp, node type, visible_fields) triple."""
+    include_all: bool
+    exact: frozenset
+    pattern: Optional["re.Pattern[str]"]
+    show_x_extra: bool
+    rule_id: str
+
+    def visible(self, key: str) -> bool:
+        if self.include_all or key in self.exact:
+            return True
+        return bool(self.pattern is not None and self.pattern.match(key))
+
+
+_MASK_CACHE: Dict[tuple, CompiledMask] = {}
+
+
+def _compile_mask(node_type_lc: str, visible: Tuple[str, ...]) -> CompiledMask:
+    exact: set = set()
+    globs: List[str] = []
+    for pat in visible:
+        if pat in ("x-extra", "*"):
+            continue
+        # Normalize patterns to top-level keys; keep entire subtree when pattern is "foo.*".
+        top = pat.split(".", 1)[0] if "." in pat else pat
+        if any(ch in top for ch in "*?["):
+            globs.append(fnmatch.translate(top))
+        else:
+            exact.add(top)
+    return CompiledMask(
+        include_all=("*" in visible),
+        exact=frozenset(exact),
+        pattern=re.compile("|".join(f"(?:{g})" for g in globs)) if globs else None,
+        show_x_extra=("x-extra" in visible),
+        # Generic rule identifier based on visible_fields; avoid special cases for rationale.
+        rule_id=f"{node_type_lc}.visible_fields={','.join(sorted(set(visible))) or '<empty>'}",
+    )
+
+
+def compiled_mask_for(policy: Dict[str, Any], node_type_lc: str) -> CompiledMask:
     """
-    Apply role-based field visibility generically:
-    - Iterate role_profile.field_visibility[<type>].visible_fields with support for:
-        • "*" (all top-level fields, excluding internals and x-extra),
-        • glob patterns (e.g., "decision_maker*", "title*"),
-        • dot-path prefixes (e.g., "decision_maker.*" → include the whole top-level object).
-    - Special-case only `x-extra` using the role's `extra_visible` list (dot-path aware).
-    - Respect optional rationale_visible rule for Decisions.
-    No hardcoded field lists → new schema fields appear automatically.
+    Return the compiled mask for *node_type_lc* under *policy*.
+    Keyed by policy_fp plus the effective visible_fields (OPA explain may
+    override the roles.json seed for the same fingerprint); cleared when
+    roles.json is reloaded.
     """
+    role_profile = (policy or {}).get("role_profile") or {}
+    fv = (role_profile.get("field_visibility") or {}).get(node_type_lc or "", {}) or {}
+    visible = tuple(str(v) for v in (fv.get("visible_fields") or []))
+    key = (str((policy or {}).get("policy_fp") or ""), node_type_lc, visible)
+    compiled = _MASK_CACHE.get(key)
+    if compiled is None:
+        compiled = _compile_mask(node_type_lc, visible)
+        if len(_MASK_CACHE) >= _MASK_CACHE_MAX:
+            _MASK_CACHE.clear()
+        _MASK_CACHE[key] = compiled
+    return compiled
+
+
+def _flatten_keys(d: Any, prefix: str = "") -> List[str]:
+    items: List[str] = []
+    for k, v in (d or {}).items():
+        p = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            items.extend(_flatten_keys(v, p))
+        else:
+            items.append(p)
+    return items
+
+
+def _mask_node(node: Dict[str, Any], policy: Dict[str, Any], *, summarize: bool) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    """Single pass over *node*: masked copy plus (optionally) the removed-field list."""
     node = node or {}
     # Avoid inferring a type when missing; use the raw type string only.
     node_type_raw = node.get("type") or ""
-    # Reserved fields must never leak into the wire anchor/items
-    # NOTE: snapshot_etag is required in the wire meta → do NOT reserve/mask it.
-    _reserved = {"meta"}
     node_type_lc = node_type_raw.lower()
-    node_type_uc = node_type_raw.upper()
-    role_profile = policy.get("role_profile") or {}
-    # Merge strategy: OPA explain (if handlers injected it) takes precedence over roles.json seed.
-    fv = (role_profile.get("field_visibility") or {}).get(node_type_lc or "", {})
-    visible = list(fv.get("visible_fields") or [])
-    include_all = any(v == "*" for v in visible)
-    # Normalize patterns to top-level keys (dot-path → its first segment).
-    top_level_pats = []
-    for pat in visible:
-        if pat == "x-extra":
-            continue
-        # Keep entire subtree when pattern is "foo.*"
-        if "." in pat:
-            top_level_pats.append(pat.split(".", 1)[0])
-        else:
-            top_level_pats.append(pat)
+    mask = compiled_mask_for(policy, node_type_lc)
+    request_id = (policy or {}).get("request_id")
 
-    # Start with id only; include type only if it exists on the node.
     # Prefer a valid wire anchor if present; otherwise map storage keys to wire form.
     _raw_id = node.get("id")
     _key = node.get("_key")
@@ -412,121 +470,122 @@ def field_mask(node: Dict[str, Any], policy: Dict[str, Any]) -> Dict[str, Any]:
         _wire_id = _raw_id
     elif isinstance(_key, str) and _key:
         _wire_id = storage_key_to_anchor(_key)
-        if _raw_id and _raw_id != _wire_id:
-            try:
-                log_stage(logger, "policy", "id_normalized",
-                          before=_raw_id, after=_wire_id, request_id=(policy or {}).get("request_id"))
-            except (RuntimeError, ValueError, TypeError):
-                pass
     elif isinstance(_raw_id, str) and _raw_id:
         # Fall back: accept storage-style id and convert to wire form deterministically.
         _wire_id = storage_key_to_anchor(_raw_id)
-        if _raw_id != _wire_id:
-            try:
-                log_stage(logger, "policy", "id_normalized",
-                          before=_raw_id, after=_wire_id, request_id=(policy or {}).get("request_id"))
-            except (RuntimeError, ValueError, TypeError):
-                pass
     out: Dict[str, Any] = {"id": _wire_id}
-    if node_type_uc:
-        out["type"] = node_type_uc
+    if node_type_raw:
+        out["type"] = node_type_raw.upper()
     # Wire contract minimums: never allow policy to strip required fields.
     # Anchors/events require 'domain' on the wire in v3 (§baseline).
     if node.get("domain") is not None:
         out["domain"] = node.get("domain")
+
+    removed: List[Dict[str, str]] = []
+    reserved_seen: List[str] = []
+    for k, v in node.items():
+        if k in _INTERNAL_KEYS or k in ("id", "type", "x-extra"):
+            continue
+        if k in _RESERVED_KEYS:
+            reserved_seen.append(k)
+            continue
+        if v is not None and mask.visible(k):
+            out[k] = v
+        elif summarize and k not in _SUMMARY_SKIP_KEYS:
+            # A field was removed because it was not visible under the policy.
+            removed.append({"field": k, "reason_code": "policy:field_denied", "rule_id": mask.rule_id})
+
+    # x-extra is governed by extra_visible (dot-path aware); filter once for output + summary.
+    orig_xe = node.get("x-extra")
+    if isinstance(orig_xe, dict) and (mask.show_x_extra or summarize):
         try:
-            log_stage(logger, "policy", "required_field_forced",
-                      field="domain", request_id=(policy or {}).get("request_id"))
-        except (RuntimeError, ValueError, TypeError):
-            pass
-    # x-extra is governed by extra_visible; handle it first and separately.
-    if "x-extra" in visible:
-        try:
-            filtered = _filter_x_extra(node.get("x-extra"), (policy or {}).get("extra_visible") or [])
-            if filtered:
-                out["x-extra"] = filtered
+            filtered = _filter_x_extra(orig_xe, (policy or {}).get("extra_visible") or [])
         except (TypeError, ValueError):
+            filtered = None
+        if mask.show_x_extra and filtered:
+            out["x-extra"] = filtered
+        if summarize:
+            kept = set(_flatten_keys(filtered or {}))
+            for k in sorted(set(_flatten_keys(orig_xe)) - kept):
+                removed.append({"field": f"x-extra.{k}", "reason_code": "policy:field_denied"})
+
+    for k in reserved_seen:
+        # Emit once per process to help catch schema regressions without noisy logs
+        try:
+            log_once(logger, key=f"masked_reserved:{k}",
+                     stage="policy", event="mask.reserved_field", field=k)
+        except (RuntimeError, ValueError, TypeError):
             pass
+    # One aggregated audit record per node (no values, no per-field lines).
+    try:
+        log_stage(
+            logger, "policy", "mask.applied",
+            node_id=_wire_id, node_type=node_type_raw.upper() or None,
+            kept=len(out), removed=(len(removed) if summarize else None),
+            id_normalized=bool(_raw_id and _wire_id and _raw_id != _wire_id),
+            domain_forced=("domain" in out),
+            request_id=request_id,
+        )
+    except (RuntimeError, ValueError, TypeError):
+        pass
+    return out, removed
 
-    # Copy allowed top-level fields according to patterns.
-    for k, v in (node or {}).items():
-        if k in {"_key", "_id", "_rev"}:
-            continue
-        if k in {"id", "type"}:
-            continue
-        # Hard stop on reserved/leaky fields regardless of role policy
-        if k in _reserved:
-            # Emit once per request to help catch schema regressions without noisy logs
-            try:
-                log_once(
-                    logger, key=f"masked_reserved:{k}",
-                    stage="policy", event="mask.reserved_field", field=k
-                )
-            except (RuntimeError, ValueError, TypeError):
-                pass
-            continue
-        if k == "x-extra":
-            continue  # handled above
-        # When include_all is set, include all fields except internal keys and x-extra
-        if include_all:
-            if v is not None:
-                out[k] = v
-            continue
-        # Match against the normalized top-level patterns
-        if any(fnmatch.fnmatch(k, pat) for pat in top_level_pats):
-            if v is not None:
-                out[k] = v
-    return out
+
+def field_mask(node: Dict[str, Any], policy: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply role-based field visibility generically:
+    - Iterate role_profile.field_visibility[<type>].visible_fields with support for:
+        • "*" (all top-level fields, excluding internals and x-extra),
+        • glob patterns (e.g., "decision_maker*", "title*"),
+        • dot-path prefixes (e.g., "decision_maker.*" → include the whole top-level object).
+    - Special-case only `x-extra` using the role's `extra_visible` list (dot-path aware).
+    - Respect optional rationale_visible rule for Decisions.
+    No hardcoded field lists → new schema fields appear automatically.
+    Patterns are compiled once per policy fingerprint (see ``compiled_mask_for``).
+    """
+    masked, _ = _mask_node(node, policy, summarize=False)
+    return masked
 
 def field_mask_with_summary(node: Dict[str, Any], policy: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    Apply field_mask and compute a mask_summary (counts + reasons).
+    Apply field_mask and compute a mask_summary (counts + reasons) in the same pass.
     Reasons:
       - policy:field_denied (field not included by visible_fields allow-list or rationale_visible=false)
     NOTE: No sensitive values are included in the summary.
     """
-    original = dict(node or {})
-    masked = field_mask(node, policy) or {}
-    removed_items: List[Dict[str,str]] = []
-    node_type = (original.get("type") or "").lower()
-    role_profile = policy.get("role_profile") or {}
-    fv = (role_profile.get("field_visibility") or {}).get(node_type or "", {})
-    visible = set(fv.get("visible_fields") or [])
-    for k in list(original.keys()):
-        if k in {"_key","_id","_rev","id","type","domain","edge","meta","x-extra"}:
-            continue
-        if k not in masked:
-            # A field was removed because it was not visible under the policy.
-            reason_code = "policy:field_denied"
-            # Generic rule identifier based on visible_fields; avoid special cases for rationale.
-            rule_id = f"{node_type}.visible_fields={','.join(sorted(visible)) or '<empty>'}"
-            removed_items.append({"field": k, "reason_code": reason_code, "rule_id": rule_id})
-    # x-extra summary of denied fields
-    try:
-        orig_xe = original.get("x-extra")
-        if isinstance(orig_xe, dict):
-            allow = (policy or {}).get("extra_visible") or []
-            allowed_xe = _filter_x_extra(orig_xe, allow) or {}
-            # Flatten keys for comparison
-            def _flatten(d, prefix=""):
-                items = []
-                for k, v in (d or {}).items():
-                    p = f"{prefix}.{k}" if prefix else k
-                    if isinstance(v, dict):
-                        items.extend(_flatten(v, p))
-                    else:
-                        items.append(p)
-                return items
-            orig_keys = set(_flatten(orig_xe))
-            kept_keys = set(_flatten(allowed_xe))
-            for k in sorted(orig_keys - kept_keys):
-                removed_items.append({"field": f"x-extra.{k}", "reason_code": "policy:field_denied"})
-    except (RuntimeError, ValueError, TypeError):
-        pass
+    masked, removed_items = _mask_node(node, policy, summarize=True)
     summary = {"total_removed": len(removed_items), "items": removed_items}
     return masked, summary
 
 
+def hydrate_nodes(store, node_ids) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch raw node documents for ``node_ids`` as ``{storage_key: doc}``.
+    Uses the store's single-round-trip ``get_nodes_bulk`` when available and
+    falls back to per-id ``get_node`` for stores that only expose the latter
+    (e.g. test stubs). Missing/failed ids are absent from the result.
+    """
+    ids = sorted({i for i in (node_ids or []) if isinstance(i, str) and i})
+    if not ids or store is None:
+        return {}
+    bulk = getattr(store, "get_nodes_bulk", None)
+    if callable(bulk):
+        try:
+            return dict(bulk(ids) or {})
+        except (RuntimeError, OSError, ValueError, TypeError):
+            return {}
+    out: Dict[str, Dict[str, Any]] = {}
+    if not hasattr(store, "get_node"):
+        return out
+    for nid in ids:
+        try:
+            doc = store.get_node(nid)
+        except (RuntimeError, OSError, ValueError, TypeError):
+            doc = None
+        if isinstance(doc, dict):
+            out[nid] = doc
+    return out
+
 def filter_and_mask_neighbors(
     neighbors: List[Dict[str, Any]],
     store,
@@ -537,25 +596,29 @@ def filter_and_mask_neighbors(
     and reshape to the v3 graph view: neighbors = { events: [], edges: [] }.
     - Memory MUST NOT emit `rel` (orientation). Only emit {type, from, to, timestamp, domain?} for edges.
     - Only EVENT documents are returned in neighbors.events; DECISIONs come via edges + allowed_ids.
+    Neighbor documents are hydrated in one bulk read up front (no per-neighbor round trips).
     """
     events: List[Dict[str, Any]] = []
     edges: List[Dict[str, Any]] = []
     withheld: Dict[str, str] = {}
     used_edge_types: set[str] = set()
     seen_edges: set[tuple] = set()
+    allowlist = policy.get("edge_allowlist") or []
+    docs = hydrate_nodes(
+        store,
+        [(n or {}).get("id") for n in (neighbors or [])
+         if _edge_allowed((((n or {}).get("edge") or {}).get("type") or "").upper(), allowlist)],
+    )
 
     for n in neighbors or []:
         nid = (n or {}).get("id")
         edge = (n or {}).get("edge") or {}
         etype = (edge.get("type") or "").upper()
-        if not _edge_allowed(etype, policy.get("edge_allowlist") or []):
+        if not _edge_allowed(etype, allowlist):
             if nid:
                 withheld[nid] = "edge_type_blocked"
             continue
-        try:
-            doc = store.get_node(nid) if hasattr(store, "get_node") else None  # type: ignore[attr-defined]
-        except (RuntimeError, OSError, ValueError, TypeError):
-            doc = None
+        doc = docs.get(nid) if isinstance(nid, str) else None
         if not doc:
             if nid:
                 withheld[nid] = "acl:missing_document"